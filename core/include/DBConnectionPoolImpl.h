@@ -44,19 +44,23 @@ public:
         }
     }
     void run(const string& script, int identity, int priority=4, int parallelism=64, int  /*fetchSize*/=0, bool clearMemory = false){
-        queue_->push(Task(script, identity, priority, parallelism, clearMemory));
         taskStatus_.setResult(identity, TaskStatusMgmt::Result());
+        queue_->push(Task(script, identity, priority, parallelism, clearMemory));
     }
 
     void run(const string& functionName, const std::vector<ConstantSP>& args, int identity, int priority=4, int parallelism=64, int  /*fetchSize*/=0, bool clearMemory = false){
-        queue_->push(Task(functionName, args, identity, priority, parallelism, clearMemory));
         taskStatus_.setResult(identity, TaskStatusMgmt::Result());
+        queue_->push(Task(functionName, args, identity, priority, parallelism, clearMemory));
     }
 
     bool isFinished(int identity){
         return taskStatus_.isFinished(identity);
     }
 
+    void waitFinished(int identity){
+        taskStatus_.waitFinished(identity);
+    }
+
     ConstantSP getData(int identity){
         return taskStatus_.getData(identity);
     }
@@ -81,11 +85,11 @@ public:
         int  /*fetchSize*/ = 0, bool clearMemory = false,
         bool pickleTableToList = false, bool disableDecimal = false
     ){
+        taskStatus_.setResult(identity, TaskStatusMgmt::Result());
         queue_->push(Task(
             script, identity, priority, parallelism,
             clearMemory, true, pickleTableToList, disableDecimal
         ));
-        taskStatus_.setResult(identity, TaskStatusMgmt::Result());
     }
 
     void runPy(
@@ -94,17 +98,21 @@ public:
         int  /*fetchSize*/ = 0, bool clearMemory = false,
         bool pickleTableToList = false, bool disableDecimal = false
     ){
+        taskStatus_.setResult(identity, TaskStatusMgmt::Result());
         queue_->push(Task(
             functionName, args, identity, priority, parallelism,
             clearMemory, true, pickleTableToList, disableDecimal
         ));
-        taskStatus_.setResult(identity, TaskStatusMgmt::Result());
     }
 
     py::object getPyData(int identity){
         return taskStatus_.getPyData(identity);
     }
 
+    void setCallback(int identity, const py::object& callback){
+        taskStatus_.setCallback(identity, callback);
+    }
+
     std::vector<string> getSessionId(){
         for(int i = 0; i < connections_.size(); i++)
         {
@@ -73,6 +73,18 @@ using converter::TableChecker;
 using converter::CHILD_VECTOR_OPTION;
 
 
+struct PipelineRequest {
+	string script;
+	vector<ConstantSP> args;
+	// "script", "function" or "variable"
+	string scriptType = "script";
+	int priority = 4;
+	int parallelism = 64;
+	bool clearMemory = false;
+	bool pickleTableToList = false;
+	bool disableDecimal = false;
+};
+
 class EXPORT_DECL DBConnection {
 public:
 	DBConnection(bool enableSSL = false, bool asyncTask = false, int keepAliveTime = 7200, bool compress = false, PARSER_TYPE parser = PARSER_TYPE::PARSER_DOLPHINDB, bool isReverseStreaming = false, int sqlStd = 0);
@@ -143,11 +155,20 @@ public:
 	py::object runPy(
 		const string& script, int priority=4, int parallelism=64,
 		int fetchSize=0, bool clearMemory=false,
-		bool pickleTableToList=false, bool disableDecimal=false, bool withTableSchema = false);
+		bool pickleTableToList=false, bool disableDecimal=false, bool withTableSchema = false,
+		bool symbolAsCategory = false);
 	py::object runPy(
 		const string& funcName, vector<ConstantSP>& args, int priority=4, int parallelism=64,
 		int fetchSize=0, bool clearMemory=false,
-		bool pickleTableToList=false, bool disableDecimal=false, bool withTableSchema = false);
+		bool pickleTableToList=false, bool disableDecimal=false, bool withTableSchema = false,
+		bool symbolAsCategory = false);
+
+	/**
+	 * Send the requests back to back without waiting for the responses, keeping at most maxInFlight
+	 * requests outstanding, and match the responses in order. Each element of the returned list is a
+	 * tuple (True, result) or (False, error message). Pipelined requests are not retried on failover.
+	 */
+	py::list runPipelinePy(vector<PipelineRequest>& requests, int maxInFlight = 64);
 	void setKeepAliveTime(int keepAliveTime);
 	void setTimeout(int readTimeout, int writeTimeout);
 	const string getSessionId() const;
@@ -265,6 +286,8 @@ public:
 		int fetchSize=0, bool clearMemory = false,
 		bool pickleTableToList=false, bool disableDecimal=false);
 	py::object getPyData(int identity);
+	// callback is called with the GIL held once the task finishes or fails.
+	void setCallback(int identity, const py::object& callback);
 	vector<string> getSessionId();
 private:
 	// SmartPointer<DBConnectionPoolImpl> pool_;
@@ -280,6 +303,12 @@ public:
 	PartitionedTableAppender(string dbUrl, string tableName, string partitionColName, string appendFunction, DBConnectionPool& pool);
 	virtual ~PartitionedTableAppender();
 	int append(TableSP table);
+	// Submit the sub-tables of table without waiting, pass the returned tasks to getResult.
+	vector<int> appendAsync(TableSP table);
+	// Wait for the tasks returned by appendAsync and return the number of affected rows.
+	int getResult(const vector<int>& tasks);
+	// callback is called with the GIL held once all the tasks have finished or failed.
+	void setCallback(const vector<int>& tasks, const py::object& callback);
 	vector<Type> getColTypes();
 	vector<string> getColNames();
 
@@ -302,6 +331,7 @@ private:
 	vector<string> columnNames_;
 	int identity_ = -1;
     vector<vector<int>> chunkIndices_;
+	Mutex mutex_;
 };
 
 
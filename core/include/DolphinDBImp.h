@@ -9,6 +9,8 @@ namespace py = pybind11;
 
 namespace dolphindb {
 
+struct PipelineRequest;
+
 class EXPORT_DECL DdbInit {
 public:
     DdbInit() {
@@ -56,11 +58,14 @@ public:
     py::object runPy(
         const string& script, int priority = 4, int parallelism = 64,
         int fetchSize = 0, bool clearMemory = false,
-        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false);
+        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false,
+        bool symbolAsCategory = false);
     py::object runPy(
         const string& funcName, vector<ConstantSP>& args, int priority = 4, int parallelism = 64,
         int fetchSize = 0, bool clearMemory = false,
-        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false);
+        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false,
+        bool symbolAsCategory = false);
+    py::list runPipelinePy(vector<PipelineRequest>& requests, int maxInFlight);
     void setkeepAliveTime(int keepAliveTime){
         if (keepAliveTime > 0)
             keepAliveTime_ = keepAliveTime;
@@ -82,7 +87,14 @@ private:
     py::object runPy(
         const string& script, const string& scriptType, vector<ConstantSP>& args,
         int priority = 4, int parallelism = 64, int fetchSize = 0, bool clearMemory = false,
-        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false);
+        bool pickleTableToList = false, bool disableDecimal = false, bool withTableSchema = false,
+        bool symbolAsCategory = false);
+    void sendRequest(
+        const string& script, const string& scriptType, vector<ConstantSP>& args,
+        int priority, int parallelism, int fetchSize, bool clearMemory,
+        bool pickleTableToList, bool disableDecimal);
+    py::object readResponsePy(const DataInputStreamSP& in, const string& script, bool pickleTableToList, bool withTableSchema,
+                              bool symbolAsCategory = false);
     bool connect();
     void login();
 
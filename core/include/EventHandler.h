@@ -99,9 +99,11 @@ public:
         const std::vector<std::string>& eventTimeFields = std::vector<std::string>(),
         const std::vector<std::string>& commonFields = std::vector<std::string>());
     void sendEvent(const std::string& eventType, const std::vector<ConstantSP>& attributes);
+    void sendEvents(const std::vector<std::string>& eventTypes, const std::vector<std::vector<ConstantSP>>& attributes);
 
 private:
     std::string             insertScript_;
+    TableSP                 outputTable_;
     EventHandler            eventHandler_;
     DBConnection&           conn_;
 };
@@ -95,6 +95,11 @@ public:
     void getStatus(Status &status);
     void getUnwrittenData(std::vector<std::vector<ConstantSP>*> &unwrittenData);
 	bool insertUnwrittenData(std::vector<std::vector<ConstantSP>*> &records, ErrorCodeInfo &errorInfo) { return insert(records.data(), static_cast<int>(records.size()), errorInfo); }
+    /**
+     * Insert a whole table at once. The rows are routed to the writer threads column-wise
+     * and each thread sends its part as a single chunk, bypassing the per-row queue.
+     */
+    bool insertTable(const TableSP &table, ErrorCodeInfo &errorInfo);
 
 	bool isExit(){ return hasError_; }
     const DATA_TYPE* getColType(){ return colTypes_.data(); }
@@ -111,6 +116,8 @@ private:
 		return dataType;
 	}
 	void insertThreadWrite(int threadhashkey, std::vector<ConstantSP> *prow);
+	void insertThreadWrite(int threadhashkey, const TableSP &table);
+	void tableToRows(const TableSP &table, std::vector<std::vector<ConstantSP>*> &rows);
 
     struct WriterThread {
 		WriterThread() : nonemptySignal(false,true){}
@@ -118,6 +125,9 @@ private:
 
         SynchronizedQueue<std::vector<ConstantSP>*> writeQueue;
         SynchronizedQueue<std::vector<ConstantSP>*> failedQueue;
+        SynchronizedQueue<TableSP> tableQueue;
+        Mutex tableMutex;
+        long tableRows;
         ThreadSP writeThread;
         Signal nonemptySignal;
 
@@ -136,6 +146,7 @@ private:
 		bool isExit() { return tableWriter_.hasError_.load() || writeThread_.exit; }
         bool init();
         bool writeAllData();
+        bool writeTableData();
         MultithreadedTableWriter &tableWriter_;
         WriterThread &writeThread_;
     };
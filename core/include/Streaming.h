@@ -24,7 +24,11 @@ public:
 	}
 	Message(const ConstantSP &sp, const string &symbol) : ConstantSP(sp), symbol_(symbol) {
 	}
-	Message(const Message &msg) : ConstantSP(msg), symbol_(msg.symbol_) {
+	Message(const ConstantSP &sp, long long offset) : ConstantSP(sp), offset_(offset) {
+	}
+	Message(const ConstantSP &sp, const string &symbol, long long offset) : ConstantSP(sp), symbol_(symbol), offset_(offset) {
+	}
+	Message(const Message &msg) : ConstantSP(msg), symbol_(msg.symbol_), offset_(msg.offset_) {
 	}
 	~Message() {
 		clear();
@@ -32,11 +36,16 @@ public:
 	Message& operator =(const Message& msg) {
 		ConstantSP::operator=(msg);
 		symbol_ = msg.symbol_;
+		offset_ = msg.offset_;
 		return *this;
 	}
 	const string& getSymbol() const { return symbol_; }
+	// offset of the (last) row of this message in the stream table, -1 if unknown
+	long long getOffset() const { return offset_; }
+	void setOffset(long long offset) { offset_ = offset; }
 private:
 	string symbol_;
+	long long offset_ = -1;
 };
 
 
@@ -48,10 +57,12 @@ public:
 	int size();
 	void setExitFlag();
 	bool getExitFlag();
-	void push(const std::vector<string>& colLabels, const ConstantSP &colItems);
-	bool pop(ConstantSP &item, int milliSeconds);
+	void push(const std::vector<string>& colLabels, const ConstantSP &colItems, long long offset = -1);
+	// offset, if given, receives the offset of the last row of the popped table
+	bool pop(ConstantSP &item, int milliSeconds, long long *offset = nullptr);
 private:
 	bool exitflag_;
+	long long offset_ = -1;
 	size_t capacity_;
 	size_t batchSize_;
 	size_t size_;
@@ -73,10 +84,80 @@ using MessageTableQueueSP = SmartPointer<MessageTableQueue>;
 using MessageHandler = std::function<void(Message)>;
 using MessageBatchHandler = std::function<void(vector<Message>)>;
 using EventMessageHandler = std::function<void(const std::string&, std::vector<ConstantSP>&)>;
+using EventMessageBatchHandler = std::function<void(std::vector<std::string>&, std::vector<std::vector<ConstantSP>>&)>;
 
 #define DEFAULT_ACTION_NAME "cppStreamingAPI"
 constexpr int DEFAULT_QUEUE_CAPACITY = 65536;
 
+// Point-in-time metrics of a subscription, see StreamingClient::getStat.
+struct EXPORT_DECL StreamingStat {
+	long long queueDepth = 0;           // messages received but not handled yet
+	long long lastOffset = -1;          // offset of the last message received
+	long long messages = 0;             // rows received
+	long long bytes = 0;                // bytes received
+	long long messagesPerSecond = 0;    // rows received during the last full second
+	long long bytesPerSecond = 0;       // bytes received during the last full second
+	long long reconnects = 0;           // successful resubscriptions after a disconnection
+	long long lastSentTime = -1;        // server time (epoch ms) at which the last message was sent
+	long long lastReceiveTime = -1;     // local time (epoch ms) at which the last message was received
+	long long handlerCalls = 0;
+	// handler time percentiles (ms) over the most recent calls
+	double handlerP50 = 0;
+	double handlerP90 = 0;
+	double handlerP99 = 0;
+	double handlerMax = 0;
+};
+
+// Collects the metrics of a subscription. It is shared by all copies of the SubscribeInfo,
+// so it survives resubscription to a new topic.
+class EXPORT_DECL SubscriptionStats {
+public:
+	SubscriptionStats() : handlerTimes_(HANDLER_SAMPLES) {}
+	void onReceived(long long offset, long long rows, long long bytes, long long sentTime);
+	void onHandled(long long nanoSeconds);
+	void onReconnected();
+	StreamingStat snapshot();
+private:
+	void roll(long long second);
+	static constexpr size_t HANDLER_SAMPLES = 1024;
+	Mutex mutex_;
+	StreamingStat stat_;
+	long long second_ = 0;
+	long long secondMessages_ = 0;
+	long long secondBytes_ = 0;
+	long long lastSecondMessages_ = 0;
+	long long lastSecondBytes_ = 0;
+	vector<long long> handlerTimes_;     // ring buffer of the recent handler times in ns
+};
+typedef SmartPointer<SubscriptionStats> SubscriptionStatsSP;
+
+// Client-side projection and row predicate of a subscription, applied in the parsing thread
+// before the messages are queued, see StreamingClient::setClientFilter.
+class EXPORT_DECL ClientFilter {
+public:
+	struct Condition {
+		string column;
+		string op;          // ==, !=, <, <=, >, >=, in, not in
+		ConstantSP value;   // a scalar, or a vector for in and not in
+	};
+	// columns is the projection, empty to keep all columns. A row is kept if it meets all conditions.
+	ClientFilter(const vector<string> &columns, const vector<Condition> &conditions);
+	// Resolves the column names against the schema of the stream table, throws if one doesn't exist.
+	SmartPointer<ClientFilter> bind(const vector<string> &colNames) const;
+	// names of the projected columns, valid once bound
+	const vector<string>& getColumns() const { return columns_; }
+	// Applies the filter to a message (a tuple of columns). rows receives the positions of the kept
+	// rows in the message. Returns nullptr if no row is kept.
+	ConstantSP apply(const ConstantSP &obj, vector<INDEX> &rows) const;
+private:
+	static bool match(const ConstantSP &col, INDEX row, const Condition &cond);
+	vector<string> columns_;
+	vector<Condition> conditions_;
+	vector<int> columnIndices_;
+	vector<int> conditionIndices_;
+};
+typedef SmartPointer<ClientFilter> ClientFilterSP;
+
 class StreamingClientImpl;
 class EXPORT_DECL StreamDeserializer {
 public:
@@ -87,12 +168,16 @@ public:
 	StreamDeserializer(const std::unordered_map<string, vector<DATA_TYPE>> &symbol2col);
 	virtual ~StreamDeserializer() = default;
 	bool parseBlob(const ConstantSP &src, vector<VectorSP> &rows, vector<string> &symbols, ErrorCodeInfo &errorInfo);
+	// Groups rows decoded by parseBlob into one table per symbol, in the order the symbols first appear.
+	// The columns are named after the schema, or col0, col1, ... if the deserializer was built from types only.
+	bool groupBySymbol(const vector<Message> &rows, vector<pair<string, TableSP>> &tables, ErrorCodeInfo &errorInfo);
 private:
 	void create(DBConnection &conn);
 	void parseSchema(const std::unordered_map<string, DictionarySP> &sym2schema);
 	std::unordered_map<string, std::pair<string, string>> sym2tableName_;
 	std::unordered_map<string, vector<DATA_TYPE>> symbol2col_;
     std::unordered_map<string, vector<int>> symbol2scale_;
+	std::unordered_map<string, vector<string>> symbol2names_;
 	Mutex mutex_;
 	friend class StreamingClientImpl;
 };
@@ -120,7 +205,8 @@ struct EXPORT_DECL SubscribeInfo {
 			isEvent_(false),
 			resubTimeout(100),
 			subOnce(false),
-			lastSiteIndex(-1) {}
+			lastSiteIndex(-1),
+			stats(nullptr) {}
     explicit SubscribeInfo(const string &id, const string &host, int port, const string &tableName,
                            const string &actionName, long long offset, bool resub, const VectorSP &filter,
                            bool msgAsTable, bool allowExists, int batchSize, const string &userName,
@@ -133,7 +219,7 @@ struct EXPORT_DECL SubscribeInfo {
           tqueue(istqueue ? new MessageTableQueue(std::max(DEFAULT_QUEUE_CAPACITY, batchSize), batchSize) : nullptr),
           istqueue(istqueue), userName(std::move(userName)), password(std::move(password)),
           streamDeserializer(blobDeserializer), currentSiteIndex(-1), isEvent_(isEvent), resubTimeout(resubTimeout),
-          subOnce(subOnce), lastSiteIndex(-1) {}
+          subOnce(subOnce), lastSiteIndex(-1), stats(new SubscriptionStats()) {}
 
     string ID;
 	string host;
@@ -161,6 +247,8 @@ struct EXPORT_DECL SubscribeInfo {
 	int resubTimeout;
 	bool subOnce;
 	int lastSiteIndex;
+	SubscriptionStatsSP stats;
+	ClientFilterSP clientFilter;
 	void setExitFlag() {
 		if (istqueue) {
 			tqueue->setExitFlag();
@@ -211,6 +299,12 @@ public:
     virtual ~StreamingClient();
 	bool isExit();
 	void exit();
+	// Fills stat with the metrics of the subscription, returns false if it doesn't exist.
+	bool getStat(const string &host, int port, const string &tableName, const string &actionName, StreamingStat &stat);
+	// Sets the client-side filter of the next subscription to the topic, call it before subscribe.
+	// A null filter removes the pending one.
+	void setClientFilter(const string &host, int port, const string &tableName, const string &actionName,
+	                     const ClientFilterSP &filter);
 
 protected:
     SubscribeInfo subscribeInternal(string host, int port, string tableName, string actionName = DEFAULT_ACTION_NAME,
@@ -231,9 +325,13 @@ public:
     EventClient(const std::vector<EventSchema>& eventSchema, const std::vector<std::string>& eventTimeFields, const std::vector<std::string>& commonFields);
     ThreadSP subscribe(const string& host, int port, const EventMessageHandler &handler, const string& tableName, const string& actionName = DEFAULT_ACTION_NAME, int64_t offset = -1,
         bool resub = true, const string& userName="", const string& password="");
+    ThreadSP subscribe(const string& host, int port, const EventMessageBatchHandler &handler, const string& tableName, const string& actionName = DEFAULT_ACTION_NAME, int64_t offset = -1,
+        bool resub = true, const string& userName="", const string& password="", int batchSize = 1, double throttle = 1);
     void unsubscribe(const string& host, int port, const string& tableName, const string& actionName = DEFAULT_ACTION_NAME);
 
 private:
+    void checkOutputTable(const string& host, int port, const string& tableName, const string& userName, const string& password);
+
     EventHandler      eventHandler_;
 };
 
@@ -275,6 +373,17 @@ public:
 							   const StreamDeserializerSP &blobDeserializer = nullptr,
 							   const std::vector<std::string> &backupSites = std::vector<std::string>(),
 							   int resubTimeout = 100, bool subOnce = false);
+	// Deliver messages in batches of up to batchSize. If keyColumn is given, the messages are
+	// sharded by the hash of that column, so rows with the same key are handled by the same thread
+	// in the order they arrive; rows decoded by a StreamDeserializer are sharded by their symbol.
+    vector<ThreadSP> subscribe(string host, int port, const MessageBatchHandler &handler, string tableName,
+                               string actionName = DEFAULT_ACTION_NAME, int64_t offset = -1, bool resub = true,
+                               const VectorSP &filter = nullptr, bool allowExists = false, int batchSize = 1,
+                               double throttle = 1, bool msgAsTable = false,
+                               string userName = "", string password = "",
+                               const StreamDeserializerSP &blobDeserializer = nullptr,
+                               const std::vector<std::string> &backupSites = std::vector<std::string>(),
+                               int resubTimeout = 100, bool subOnce = false, const string &keyColumn = "");
     void unsubscribe(string host, int port, string tableName, string actionName = DEFAULT_ACTION_NAME);
 	size_t getQueueDepth(const ThreadSP &thread);
 
@@ -197,6 +197,10 @@ public:
 	 */
 	long long getPosition() const;
 
+	/**
+	 * Total number of bytes read from the underlying socket, including the bytes still buffered.
+	 */
+	long long getBytesReceived() const { return bytesReceived_;}
 
 	std::size_t getDataSizeInArray() const { return size_;}
 	bool isIntegerReversed() const {return reverseOrder_;}
@@ -240,6 +244,7 @@ protected:
 	size_t size_;
 	size_t cursor_;
 	DataQueueSP dataQueue_;
+	long long bytesReceived_ = 0;
 };
 
 class EXPORT_DECL DataOutputStream {
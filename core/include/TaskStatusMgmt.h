@@ -20,12 +20,20 @@ public:
     };
 
     bool isFinished(int identity);
+    // Block until the task leaves the WAITING stage, throw if it failed.
+    void waitFinished(int identity);
     ConstantSP getData(int identity);
     py::object getPyData(int identity);
     void setResult(int identity, Result);
+    // callback is invoked once (with the GIL held) when the task leaves the WAITING stage.
+    void setCallback(int identity, const py::object& callback);
+private:
+    static void invokeCallback(py::object& callback);
 private:
     Mutex mutex_;
+    ConditionalVariable finished_;
     std::unordered_map<int, Result> results;
+    std::unordered_map<int, py::object> callbacks;
 };
 
 }
\ No newline at end of file
@@ -83,6 +83,7 @@ public:
     py::object pd_NA_;                      // pd.NA
     py::object pd_dataframe_;               // pd.DataFrame
     py::object pd_series_;                  // pd.Series
+    py::object pd_categorical_;             // pd.Categorical
     py::object pd_index_;                   // pd.Index
     py::object pd_timestamp_;               // pd.Timestamp
     py::object pd_extension_dtype_;         // pd.core.dtypes.dtypes.ExtensionDtype
@@ -177,9 +178,10 @@ public:
 struct EXPORT_DECL ToPythonOption {
 public:
     bool        table2List_;    // if object is table, false: convert to pandas, true: convert to list[numpy]
+    bool        symbolAsCategory_;  // if object is table converted to pandas, true: convert SYMBOL columns to pandas.Categorical
 public:
-    ToPythonOption(): table2List_(false) {}
-    ToPythonOption(bool table2List): table2List_(table2List) {}
+    ToPythonOption(): table2List_(false), symbolAsCategory_(false) {}
+    ToPythonOption(bool table2List): table2List_(table2List), symbolAsCategory_(false) {}
 };
 
 
@@ -236,6 +238,7 @@ public:
 
     static py::object toPandas_Vector(const ConstantSP &data, const ToPythonOption &option = ToPythonOption());
     static py::object toPandas_Table(const ConstantSP &data, const ToPythonOption &option = ToPythonOption());
+    static py::object toPandas_Categorical(const ConstantSP &data);
 
     static py::object toPython_Old(const ConstantSP &data, const ToPythonOption &option = ToPythonOption());
 
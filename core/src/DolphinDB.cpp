@@ -465,12 +465,13 @@ std::string extractRefId(const std::string& errorMsg) {
 
 py::object DBConnection::runPy(
     const string &script, int priority, int parallelism,
-    int fetchSize, bool clearMemory, bool pickleTableToList, bool disableDecimal, bool withTableSchema
+    int fetchSize, bool clearMemory, bool pickleTableToList, bool disableDecimal, bool withTableSchema,
+    bool symbolAsCategory
 ) {
     if (nodes_.empty() == false) {
         while (closed_ == false) {
             try {
-                return conn_->runPy(script, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema);
+                return conn_->runPy(script, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory);
             } catch (TagResponse &e) {
                 py::gil_scoped_release release;
                 if (extractRefId(e.what()) == "S04009") {
@@ -506,7 +507,7 @@ py::object DBConnection::runPy(
         }
         return py::none();
     } else {
-        return conn_->runPy(script, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema);
+        return conn_->runPy(script, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory);
     }
 }
 
@@ -545,12 +546,13 @@ ConstantSP DBConnection::run(const string& funcName, vector<dolphindb::ConstantS
 
 py::object DBConnection::runPy(
     const string &funcName, vector<ConstantSP> &args, int priority, int parallelism,
-    int fetchSize, bool clearMemory, bool pickleTableToList, bool disableDecimal, bool withTableSchema
+    int fetchSize, bool clearMemory, bool pickleTableToList, bool disableDecimal, bool withTableSchema,
+    bool symbolAsCategory
 ) {
     if (nodes_.empty() == false) {
         while (closed_ == false) {
             try {
-                return conn_->runPy(funcName, args, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema);
+                return conn_->runPy(funcName, args, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory);
             } catch (TagResponse &e) {
                 py::gil_scoped_release release;
                 string host;
@@ -574,10 +576,14 @@ py::object DBConnection::runPy(
         }
         return py::none();
     } else {
-        return conn_->runPy(funcName, args, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema);
+        return conn_->runPy(funcName, args, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory);
     }
 }
 
+py::list DBConnection::runPipelinePy(vector<PipelineRequest> &requests, int maxInFlight) {
+    return conn_->runPipelinePy(requests, maxInFlight);
+}
+
 ConstantSP DBConnection::upload(const string& name, const ConstantSP& obj) {
     if (nodes_.empty() == false) {
 		while (closed_ == false) {
@@ -826,6 +832,10 @@ py::object DBConnectionPool::getPyData(int identity){
     return pool_->getPyData(identity);
 }
 
+void DBConnectionPool::setCallback(int identity, const py::object& callback){
+    pool_->setCallback(identity, callback);
+}
+
 void DBConnectionPool::shutDown(){
     pool_->shutDown();
 }
@@ -884,10 +894,7 @@ void PartitionedTableAppender::init(string dbUrl, string tableName, string parti
         }
 
         pool_->run(task,identity_);
-
-        while(!pool_->isFinished(identity_)){
-            Util::sleep(10);
-        }
+        pool_->waitFinished(identity_);
 
         tableInfo_ = pool_->getData(identity_);
         identity_ --;
@@ -953,6 +960,10 @@ void PartitionedTableAppender::init(string dbUrl, string tableName, string parti
 }
 
 int PartitionedTableAppender::append(TableSP table){
+    return getResult(appendAsync(table));
+}
+
+vector<int> PartitionedTableAppender::appendAsync(TableSP table){
     if(cols_ != table->columns())
         throw RuntimeException("The input table doesn't match the schema of the target table.");
     for(int i=0; i<cols_; ++i){
@@ -964,6 +975,7 @@ int PartitionedTableAppender::append(TableSP table){
 		// }
     }
 
+    LockGuard<Mutex> guard(&mutex_);
     for(int i=0; i<threadCount_; ++i)
         chunkIndices_[i].clear();
     vector<int> keys = domain_->getPartitionKeys(table->getColumn(partitionColumnIdx_));
@@ -986,10 +998,21 @@ int PartitionedTableAppender::append(TableSP table){
         pool_->run(appendScript_, args, identity_--);
 
     }
+    return tasks;
+}
+
+int PartitionedTableAppender::getResult(const vector<int>& tasks){
     int affected = 0;
+    string errMsg;
+    // collect every task even if one of them failed, so that no result is left behind in the pool
     for(auto& task : tasks){
-        while(!pool_->isFinished(task)){
-            Util::sleep(100);
+        try{
+            pool_->waitFinished(task);
+        }
+        catch(RuntimeException& ex){
+            if(errMsg.empty())
+                errMsg = ex.what();
+            continue;
         }
         ConstantSP res = pool_->getData(task);
         if(res->isNull()){
@@ -999,9 +1022,27 @@ int PartitionedTableAppender::append(TableSP table){
             affected += res->getInt();
         }
     }
+    if(!errMsg.empty())
+        throw RuntimeException(errMsg);
     return affected;
 }
 
+void PartitionedTableAppender::setCallback(const vector<int>& tasks, const py::object& callback){
+    if(tasks.empty()){
+        callback();
+        return;
+    }
+    std::shared_ptr<size_t> remaining = std::make_shared<size_t>(tasks.size());
+    // the wrapper is only called with the GIL held, which also guards the counter
+    py::cpp_function onTaskFinished([remaining, callback](){
+        if(--(*remaining) == 0)
+            callback();
+    });
+    for(auto& task : tasks){
+        pool_->setCallback(task, onTaskFinished);
+    }
+}
+
 vector<Type> PartitionedTableAppender::getColTypes() {
     return columnTypes_;
 }
@@ -202,23 +202,23 @@ ConstantSP DBConnectionImpl::run(const string& funcName, vector<ConstantSP>& arg
 py::object DBConnectionImpl::runPy(
     const string &script, int priority,
     int parallelism, int fetchSize, bool clearMemory,
-    bool pickleTableToList, bool disableDecimal, bool withTableSchema
+    bool pickleTableToList, bool disableDecimal, bool withTableSchema, bool symbolAsCategory
 ) {
     vector<ConstantSP> args;
     return runPy(
         script, "script", args, priority, parallelism,
-        fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema
+        fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory
     );
 }
 
 py::object DBConnectionImpl::runPy(
     const string &funcName, vector<ConstantSP> &args, int priority,
     int parallelism, int fetchSize, bool clearMemory,
-    bool pickleTableToList, bool disableDecimal, bool withTableSchema
+    bool pickleTableToList, bool disableDecimal, bool withTableSchema, bool symbolAsCategory
 ) {
     return runPy(
         funcName, "function", args, priority, parallelism,
-        fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema
+        fetchSize, clearMemory, pickleTableToList, disableDecimal, withTableSchema, symbolAsCategory
     );
 }
 
@@ -459,15 +459,33 @@ py::dict getTableSchema(ConstantSP result)
 py::object DBConnectionImpl::runPy(
     const string &script, const string &scriptType, vector<ConstantSP> &args,
     int priority, int parallelism, int fetchSize, bool clearMemory,
-    bool pickleTableToList, bool disableDecimal, bool withTableSchema
+    bool pickleTableToList, bool disableDecimal, bool withTableSchema, bool symbolAsCategory
 ) {
     //RecordTime record("Db.runPy"+script);
     DLOG("runPy",script,"start argsize",args.size());
     //force Python release GIL
     if (!isConnected_)
         throw IOException("Couldn't send script/function to the remote host because the connection has been closed");
+    if (symbolAsCategory && (protocol_ != PROTOCOL_DDB || pickleTableToList))
+        throw RuntimeException("symbolAsCategory requires PROTOCOL_DDB and pickleTableToList=False.");
     py::gil_scoped_release gil;
 
+    LockGuard<Mutex> runGuard(&mutex_);
+    sendRequest(script, scriptType, args, priority, parallelism, fetchSize, clearMemory, pickleTableToList, disableDecimal);
+    if(asynTask_){
+        return py::none();
+    }
+    DataInputStreamSP in = new DataInputStream(conn_);
+    if (littleEndian_ != (char)Util::isLittleEndian())
+        in->enableReverseIntegerByteOrder();
+    return readResponsePy(in, script, pickleTableToList, withTableSchema, symbolAsCategory);
+}
+
+void DBConnectionImpl::sendRequest(
+    const string &script, const string &scriptType, vector<ConstantSP> &args,
+    int priority, int parallelism, int fetchSize, bool clearMemory,
+    bool pickleTableToList, bool disableDecimal
+) {
     //RecordTime record("Db.server");
     string body;
     int argCount = args.size();
@@ -492,8 +510,6 @@ py::object DBConnectionImpl::runPy(
     out.append(1, '\n');
     out.append(body);
 
-    LockGuard<Mutex> runGuard(&mutex_);
-
     IO_ERR ret;
     if (argCount > 0) {
         for (int i = 0; i < argCount; ++i) {
@@ -530,13 +546,12 @@ py::object DBConnectionImpl::runPy(
             throw IOException("Couldn't send script/function to the remote host because the connection has been closed");
         }
     }
-    if(asynTask_){
-        return py::none();
-    }
-    DataInputStreamSP in = new DataInputStream(conn_);
-    if (littleEndian_ != (char)Util::isLittleEndian())
-        in->enableReverseIntegerByteOrder();
+}
 
+py::object DBConnectionImpl::readResponsePy(
+    const DataInputStreamSP &in, const string &script, bool pickleTableToList, bool withTableSchema, bool symbolAsCategory
+) {
+    IO_ERR ret;
     string line;
     if ((ret = in->readLine(line)) != OK) {
         close();
@@ -661,6 +676,7 @@ py::object DBConnectionImpl::runPy(
     py::gil_scoped_acquire pgil;
 
     converter::ToPythonOption option(pickleTableToList);
+    option.symbolAsCategory_ = symbolAsCategory;
 
     if (withTableSchema) {
         py::object dataframe = converter::Converter::toPython_Old(result, option);
@@ -673,4 +689,60 @@ py::object DBConnectionImpl::runPy(
     return converter::Converter::toPython_Old(result, option);
 }
 
-}
\ No newline at end of file
+py::list DBConnectionImpl::runPipelinePy(vector<PipelineRequest> &requests, int maxInFlight) {
+    if (!isConnected_)
+        throw IOException("Couldn't send script/function to the remote host because the connection has been closed");
+    if (asynTask_)
+        throw RuntimeException("Pipelined requests are not supported in asynchronous mode.");
+    if (maxInFlight <= 0)
+        throw RuntimeException("maxInFlight must be greater than 0.");
+    size_t count = requests.size();
+    vector<py::object> results(count);
+    vector<string> errors(count);
+    {
+        py::gil_scoped_release gil;
+        LockGuard<Mutex> runGuard(&mutex_);
+        // a single stream is shared by all responses so that bytes of a later response
+        // already buffered while reading an earlier one are not lost
+        DataInputStreamSP in = new DataInputStream(conn_);
+        if (littleEndian_ != (char)Util::isLittleEndian())
+            in->enableReverseIntegerByteOrder();
+        size_t sent = 0;
+        size_t received = 0;
+        try {
+            while (received < count) {
+                while (sent < count && sent - received < static_cast<size_t>(maxInFlight)) {
+                    PipelineRequest &request = requests[sent];
+                    sendRequest(request.script, request.scriptType, request.args,
+                                request.priority, request.parallelism, 0, request.clearMemory,
+                                request.pickleTableToList, request.disableDecimal);
+                    ++sent;
+                }
+                PipelineRequest &request = requests[received];
+                try {
+                    results[received] = readResponsePy(in, request.script, request.pickleTableToList, false);
+                }
+                catch (ServerResponse &ex) {
+                    // the server rejected this request only, the following responses are still valid
+                    errors[received] = ex.what();
+                }
+                ++received;
+            }
+        }
+        catch (std::exception &ex) {
+            close();
+            for (size_t i = received; i < count; ++i)
+                errors[i] = ex.what();
+        }
+    }
+    py::list ret;
+    for (size_t i = 0; i < count; ++i) {
+        if (errors[i].empty())
+            ret.append(py::make_tuple(true, results[i]));
+        else
+            ret.append(py::make_tuple(false, py::str(errors[i])));
+    }
+    return ret;
+}
+
+}
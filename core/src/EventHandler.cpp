@@ -407,8 +407,8 @@ EventSender::EventSender(DBConnection &conn, const std::string& tableName, const
     }
     std::string sql = "select top 0 * from " + tableName;
     std::string errMsg;
-    ConstantSP outputTable = conn_.run(sql);
-    if(!eventHandler_.checkOutputTable(outputTable, errMsg)){
+    outputTable_ = conn_.run(sql);
+    if(!eventHandler_.checkOutputTable(outputTable_, errMsg)){
         throw RuntimeException(errMsg);
     }
     insertScript_ = "tableInsert{" + tableName + "}";
@@ -423,4 +423,46 @@ void EventSender::sendEvent(const std::string& eventType, const std::vector<Cons
     conn_.run(insertScript_, args);
 }
 
+void EventSender::sendEvents(const std::vector<std::string>& eventTypes, const std::vector<std::vector<ConstantSP>>& attributes){
+    if(eventTypes.size() != attributes.size()){
+        throw RuntimeException("The number of event types does not match the number of events.");
+    }
+    if(eventTypes.empty()){
+        return;
+    }
+    //serialize the events row by row into the columns of the output table, then insert them at once
+    int colNums = outputTable_->columns();
+    std::vector<std::string> colNames(colNums);
+    std::vector<ConstantSP> columns(colNums);
+    for(int i = 0; i < colNums; ++i){
+        colNames[i] = outputTable_->getColumnName(i);
+        VectorSP column = outputTable_->getColumn(i);
+        columns[i] = column->getInstance(0);
+    }
+    std::vector<ConstantSP> row;
+    std::string errMsg;
+    for(size_t i = 0; i < eventTypes.size(); ++i){
+        row.clear();
+        if(!eventHandler_.serializeEvent(eventTypes[i], attributes[i], row, errMsg)){
+            throw RuntimeException("Failed to serialize, with error " + errMsg);
+        }
+        ConstantSP values = row[0];
+        for(int j = 0; j < colNums; ++j){
+            ConstantSP value = values->get(j);
+            DATA_TYPE colType = columns[j]->getType();
+            //tableInsert converts temporal values to the column type, but append takes the raw units
+            if(value->getType() != colType && Util::getCategory(colType) == TEMPORAL
+                && Util::getCategory(value->getType()) == TEMPORAL){
+                value = value->castTemporal(colType);
+            }
+            if(!((Vector*)columns[j].get())->append(value)){
+                throw RuntimeException("Failed to append the event " + eventTypes[i] + " to the column " + colNames[j] + ".");
+            }
+        }
+    }
+    TableSP table = Util::createTable(colNames, columns);
+    std::vector<ConstantSP> args{table};
+    conn_.run(insertScript_, args);
+}
+
 }
\ No newline at end of file
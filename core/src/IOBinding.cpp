@@ -204,6 +204,45 @@ py::object loads(const py::bytes &str) {
 
 
 
+py::object try_loads(const py::buffer &data, size_t offset, bool tableToList) {
+    py::buffer_info info = data.request();
+    size_t length = static_cast<size_t>(info.size * info.itemsize);
+    if (offset > length) {
+        throw dolphindb::RuntimeException("The offset exceeds the size of the data.");
+    }
+    DataInputStreamSP in = new DataInputStream(static_cast<const char*>(info.ptr) + offset, length - offset, false);
+    ConstantUnmarshallFactory factory(in);
+    short flag;
+    IO_ERR ret = in->readShort(flag);
+    if (ret == IO_ERR::END_OF_STREAM) {
+        return py::none();
+    }
+    if (ret != IO_ERR::OK) {
+        throw dolphindb::RuntimeException("Failed to deserialize data.");
+    }
+    DATA_FORM form = static_cast<DATA_FORM>(flag>>8);
+    ConstantUnmarshall* unmarshal = factory.getConstantUnmarshall(form);
+    if (unmarshal == NULL) {
+        throw dolphindb::RuntimeException("Failed to deserialize data.");
+    }
+    unmarshal->start(flag, true, ret);
+    if (ret == IO_ERR::END_OF_STREAM) {
+        // the object is incomplete, wait for more data
+        unmarshal->reset();
+        return py::none();
+    }
+    if (ret != IO_ERR::OK) {
+        unmarshal->reset();
+        throw dolphindb::RuntimeException("Failed to deserialize data.");
+    }
+    ConstantSP res = unmarshal->getConstant();
+    unmarshal->reset();
+    size_t consumed = offset + static_cast<size_t>(in->getPosition());
+    converter::ToPythonOption option(tableToList);
+    return py::make_tuple(converter::Converter::toPython_Old(res, option), consumed);
+}
+
+
 namespace pybind_dolphindb {
 
 
@@ -221,6 +260,12 @@ void Init_Module_IO(py::module &m) {
             py::arg("types") = py::none()
     );
     m.def("loads", &loads, py::arg("data"));
+    m.def("try_loads", &try_loads,
+            py::arg("data"),
+            py::arg("offset") = 0,
+            py::kw_only(),
+            py::arg("table_to_list") = false
+    );
 }
 
 } // namespace pybind_dolphindb
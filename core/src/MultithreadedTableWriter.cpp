@@ -229,6 +229,7 @@ MultithreadedTableWriter::MultithreadedTableWriter(
         writerThread.threadId = 0;
         writerThread.sentRows = 0;
         writerThread.sendingRows = 0;
+        writerThread.tableRows = 0;
         writerThread.exit = false;
         writerThread.idleSem.release();
 
@@ -249,6 +250,7 @@ MultithreadedTableWriter::~MultithreadedTableWriter() {
     {
         std::vector<ConstantSP>* pitem = nullptr;
         for (auto& thread : threads_) {
+            thread.tableQueue.clear();
             while (thread.writeQueue.pop(pitem)) {
                 delete pitem;
             }
@@ -354,6 +356,55 @@ bool MultithreadedTableWriter::insert(std::vector<ConstantSP>** records, int rec
     return true;
 }
 
+bool MultithreadedTableWriter::insertTable(const TableSP& table, ErrorCodeInfo& errorInfo) {
+    if (hasError_.load()) {
+        errorInfo.set(ErrorCodeInfo::EC_DestroyedObject, "Thread is exiting.");
+        return false;
+    }
+    if (table->columns() != static_cast<INDEX>(colTypes_.size())) {
+        errorInfo.set(ErrorCodeInfo::EC_InvalidParameter, "Column counts don't match " + std::to_string(table->columns()));
+        return false;
+    }
+    INDEX rows = table->rows();
+    if (rows < 1) {
+        return true;
+    }
+    if (threads_.size() < 2) {
+        insertThreadWrite(0, table);
+        return true;
+    }
+    int threadCount = static_cast<int>(threads_.size());
+    std::vector<int> threadindexes;
+    if (isPartionedTable_) {
+        threadindexes = partitionDomain_->getPartitionKeys(table->getColumn(partitionColumnIdx_));
+    }
+    else {
+        ConstantSP col = table->getColumn(threadByColIndexForNonPartion_);
+        threadindexes.resize(rows);
+        if (!col->getHash(0, rows, threadCount, threadindexes.data())) {
+            for (INDEX i = 0; i < rows; i++) {
+                threadindexes[i] = col->get(i)->getHash(threadCount);
+            }
+        }
+    }
+    std::vector<std::vector<int>> rowsByThread(threadCount);
+    for (INDEX i = 0; i < rows; i++) {
+        int threadhashkey = threadindexes[i] < 0 ? 0 : threadindexes[i];
+        rowsByThread[threadhashkey % threadCount].push_back(static_cast<int>(i));
+    }
+    for (int i = 0; i < threadCount; i++) {
+        if (rowsByThread[i].empty())
+            continue;
+        if (static_cast<INDEX>(rowsByThread[i].size()) == rows) {
+            insertThreadWrite(i, table);
+        }
+        else {
+            insertThreadWrite(i, TableSP(table->getSubTable(rowsByThread[i])));
+        }
+    }
+    return true;
+}
+
 void MultithreadedTableWriter::getStatus(Status& status) {
     status.isExiting = hasError_.load();
     status.errorCode = errorInfo_.errorCode;
@@ -367,7 +418,10 @@ void MultithreadedTableWriter::getStatus(Status& status) {
         idleLock.acquire();
         threadStatus.threadId = writeThread.threadId;
         threadStatus.sentRows = writeThread.sentRows;
-        threadStatus.unsentRows = static_cast<long>(writeThread.writeQueue.size() + writeThread.sendingRows);
+        {
+            LockGuard<Mutex> tableLock(&writeThread.tableMutex);
+            threadStatus.unsentRows = static_cast<long>(writeThread.writeQueue.size() + writeThread.sendingRows + writeThread.tableRows);
+        }
         threadStatus.sendFailedRows = static_cast<long>(writeThread.failedQueue.size());
         status.plus(threadStatus);
     }
@@ -378,10 +432,30 @@ void MultithreadedTableWriter::getUnwrittenData(std::vector<std::vector<Constant
         SemLock idleLock(writeThread.idleSem);
         idleLock.acquire();
         writeThread.failedQueue.pop(unwrittenData, writeThread.failedQueue.size());
+        TableSP table;
+        while (writeThread.tableQueue.pop(table)) {
+            tableToRows(table, unwrittenData);
+        }
+        {
+            LockGuard<Mutex> tableLock(&writeThread.tableMutex);
+            writeThread.tableRows = 0;
+        }
         writeThread.writeQueue.pop(unwrittenData, writeThread.writeQueue.size());
     }
 }
 
+void MultithreadedTableWriter::tableToRows(const TableSP& table, std::vector<std::vector<ConstantSP>*>& rows) {
+    INDEX rowCount = table->rows();
+    INDEX colCount = table->columns();
+    for (INDEX i = 0; i < rowCount; i++) {
+        std::vector<ConstantSP>* prow = new std::vector<ConstantSP>(colCount);
+        for (INDEX col = 0; col < colCount; col++) {
+            prow->at(col) = table->getColumn(col)->get(i);
+        }
+        rows.push_back(prow);
+    }
+}
+
 void MultithreadedTableWriter::insertThreadWrite(int threadhashkey, std::vector<ConstantSP>* prow) {
     if (threadhashkey < 0) {
         threadhashkey = 0;
@@ -392,6 +466,20 @@ void MultithreadedTableWriter::insertThreadWrite(int threadhashkey, std::vector<
     writerThread.nonemptySignal.set();
 }
 
+void MultithreadedTableWriter::insertThreadWrite(int threadhashkey, const TableSP& table) {
+    if (threadhashkey < 0) {
+        threadhashkey = 0;
+    }
+    int threadIndex = threadhashkey % threads_.size();
+    WriterThread& writerThread = threads_[threadIndex];
+    {
+        LockGuard<Mutex> tableLock(&writerThread.tableMutex);
+        writerThread.tableRows += static_cast<long>(table->rows());
+    }
+    writerThread.tableQueue.push(table);
+    writerThread.nonemptySignal.set();
+}
+
 void MultithreadedTableWriter::SendExecutor::run() {
     if(init()==false){
         return;
@@ -399,7 +487,7 @@ void MultithreadedTableWriter::SendExecutor::run() {
     long long batchWaitTimeout = 0, diff;
     while(isExit() == false){
         {
-            if(writeThread_.writeQueue.size() < 1){//Wait for first data
+            if(writeThread_.writeQueue.size() < 1 && writeThread_.tableQueue.size() < 1){//Wait for first data
                 writeThread_.nonemptySignal.wait();
             }
             if (isExit())
@@ -407,7 +495,7 @@ void MultithreadedTableWriter::SendExecutor::run() {
             //wait for batchsize
             if (tableWriter_.batchSize_ > 1 && tableWriter_.throttleMilsecond_ > 0) {
                 batchWaitTimeout = Util::getEpochTime() + tableWriter_.throttleMilsecond_;
-                while (isExit() == false && writeThread_.writeQueue.size() < static_cast<std::size_t>(tableWriter_.batchSize_)) {//check batchsize
+                while (isExit() == false && writeThread_.tableQueue.size() < 1 && writeThread_.writeQueue.size() < static_cast<std::size_t>(tableWriter_.batchSize_)) {//check batchsize
                     diff = batchWaitTimeout - Util::getEpochTime();
                     if (diff > 0) {
                         writeThread_.nonemptySignal.tryWait(static_cast<int>(diff));
@@ -418,10 +506,63 @@ void MultithreadedTableWriter::SendExecutor::run() {
                 }
             }
         }
-        while (isExit() == false && writeAllData());//write all data
+        while (isExit() == false && (writeTableData() || writeAllData()));//write all data
     }
     //write left data
-    while (tableWriter_.hasError_.load() == false && writeAllData()){}
+    while (tableWriter_.hasError_.load() == false && (writeTableData() || writeAllData())){}
+}
+
+bool MultithreadedTableWriter::SendExecutor::writeTableData(){
+    SemLock idleLock(writeThread_.idleSem);
+    idleLock.acquire();
+    TableSP table;
+    if (!writeThread_.tableQueue.pop(table)) {
+        return false;
+    }
+    long addRowCount = static_cast<long>(table->rows());
+    {
+        LockGuard<Mutex> tableLock(&writeThread_.tableMutex);
+        writeThread_.tableRows -= addRowCount;
+    }
+    writeThread_.sendingRows = addRowCount;
+    string runscript;
+    try{
+        table->setColumnCompressMethods(tableWriter_.compressMethods_);
+        std::vector<ConstantSP> args(1);
+        args[0] = table;
+        runscript = tableWriter_.scriptTableInsert_;
+        ConstantSP constsp = writeThread_.conn->run(runscript, args);
+        runscript.clear();
+        if (constsp->getType() == DT_INT && constsp->getForm() == DF_SCALAR) {
+            int addresult = constsp->getInt();
+            if (addresult != addRowCount) {
+                LOG_INFO("Rows changed:", addresult, "/", addRowCount);
+            }
+        }
+        else {
+            LOG_INFO("None row changed of", addRowCount);
+        }
+        if (tableWriter_.scriptSaveTable_.empty() == false) {
+            runscript = tableWriter_.scriptSaveTable_;
+            writeThread_.conn->run(runscript);
+            runscript.clear();
+        }
+        writeThread_.sentRows += addRowCount;
+        writeThread_.sendingRows = 0;
+    }catch (std::exception &e){
+        string errmsg=e.what();
+        if(runscript.empty()==false && errmsg.find(" script:")==string::npos){
+            errmsg+=" script: "+runscript;
+        }
+        LOG_ERR("threadid", writeThread_.threadId, "Failed to save the inserted data: ", errmsg);
+        tableWriter_.setError(ErrorCodeInfo::EC_Server,std::string("Failed to save the inserted data: ")+errmsg);
+        std::vector<std::vector<ConstantSP>*> rows;
+        tableWriter_.tableToRows(table, rows);
+        for (auto &unwriteItem : rows)
+            writeThread_.failedQueue.push(unwriteItem);
+        writeThread_.sendingRows = 0;
+    }
+    return true;
 }
 
 bool MultithreadedTableWriter::SendExecutor::writeAllData(){
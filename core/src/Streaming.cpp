@@ -8,6 +8,7 @@
 #include "ScalarImp.h"
 #include "Logger.h"
 #include "DolphinDB.h"
+#include <algorithm>
 #include <list>
 #include <map>
 #ifndef WINDOWS
@@ -257,6 +258,184 @@ bool mergeTable(const Message &dest, const vector<Message> &src) {
 	return true;
 }
 
+void SubscriptionStats::roll(long long second) {
+	if (second == second_)
+		return;
+	if (second == second_ + 1) {
+		lastSecondMessages_ = secondMessages_;
+		lastSecondBytes_ = secondBytes_;
+	}
+	else {
+		lastSecondMessages_ = 0;
+		lastSecondBytes_ = 0;
+	}
+	second_ = second;
+	secondMessages_ = 0;
+	secondBytes_ = 0;
+}
+
+void SubscriptionStats::onReceived(long long offset, long long rows, long long bytes, long long sentTime) {
+	long long now = Util::getEpochTime();
+	LockGuard<Mutex> guard(&mutex_);
+	roll(now / 1000);
+	secondMessages_ += rows;
+	secondBytes_ += bytes;
+	stat_.messages += rows;
+	stat_.bytes += bytes;
+	stat_.lastOffset = offset;
+	stat_.lastSentTime = sentTime;
+	stat_.lastReceiveTime = now;
+}
+
+void SubscriptionStats::onHandled(long long nanoSeconds) {
+	LockGuard<Mutex> guard(&mutex_);
+	handlerTimes_[stat_.handlerCalls % HANDLER_SAMPLES] = nanoSeconds;
+	++stat_.handlerCalls;
+}
+
+void SubscriptionStats::onReconnected() {
+	LockGuard<Mutex> guard(&mutex_);
+	++stat_.reconnects;
+}
+
+StreamingStat SubscriptionStats::snapshot() {
+	vector<long long> times;
+	StreamingStat stat;
+	{
+		LockGuard<Mutex> guard(&mutex_);
+		roll(Util::getEpochTime() / 1000);
+		stat = stat_;
+		stat.messagesPerSecond = lastSecondMessages_;
+		stat.bytesPerSecond = lastSecondBytes_;
+		size_t count = std::min<size_t>(stat_.handlerCalls, HANDLER_SAMPLES);
+		times.assign(handlerTimes_.begin(), handlerTimes_.begin() + count);
+	}
+	if (!times.empty()) {
+		std::sort(times.begin(), times.end());
+		auto percentile = [&](double p) {
+			return times[std::min(times.size() - 1, (size_t)(p * times.size()))] / 1e6;
+		};
+		stat.handlerP50 = percentile(0.5);
+		stat.handlerP90 = percentile(0.9);
+		stat.handlerP99 = percentile(0.99);
+		stat.handlerMax = times.back() / 1e6;
+	}
+	return stat;
+}
+
+// Wraps a handler so that the time spent in it is recorded in the subscription metrics.
+MessageHandler timedHandler(const MessageHandler &handler, const SubscriptionStatsSP &stats) {
+	if (stats.isNull())
+		return handler;
+	return [handler, stats](Message msg) {
+		long long start = Util::getNanoEpochTime();
+		handler(msg);
+		stats->onHandled(Util::getNanoEpochTime() - start);
+	};
+}
+
+MessageBatchHandler timedHandler(const MessageBatchHandler &handler, const SubscriptionStatsSP &stats) {
+	if (stats.isNull())
+		return handler;
+	return [handler, stats](vector<Message> msgs) {
+		long long start = Util::getNanoEpochTime();
+		handler(std::move(msgs));
+		stats->onHandled(Util::getNanoEpochTime() - start);
+	};
+}
+
+ClientFilter::ClientFilter(const vector<string> &columns, const vector<Condition> &conditions)
+	: columns_(columns), conditions_(conditions) {
+	for (auto &cond : conditions_) {
+		static const set<string> ops{"==", "!=", "<", "<=", ">", ">=", "in", "not in"};
+		if (ops.count(cond.op) == 0)
+			throw RuntimeException("Unsupported operator [" + cond.op + "] in the filter of column [" + cond.column + "].");
+		if ((cond.op == "in" || cond.op == "not in") != cond.value->isVector())
+			throw RuntimeException("The value of [" + cond.column + " " + cond.op + "] should be " +
+				(cond.value->isVector() ? "a scalar." : "a vector."));
+	}
+}
+
+ClientFilterSP ClientFilter::bind(const vector<string> &colNames) const {
+	auto indexOf = [&colNames](const string &name) {
+		auto it = std::find(colNames.begin(), colNames.end(), name);
+		if (it == colNames.end())
+			throw IllegalArgumentException("subscribe", "Column [" + name + "] doesn't exist in the subscribed table.");
+		return static_cast<int>(it - colNames.begin());
+	};
+	ClientFilterSP bound = new ClientFilter(*this);
+	bound->columnIndices_.clear();
+	bound->conditionIndices_.clear();
+	if (columns_.empty()) {
+		bound->columns_ = colNames;
+		for (int i = 0; i < static_cast<int>(colNames.size()); ++i)
+			bound->columnIndices_.push_back(i);
+	}
+	else {
+		for (auto &name : columns_)
+			bound->columnIndices_.push_back(indexOf(name));
+	}
+	for (auto &cond : conditions_)
+		bound->conditionIndices_.push_back(indexOf(cond.column));
+	return bound;
+}
+
+bool ClientFilter::match(const ConstantSP &col, INDEX row, const Condition &cond) {
+	if (col->isNull(row))
+		return false;
+	auto compare = [&](const ConstantSP &value) {
+		if (value->getCategory() == LITERAL) {
+			return col->getString(row).compare(value->getString());
+		}
+		if (col->getCategory() == FLOATING || col->getCategory() == DENARY || value->getCategory() == FLOATING) {
+			double x = col->getDouble(row), y = value->getDouble();
+			return x < y ? -1 : (x > y ? 1 : 0);
+		}
+		long long x = col->getLong(row), y = value->getLong();
+		return x < y ? -1 : (x > y ? 1 : 0);
+	};
+	const string &op = cond.op;
+	if (op == "in" || op == "not in") {
+		bool found = false;
+		for (INDEX i = 0; i < cond.value->size() && !found; ++i)
+			found = compare(cond.value->get(i)) == 0;
+		return found == (op == "in");
+	}
+	int cmp = compare(cond.value);
+	if (op == "==") return cmp == 0;
+	if (op == "!=") return cmp != 0;
+	if (op == "<") return cmp < 0;
+	if (op == "<=") return cmp <= 0;
+	if (op == ">") return cmp > 0;
+	return cmp >= 0;
+}
+
+ConstantSP ClientFilter::apply(const ConstantSP &obj, vector<INDEX> &rows) const {
+	INDEX rowSize = obj->get(0)->size();
+	rows.clear();
+	for (INDEX row = 0; row < rowSize; ++row) {
+		bool keep = true;
+		for (size_t i = 0; i < conditions_.size() && keep; ++i)
+			keep = match(obj->get(conditionIndices_[i]), row, conditions_[i]);
+		if (keep)
+			rows.push_back(row);
+	}
+	if (rows.empty())
+		return nullptr;
+	VectorSP index;
+	if (static_cast<INDEX>(rows.size()) != rowSize) {
+		index = Util::createVector(DT_INDEX, static_cast<INDEX>(rows.size()));
+		index->setIndex(0, static_cast<INDEX>(rows.size()), rows.data());
+	}
+	int colSize = static_cast<int>(columnIndices_.size());
+	VectorSP result = Util::createVector(DT_ANY, colSize);
+	for (int i = 0; i < colSize; ++i) {
+		ConstantSP col = obj->get(columnIndices_[i]);
+		result->set(i, index.isNull() ? col : col->get(index));
+	}
+	return result;
+}
+
 }  // namespace dolphindb
 
 namespace dolphindb {
@@ -369,6 +548,66 @@ bool StreamDeserializer::parseBlob(const ConstantSP &src, vector<VectorSP> &rows
 	}
 	return true;
 }
+bool StreamDeserializer::groupBySymbol(const vector<Message> &rows, vector<pair<string, TableSP>> &tables, ErrorCodeInfo &errorInfo) {
+	unordered_map<string, size_t> groupIndex;
+	vector<string> groupSymbols;
+	vector<vector<string>> groupNames;
+	vector<vector<ConstantSP>> groupCols;
+	for (auto &row : rows) {
+		const string &symbol = row.getSymbol();
+		auto iter = groupIndex.find(symbol);
+		if (iter == groupIndex.end()) {
+			vector<DATA_TYPE> types;
+			vector<int> scales;
+			vector<string> names;
+			{
+				LockGuard<Mutex> lock(&mutex_);
+				auto typeIter = symbol2col_.find(symbol);
+				if (typeIter == symbol2col_.end()) {
+					errorInfo.set(ErrorCodeInfo::EC_InvalidParameter, string("Unknown symbol ") + symbol);
+					return false;
+				}
+				types = typeIter->second;
+				auto scaleIter = symbol2scale_.find(symbol);
+				if (scaleIter != symbol2scale_.end()) {
+					scales = scaleIter->second;
+				}
+				auto nameIter = symbol2names_.find(symbol);
+				if (nameIter != symbol2names_.end()) {
+					names = nameIter->second;
+				}
+			}
+			if (names.empty()) {
+				for (size_t i = 0; i < types.size(); ++i) {
+					names.push_back("col" + std::to_string(i));
+				}
+			}
+			vector<ConstantSP> cols(types.size());
+			for (size_t i = 0; i < types.size(); ++i) {
+				int scale = scales.empty() ? 0 : scales[i];
+				if (types[i] < ARRAY_TYPE_BASE) {
+					cols[i] = Util::createVector(types[i], 0, 0, true, scale);
+				}
+				else {
+					cols[i] = Util::createArrayVector(types[i], 0, 0, true, scale);
+				}
+			}
+			iter = groupIndex.emplace(symbol, groupSymbols.size()).first;
+			groupSymbols.push_back(symbol);
+			groupNames.emplace_back(std::move(names));
+			groupCols.emplace_back(std::move(cols));
+		}
+		vector<ConstantSP> &cols = groupCols[iter->second];
+		for (size_t i = 0; i < cols.size(); ++i) {
+			((Vector*)cols[i].get())->append(row->get(i));
+		}
+	}
+	for (size_t i = 0; i < groupSymbols.size(); ++i) {
+		tables.emplace_back(groupSymbols[i], Util::createTable(groupNames[i], groupCols[i]));
+	}
+	return true;
+}
+
 void StreamDeserializer::parseSchema(const unordered_map<string, DictionarySP> &sym2schema) {
 
     LockGuard<Mutex> lock(&mutex_);
@@ -386,6 +625,13 @@ void StreamDeserializer::parseSchema(const unordered_map<string, DictionarySP> &
         }
         symbol2col_[one.first] = colTypes;
 
+        ConstantSP colDefsName = colDefs->getColumn("name");
+        vector<string> colNames(columnSize);
+        for (auto i = 0; i < (int)columnSize; i++) {
+            colNames[i] = colDefsName->getString(i);
+        }
+        symbol2names_[one.first] = colNames;
+
         // scales for decimals (server 130 doesn't have this column)
         if (colDefs->contain("extra")) {
             ConstantSP colDefsScales = colDefs->getColumn("extra");
@@ -550,6 +796,49 @@ public:
 		if (queue.isNull()) return tqueue->size();
 		else return queue->size();
 	}
+	void setClientFilter(const string &id, const ClientFilterSP &filter) {
+		pendingClientFilters_.op([&](unordered_map<string, ClientFilterSP> &mp) {
+			if (filter.isNull())
+				mp.erase(id);
+			else
+				mp[id] = filter;
+		});
+	}
+	ClientFilterSP takeClientFilter(const string &id) {
+		ClientFilterSP filter;
+		pendingClientFilters_.op([&](unordered_map<string, ClientFilterSP> &mp) {
+			auto it = mp.find(id);
+			if (it != mp.end()) {
+				filter = it->second;
+				mp.erase(it);
+			}
+		});
+		return filter;
+	}
+	bool getStat(const string &host, int port, const string &tableName, const string &actionName, StreamingStat &stat) {
+		// topics_ is rewritten by the reconnect thread without a lock, so look the ID up
+		// in topicSubInfos_ under its own lock
+		string id = host + std::to_string(port) + tableName + actionName;
+		SubscribeInfo info;
+		bool found = false;
+		topicSubInfos_.op([&](unordered_map<string, SubscribeInfo> &mp) {
+			for (auto &one : mp) {
+				if (one.second.ID == id) {
+					info = one.second;
+					found = true;
+					break;
+				}
+			}
+		});
+		if (!found || info.stats.isNull())
+			return false;
+		stat = info.stats->snapshot();
+		if (!info.queue.isNull())
+			stat.queueDepth = info.queue->size();
+		else if (!info.tqueue.isNull())
+			stat.queueDepth = info.tqueue->size();
+		return true;
+	}
 	void findMessageQueue(const ThreadSP &thread, MessageQueueSP &queue, MessageTableQueueSP &tqueue) {
 		topicSubInfos_.op([&](unordered_map<string, SubscribeInfo>& mp) {
 			for (auto &one : mp) {
@@ -703,6 +992,7 @@ private:
     Hashmap<string, int> actionCntOnTable_;
     Hashmap<string, set<string>> liveSubsOnSite_;  // living site -> topic
     Hashmap<string, pair<long long, long long>> topicReconn_;
+    Hashmap<string, ClientFilterSP> pendingClientFilters_;  // ID -> filter of the next subscription
 	BlockingQueue<ActivePublisherSP> publishers_;
     Mutex mtx_;
     std::queue<SubscribeInfo> initResub_;
@@ -817,6 +1107,9 @@ void StreamingClientImpl::reconnect() {
                                 delMeta(topic, false);
                                 insertMeta(info, newTopic);
                             }
+                            if (!info.stats.isNull()) {
+                                info.stats->onReconnected();
+                            }
                             break;
                         } catch (exception &e) {
                             string msg = e.what();
@@ -875,6 +1168,9 @@ void StreamingClientImpl::reconnect() {
 
                                 // set status flag
                                 isReconnected = true;
+                                if (!info.stats.isNull()) {
+                                    info.stats->onReconnected();
+                                }
                                 // update info data
                                 info.updateByReconnect(currentSiteIndex, topic);
                                 topicSubInfos_.upsert(newTopic, [&](SubscribeInfo &_info) { _info = info; }, info);
@@ -983,6 +1279,7 @@ void StreamingClientImpl::parseMessage(DataInputStreamSP in, ActivePublisherSP
     string topicMsg;
     vector<string> topics;
 	vector<string> symbols;
+	long long bytesReceived = in->getBytesReceived();
 
     while (isExit() == false) {
         if (ret != OK) {  // blocking mode, ret won't be NODATA
@@ -1057,6 +1354,8 @@ void StreamingClientImpl::parseMessage(DataInputStreamSP in, ActivePublisherSP
         if (ret != OK) continue;
 
         ConstantSP obj = unmarshall->getConstant();
+        long long msgBytes = in->getBytesReceived() - bytesReceived;
+        bytesReceived += msgBytes;
         if (obj->isTable()) {
             if (obj->rows() != 0) {
                 LOG_ERR("[ERROR] schema table shuold have zero rows, stopping this parse thread.");
@@ -1086,7 +1385,10 @@ void StreamingClientImpl::parseMessage(DataInputStreamSP in, ActivePublisherSP
                 obj = newObj;
             }
             vector<VectorSP> cache, rows;
+			vector<INDEX> filteredRows;
 			ErrorCodeInfo errorInfo;
+			// the header carries the offset of the last row of the message
+			long long firstOffset = offset - rowSize + 1;
 
             //wait for insertMeta() finish, or there is no topic in topicSubInfos_
             LockGuard<Mutex> lock(&readyMutex_);
@@ -1095,8 +1397,11 @@ void StreamingClientImpl::parseMessage(DataInputStreamSP in, ActivePublisherSP
                 SubscribeInfo info;
                 if (topicSubInfos_.find(t, info)) {
                     if (info.queue.isNull() && info.tqueue.isNull()) continue;
+                    if (!info.stats.isNull()) {
+                        info.stats->onReceived(offset, rowSize, msgBytes, sentTime);
+                    }
 					if (info.isEvent_) {
-						info.queue->push(Message(obj));
+						info.queue->push(Message(obj, offset));
 					}
 					else if (info.streamDeserializer.isNull()==false) {
 						if (rows.empty()) {
@@ -1106,45 +1411,64 @@ void StreamingClientImpl::parseMessage(DataInputStreamSP in, ActivePublisherSP
 							}
 						}
 						for (int rowIdx = 0; rowIdx < rowSize; ++rowIdx) {
-							info.queue->push(Message(rows[rowIdx], symbols[rowIdx]));
+							info.queue->push(Message(rows[rowIdx], symbols[rowIdx], firstOffset + rowIdx));
 						}
 					}
-					else if (info.istqueue) {
-						info.tqueue->push(info.attributes, obj);
-					}
-					else if (info.msgAsTable) {
-						if (info.attributes.empty()) {
-							LOG_ERR("table colName is empty, can not convert to table");
-							info.queue->push(Message(obj));
+					else {
+						// the client filter differs per topic, so its rows can't be shared through cache
+						ConstantSP data = obj;
+						vector<VectorSP> filteredCache;
+						vector<VectorSP> *rowCache = &cache;
+						bool filtered = !info.clientFilter.isNull();
+						if (filtered) {
+							data = info.clientFilter->apply(obj, filteredRows);
+							rowCache = &filteredCache;
 						}
-						else {
-							info.queue->push(Message(convertTupleToTable(info.attributes, obj)));
+						int dataRows = filtered ? static_cast<int>(filteredRows.size()) : rowSize;
+						auto rowOffset = [&](int rowIdx) {
+							return firstOffset + (filtered ? filteredRows[rowIdx] : rowIdx);
+						};
+						if (data.isNull()) {
+							// no row passed the client filter
 						}
-					}
-					else {
-						if (UNLIKELY(cache.empty())) { // split once
-							cache.resize(rowSize);
-							for (int rowIdx = 0; rowIdx < rowSize; ++rowIdx) {
-								VectorSP tmp = Util::createVector(DT_ANY, colSize, colSize);
-								for (int colIdx = 0; colIdx < colSize; ++colIdx) {
-									VectorSP tmpCol = obj->get(colIdx);
-									ConstantSP tmpElm;
-									if (tmpCol->getType()>=ARRAY_TYPE_BASE) {
-										tmpElm = tmpCol->get(rowIdx);
-										VectorSP tmpVElm = (VectorSP)tmpElm;
-										if (tmpVElm->getNullFlag()) {
-											tmpVElm->setNullFlag(tmpVElm->hasNull());
+						else if (info.istqueue) {
+							info.tqueue->push(info.attributes, data, rowOffset(dataRows - 1));
+						}
+						else if (info.msgAsTable) {
+							if (info.attributes.empty()) {
+								LOG_ERR("table colName is empty, can not convert to table");
+								info.queue->push(Message(data, rowOffset(dataRows - 1)));
+							}
+							else {
+								info.queue->push(Message(convertTupleToTable(info.attributes, data), rowOffset(dataRows - 1)));
+							}
+						}
+						else {
+							if (UNLIKELY(rowCache->empty())) { // split once
+								int dataCols = data->size();
+								rowCache->resize(dataRows);
+								for (int rowIdx = 0; rowIdx < dataRows; ++rowIdx) {
+									VectorSP tmp = Util::createVector(DT_ANY, dataCols, dataCols);
+									for (int colIdx = 0; colIdx < dataCols; ++colIdx) {
+										VectorSP tmpCol = data->get(colIdx);
+										ConstantSP tmpElm;
+										if (tmpCol->getType()>=ARRAY_TYPE_BASE) {
+											tmpElm = tmpCol->get(rowIdx);
+											VectorSP tmpVElm = (VectorSP)tmpElm;
+											if (tmpVElm->getNullFlag()) {
+												tmpVElm->setNullFlag(tmpVElm->hasNull());
+											}
+										} else {
+											tmpElm = tmpCol->get(rowIdx);
 										}
-									} else {
-										tmpElm = tmpCol->get(rowIdx);
+										tmp->set(colIdx, tmpElm);
 									}
-									tmp->set(colIdx, tmpElm);
+									(*rowCache)[rowIdx] = tmp;
 								}
-								cache[rowIdx] = tmp;
 							}
-						}
-						for (auto &one : cache) {
-							info.queue->push(Message(one));
+							for (int rowIdx = 0; rowIdx < dataRows; ++rowIdx) {
+								info.queue->push(Message((*rowCache)[rowIdx], rowOffset(rowIdx)));
+							}
 						}
 					}
 					topicSubInfos_.op([&](unordered_map<string, SubscribeInfo>& mp){
@@ -1211,6 +1535,10 @@ string StreamingClientImpl::subscribeInternal(DBConnection &conn, SubscribeInfo
 	colNames.reserve(colCount);
 	for (int i = 0; i < colCount; ++i) colNames.push_back(colLabels->getString(i));
 	info.attributes = colNames;
+	if (!info.clientFilter.isNull()) {
+		info.clientFilter = info.clientFilter->bind(colNames);
+		info.attributes = info.clientFilter->getColumns();
+	}
 
 	if (isListenMode() == false) {
 		std::shared_ptr<DBConnection> activeConn = std::make_shared<DBConnection>(false, false, 30, false, PARSER_TYPE::PARSER_DOLPHINDB, true);
@@ -1268,6 +1596,10 @@ SubscribeInfo StreamingClientImpl::subscribeInternal(const string &host, int por
     int attempt = 0;
     string _host = host;
     string _id = host + std::to_string(port) + tableName + actionName;
+    ClientFilterSP clientFilter = takeClientFilter(_id);
+    if (!clientFilter.isNull() && (!blobDeserializer.isNull() || isEvent)) {
+        throw RuntimeException("A client filter can't be used with a StreamDeserializer or an event subscription.");
+    }
     int _port = port;
     checkServerVersion(host, port, backupSites);
     init();
@@ -1275,6 +1607,7 @@ SubscribeInfo StreamingClientImpl::subscribeInternal(const string &host, int por
         ++attempt;
         SubscribeInfo info(_id, _host, _port, tableName, actionName, offset, resubscribe, filter, msgAsTable, allowExists,
 			batchSize, userName, password, blobDeserializer, istqueue, isEvent, resubTimeout, subOnce);
+		info.clientFilter = clientFilter;
 		if(!backupSites.empty()){
             info.availableSites.push_back({host, port});
             info.currentSiteIndex = 0;
@@ -1291,6 +1624,9 @@ SubscribeInfo StreamingClientImpl::subscribeInternal(const string &host, int por
 			topic = subscribeInternal(conn, info);
 			insertMeta(info, topic);
             return info;
+        } catch (IllegalArgumentException &) {
+            // the client filter doesn't match the schema, resubscribing can't fix it
+            throw;
         } catch (exception &e) {
             if(!backupSites.empty()){
                 LockGuard<Mutex> _(&mtx_);
@@ -1388,6 +1724,16 @@ bool StreamingClient::isExit() {
 	return impl_->isExit();
 }
 
+void StreamingClient::setClientFilter(const string &host, int port, const string &tableName, const string &actionName,
+                                     const ClientFilterSP &filter) {
+	impl_->setClientFilter(host + std::to_string(port) + tableName + actionName, filter);
+}
+
+bool StreamingClient::getStat(const string &host, int port, const string &tableName, const string &actionName,
+                              StreamingStat &stat) {
+	return impl_->getStat(host, port, tableName, actionName, stat);
+}
+
 SubscribeInfo StreamingClient::subscribeInternal(string host, int port, string tableName, string actionName,
                                                   int64_t offset, bool resubscribe, const dolphindb::VectorSP &filter,
                                                   bool msgAsTable, bool allowExists, int batchSize,
@@ -1436,16 +1782,17 @@ ThreadSP ThreadedClient::subscribe(string host, int port, const MessageBatchHand
         throttleTime = std::max(1, (int)(throttle * 1000));
     }
 	SmartPointer<StreamingClientImpl> impl=impl_;
-	ThreadSP thread = new Thread(new Executor([handler, info, throttleTime, impl, msgAsTable]() {
+	MessageBatchHandler timed = timedHandler(handler, info.stats);
+	ThreadSP thread = new Thread(new Executor([timed, info, throttleTime, impl, msgAsTable]() {
 		try {
 			bool foundnull = false;
 			if (msgAsTable) {
 				ConstantSP msg;
-				bool isexit;
+				long long offset;
 				while (impl->isExit() == false && info.tqueue->getExitFlag() == false) {
-					if (info.tqueue->pop(msg, throttleTime)) {
+					if (info.tqueue->pop(msg, throttleTime, &offset)) {
 						if(!msg.isNull()){
-							handler({Message(msg)});
+							timed({Message(msg, offset)});
 						}
 					}
 				}
@@ -1459,7 +1806,7 @@ ThreadSP ThreadedClient::subscribe(string host, int port, const MessageBatchHand
 							foundnull=true;
 						}
 						if(!msgs.empty()) {
-							handler(msgs);
+							timed(msgs);
 						}
 					}
 				}
@@ -1498,6 +1845,9 @@ ThreadSP newHandleThread(const MessageHandler handler, MessageQueueSP queue, boo
 					if (!mergeTable(msg, tables)) {
 						foundnull = true;
 					}
+					else {
+						msg.setOffset(tables.back().getOffset());
+					}
 				}
 				handler(msg);
 			}
@@ -1529,7 +1879,7 @@ ThreadSP ThreadedClient::subscribe(string host, int port, const MessageHandler &
         return t;
     }
 
-	ThreadSP t = newHandleThread(handler, info.queue, false, impl_);
+	ThreadSP t = newHandleThread(timedHandler(handler, info.stats), info.queue, false, impl_);
     t->start();
     return t;
 }
@@ -1580,20 +1930,185 @@ vector<ThreadSP> ThreadPooledClient::subscribe(string host, int port, const Mess
 								  userName, password, blobDeserializer, false, backupSites, false, resubTimeout, subOnce);
     vector<ThreadSP> ret;
     for (int i = 0; i < threadCount_ && isExit() == false; ++i) {
-		ThreadSP t = newHandleThread(handler, info.queue, msgAsTable, impl_);
+		ThreadSP t = newHandleThread(timedHandler(handler, info.stats), info.queue, msgAsTable, impl_);
         t->start();
         ret.emplace_back(t);
     }
     return ret;
 }
 
+ThreadSP newBatchHandleThread(const MessageBatchHandler &handler, MessageQueueSP queue, int throttleTime, bool msgAsTable, SmartPointer<StreamingClientImpl> impl) {
+	return new Thread(new Executor([handler, queue, throttleTime, msgAsTable, impl]() {
+		try {
+			vector<Message> msgs;
+			bool foundnull = false;
+			while (foundnull == false && impl->isExit() == false) {
+				if (!queue->pop(msgs, throttleTime))
+					continue;
+				while (msgs.empty() == false && msgs.back().isNull()) {
+					msgs.pop_back();
+					foundnull = true;
+				}
+				if (msgs.empty())
+					continue;
+				if (msgAsTable) {
+					Message table = msgs[0];
+					table.setOffset(msgs.back().getOffset());
+					msgs.erase(msgs.begin());
+					mergeTable(table, msgs);
+					handler({table});
+				}
+				else {
+					handler(msgs);
+				}
+			}
+			// let the other threads polling the same queue quit as well
+			queue->push(Message());
+		}
+		catch(exception &e) {
+			LOG_ERR(e.what());
+		}
+	}));
+}
+
+vector<ThreadSP> ThreadPooledClient::subscribe(string host, int port, const MessageBatchHandler &handler, string tableName,
+                                               string actionName, int64_t offset, bool resub, const VectorSP &filter,
+                                               bool allowExists, int batchSize, double throttle, bool msgAsTable,
+                                               string userName, string password,
+                                               const StreamDeserializerSP &blobDeserializer,
+                                               const std::vector<std::string> &backupSites, int resubTimeout, bool subOnce,
+                                               const string &keyColumn) {
+    auto info = subscribeInternal(host, port, tableName, actionName, offset, resub,
+                                  filter, msgAsTable, allowExists, std::max(batchSize, 1),
+								  userName, password, blobDeserializer, false, backupSites, false, resubTimeout, subOnce);
+    vector<ThreadSP> ret;
+    if (info.queue.isNull()) {
+        LOG_ERR("Subscription already made, handler loop not created.");
+        return ret;
+    }
+    int throttleTime = std::max(1, (int)(throttle * 1000));
+    MessageBatchHandler timed = timedHandler(handler, info.stats);
+    if (keyColumn.empty()) {
+        for (int i = 0; i < threadCount_ && isExit() == false; ++i) {
+            ThreadSP t = newBatchHandleThread(timed, info.queue, throttleTime, msgAsTable, impl_);
+            impl_->addHandleThread(info.queue, t);
+            t->start();
+            ret.emplace_back(t);
+        }
+        return ret;
+    }
+
+    int keyIndex = -1;
+    if (blobDeserializer.isNull()) {
+        auto it = std::find(info.attributes.begin(), info.attributes.end(), keyColumn);
+        if (it != info.attributes.end()) {
+            keyIndex = static_cast<int>(it - info.attributes.begin());
+        }
+        else if (!info.attributes.empty()) {
+            unsubscribeInternal(host, port, tableName, actionName);
+            throw RuntimeException("Key column " + keyColumn + " doesn't exist in table " + tableName + ".");
+        }
+        else {
+            LOG_WARN("The schema of", tableName, "is not known yet, messages will not be sharded by", keyColumn);
+        }
+    }
+    // each thread owns a queue, a dispatcher moves the messages from the subscription queue to them
+    int threadCount = threadCount_;
+    vector<MessageQueueSP> queues;
+    vector<ThreadSP> workers;
+    for (int i = 0; i < threadCount; ++i) {
+        MessageQueueSP queue = new MessageQueue(std::max(DEFAULT_QUEUE_CAPACITY, batchSize), std::max(batchSize, 1));
+        queues.emplace_back(queue);
+        workers.emplace_back(newBatchHandleThread(timed, queue, throttleTime, msgAsTable, impl_));
+    }
+    SmartPointer<StreamingClientImpl> impl = impl_;
+    MessageQueueSP source = info.queue;
+    ThreadSP dispatcher = new Thread(new Executor([source, queues, workers, keyIndex, msgAsTable, threadCount, impl]() {
+        int next = 0;
+        auto route = [&](const Message &msg) {
+            if (!msg.getSymbol().empty()) {
+                queues[std::hash<string>()(msg.getSymbol()) % threadCount]->push(msg);
+                return;
+            }
+            if (keyIndex < 0) {
+                queues[next++ % threadCount]->push(msg);
+                return;
+            }
+            if (!msgAsTable) {
+                int bucket = msg->get(keyIndex)->getHash(threadCount);
+                queues[bucket < 0 ? 0 : bucket]->push(msg);
+                return;
+            }
+            Table *table = (Table*)msg.get();
+            INDEX rows = table->rows();
+            ConstantSP col = table->getColumn(keyIndex);
+            vector<int> buckets(rows);
+            if (!col->getHash(0, rows, threadCount, buckets.data())) {
+                for (INDEX i = 0; i < rows; ++i) {
+                    buckets[i] = col->get(i)->getHash(threadCount);
+                }
+            }
+            vector<vector<int>> indices(threadCount);
+            for (INDEX i = 0; i < rows; ++i) {
+                indices[buckets[i] < 0 ? 0 : buckets[i]].push_back(static_cast<int>(i));
+            }
+            for (int i = 0; i < threadCount; ++i) {
+                if (indices[i].empty())
+                    continue;
+                if (static_cast<INDEX>(indices[i].size()) == rows)
+                    queues[i]->push(msg);
+                else
+                    queues[i]->push(Message(table->getSubTable(indices[i])));
+            }
+        };
+        try {
+            Message first;
+            vector<Message> msgs;
+            bool foundnull = false;
+            while (foundnull == false && impl->isExit() == false) {
+                source->pop(first);
+                msgs.clear();
+                msgs.emplace_back(first);
+                // take whatever else is queued without waiting for a full batch
+                vector<Message> rest;
+                if (source->pop(rest, 0))
+                    msgs.insert(msgs.end(), rest.begin(), rest.end());
+                for (auto &msg : msgs) {
+                    if (msg.isNull()) {
+                        foundnull = true;
+                        break;
+                    }
+                    route(msg);
+                }
+            }
+        }
+        catch(exception &e) {
+            LOG_ERR(e.what());
+        }
+        for (auto &queue : queues) {
+            queue->push(Message());
+        }
+        for (auto &worker : workers) {
+            worker->join();
+        }
+    }));
+    impl_->addHandleThread(info.queue, dispatcher);
+    for (auto &worker : workers) {
+        worker->start();
+    }
+    dispatcher->start();
+    ret.emplace_back(dispatcher);
+    ret.insert(ret.end(), workers.begin(), workers.end());
+    return ret;
+}
+
 EventClient::EventClient(const std::vector<EventSchema>& eventSchema, const std::vector<std::string>& eventTimeKeys, const std::vector<std::string>& commonKeys)
     : StreamingClient(0), eventHandler_(eventSchema, eventTimeKeys, commonKeys)
 {
 
 }
 
-ThreadSP EventClient::subscribe(const string& host, int port, const EventMessageHandler &handler, const string& tableName, const string& actionName, int64_t offset, bool resub, const string& userName, const string& password){
+void EventClient::checkOutputTable(const string& host, int port, const string& tableName, const string& userName, const string& password){
     if(tableName.empty()){
         throw RuntimeException("tableName must not be empty.");
     }
@@ -1609,6 +2124,10 @@ ThreadSP EventClient::subscribe(const string& host, int port, const EventMessage
         throw RuntimeException(errMsg);
     }
     tempConn.close();
+}
+
+ThreadSP EventClient::subscribe(const string& host, int port, const EventMessageHandler &handler, const string& tableName, const string& actionName, int64_t offset, bool resub, const string& userName, const string& password){
+    checkOutputTable(host, port, tableName, userName, password);
 
     auto info = subscribeInternal(host, port, tableName, actionName, offset, resub, nullptr, false, false, 1, userName, password, nullptr, false, std::vector<std::string>(), true, 100, false);
     if (info.queue.isNull()) {
@@ -1652,6 +2171,59 @@ ThreadSP EventClient::subscribe(const string& host, int port, const EventMessage
     return thread;
 }
 
+ThreadSP EventClient::subscribe(const string& host, int port, const EventMessageBatchHandler &handler, const string& tableName, const string& actionName, int64_t offset, bool resub, const string& userName, const string& password, int batchSize, double throttle){
+    if(batchSize <= 0){
+        throw RuntimeException("batchSize must be greater than 0.");
+    }
+    checkOutputTable(host, port, tableName, userName, password);
+
+    auto info = subscribeInternal(host, port, tableName, actionName, offset, resub, nullptr, false, false, batchSize, userName, password, nullptr, false, std::vector<std::string>(), true, 100, false);
+    if (info.queue.isNull()) {
+        LOG_ERR("Subscription already made, handler loop not created.");
+        return nullptr;
+    }
+
+    int throttleTime = std::max(1, (int)(throttle * 1000));
+    SmartPointer<StreamingClientImpl> impl = impl_;
+    ThreadSP thread = new Thread(new Executor([this, handler, info, impl, throttleTime]() {
+        vector<Message> msgs;
+        bool foundnull = false;
+        std::vector<std::string> eventTypes;
+        std::vector<std::vector<ConstantSP>> attributes;
+        ErrorCodeInfo errorInfo;
+        while (foundnull == false && impl->isExit() == false) {
+            if (!info.queue->pop(msgs, throttleTime)) {
+                continue;
+            }
+            while (msgs.empty() == false && msgs.back().isNull()) {
+                msgs.pop_back();
+                foundnull = true;
+            }
+            // deserialize all messages of the batch before handing them over at once
+            eventTypes.clear();
+            attributes.clear();
+            for (auto &msg : msgs) {
+                if(!eventHandler_.deserializeEvent(msg, eventTypes, attributes, errorInfo)){
+                    LOG_ERR("deserialize fail", errorInfo.errorInfo);
+                }
+            }
+            if (eventTypes.empty()) {
+                continue;
+            }
+            try {
+                handler(eventTypes, attributes);
+            }
+            catch (exception &e) {
+                LOG_ERR(e.what());
+            }
+        }
+        info.queue->push(Message());
+    }));
+    impl_->addHandleThread(info.queue, thread);
+    thread->start();
+    return thread;
+}
+
 void EventClient::unsubscribe(const string& host, int port, const string& tableName, const string& actionName){
     unsubscribeInternal(host, port, tableName, actionName);
 }
@@ -1672,9 +2244,10 @@ bool MessageTableQueue::getExitFlag() {
 	LockGuard<Mutex> guard(&lock_);
 	return exitflag_;
 }
-void MessageTableQueue::push(const std::vector<string>& colLabels, const ConstantSP &colItems) {
+void MessageTableQueue::push(const std::vector<string>& colLabels, const ConstantSP &colItems, long long offset) {
 	LockGuard<Mutex> guard(&lock_);
 	if (exitflag_) return;
+	offset_ = offset;
 	colSize_ = colLabels.size();
 	vector<ConstantSP> cols(colSize_);
 	for (int i = 0; i < colSize_; ++i) {
@@ -1705,13 +2278,15 @@ void MessageTableQueue::push(const std::vector<string>& colLabels, const Constan
 		full_.wait(lock_);
 	}
 }
-bool MessageTableQueue::pop(ConstantSP &item, int milliSeconds) {
+bool MessageTableQueue::pop(ConstantSP &item, int milliSeconds, long long *offset) {
 	LockGuard<Mutex> guard(&lock_);
 	if (size_ < batchSize_)
 		batch_.wait(lock_, milliSeconds);
 	if (size_ == 0)
 		return false;
 	item = messageTable_;
+	if (offset != nullptr)
+		*offset = offset_;
 	messageTable_.clear();
 	size_ = 0;
 	full_.notifyAll();
@@ -1126,8 +1126,10 @@ IO_ERR DataInputStream::readBytes(char* buf, size_t length, size_t& actualLength
     	IO_ERR ret = OK;
     	while(ret == OK && actualLength < length){
     		ret = socket_->read(buf+actualLength, length-actualLength, count);
-			if(ret == OK)
+			if(ret == OK) {
 				actualLength += count;
+				bytesReceived_ += count;
+			}
     	}
     	return ret;
     }
@@ -1161,7 +1163,12 @@ IO_ERR DataInputStream::readBytes(char* buf, size_t unitLength, size_t length, s
 	IO_ERR ret = readBytes(buf, length * unitLength, actualLength);
 	std::size_t remainder = actualLength % unitLength;
 	actualLength = actualLength / unitLength;
-	if(remainder > 0 && source_ != QUEUE_STREAM){
+	if(remainder > 0 && source_ == ARRAY_STREAM){
+		// leave the partial unit unread rather than copying it over an external buffer
+		cursor_ -= remainder;
+		size_ += remainder;
+	}
+	else if(remainder > 0 && source_ != QUEUE_STREAM){
 		cursor_ = 0;
 		size_ = remainder;
 		memcpy(buf_, buf + unitLength * actualLength, size_);
@@ -1215,6 +1222,7 @@ IO_ERR DataInputStream::prepareBytes(size_t length){
 			IO_ERR ret = socket_->read(buf_ + usedSpace, capacity_ - usedSpace, actualLength);
 			if(ret != OK)
 				return ret;
+			bytesReceived_ += actualLength;
 			size_ += actualLength;
 			usedSpace += actualLength;
 		}
@@ -1307,6 +1315,7 @@ IO_ERR DataInputStream::prepareBytesEndWith(char endChar, size_t& endPos){
 				IO_ERR ret = socket_->read(buf_ + usedSpace, capacity_ - usedSpace, actualLength);
 				if( ret != OK)
 					return ret;
+				bytesReceived_ += actualLength;
 				size_ += actualLength;
 				usedSpace += actualLength;
 			}
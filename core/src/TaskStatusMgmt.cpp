@@ -1,4 +1,5 @@
 #include "TaskStatusMgmt.h"
+#include "Logger.h"
 
 namespace dolphindb {
 
@@ -11,9 +12,61 @@ bool TaskStatusMgmt::isFinished(int identity){
     return results[identity].stage == FINISHED;
 }
 
-void TaskStatusMgmt::setResult(int identity, Result r){
+void TaskStatusMgmt::waitFinished(int identity){
     LockGuard<Mutex> guard(&mutex_);
-    results[identity] = r;
+    while(true){
+        auto it = results.find(identity);
+        if(it == results.end())
+            throw RuntimeException("Task [" + std::to_string(identity) + "] does not exist.");
+        if(it->second.stage == ERRORED)
+            throw RuntimeException("Task [" + std::to_string(identity) + "] come across exception : " + it->second.errMsg);
+        if(it->second.stage == FINISHED)
+            return;
+        finished_.wait(mutex_);
+    }
+}
+
+void TaskStatusMgmt::setResult(int identity, Result r){
+    py::object callback;
+    {
+        LockGuard<Mutex> guard(&mutex_);
+        results[identity] = r;
+        if(r.stage != WAITING){
+            finished_.notifyAll();
+            auto it = callbacks.find(identity);
+            if(it != callbacks.end()){
+                callback = std::move(it->second);
+                callbacks.erase(it);
+            }
+        }
+    }
+    if(callback)
+        invokeCallback(callback);
+}
+
+void TaskStatusMgmt::setCallback(int identity, const py::object& callback){
+    {
+        LockGuard<Mutex> guard(&mutex_);
+        auto it = results.find(identity);
+        if(it == results.end() || it->second.stage == WAITING){
+            callbacks[identity] = callback;
+            return;
+        }
+    }
+    py::object finished = callback;
+    invokeCallback(finished);
+}
+
+void TaskStatusMgmt::invokeCallback(py::object& callback){
+    py::gil_scoped_acquire gil;
+    try{
+        callback();
+    }
+    catch(std::exception& ex){
+        LOG_ERR("Task completion callback come across exception :", ex.what());
+    }
+    // drop the reference while the GIL is still held
+    callback = py::object();
 }
 
 ConstantSP TaskStatusMgmt::getData(int identity){
@@ -4,7 +4,10 @@
 #include "DecimalHelper.h"
 
 #include "TypeException.h"
+#include "Concurrent.h"
 
+#include <atomic>
+#include <thread>
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pytypes.h>
@@ -128,6 +131,7 @@ PyCache::PyCache() {
     pd_NaT_ = py::type::of(pandas_.attr("NaT"));
     pd_dataframe_ = pandas_.attr("DataFrame");
     pd_series_ = pandas_.attr("Series");
+    pd_categorical_ = pandas_.attr("Categorical");
     pd_index_ = pandas_.attr("Index");
     pd_timestamp_ = pandas_.attr("Timestamp");
     pd_extension_dtype_ = pandas_.attr("core").attr("dtypes").attr("dtypes").attr("ExtensionDtype");
@@ -3697,8 +3701,187 @@ Converter::toNumpy_Matrix(const ConstantSP &data, const ToPythonOption &option)
 }
 
 
+/**
+ * ColumnFiller converts the plain numeric and temporal columns of a table without holding the GIL.
+ * add() creates the numpy array of a column, which needs the GIL. fill() then releases the GIL and
+ * copies the data of all added columns into their arrays, one column per task, on a pool of threads.
+ * The arrays are the same as those built by toNumpy_Vector / _toPython_Old_createPyVector.
+ */
+class ColumnFiller {
+public:
+    // temporalToNs: convert temporal columns to datetime64[ns] like a DataFrame does, otherwise leave them to the caller
+    explicit ColumnFiller(bool temporalToNs) : temporalToNs_(temporalToNs), elements_(0) {}
+
+    bool add(const ConstantSP &col, py::object &pyObject) {
+        Type type = createType(col);
+        bool hasNull = col->getNullFlag();
+        const char *dtype = nullptr;
+        FILL_KIND kind = FILL_COPY;
+        long long unit = 1;
+        switch (type.first) {
+        case HT_BOOL:
+            if (hasNull) return false;
+            dtype = "bool"; break;
+        case HT_CHAR:
+            dtype = hasNull ? "float64" : "int8"; kind = hasNull ? FILL_INTEGRAL_WITH_NULL : FILL_COPY; break;
+        case HT_SHORT:
+            dtype = hasNull ? "float64" : "int16"; kind = hasNull ? FILL_INTEGRAL_WITH_NULL : FILL_COPY; break;
+        case HT_INT:
+            dtype = hasNull ? "float64" : "int32"; kind = hasNull ? FILL_INTEGRAL_WITH_NULL : FILL_COPY; break;
+        case HT_LONG:
+            dtype = hasNull ? "float64" : "int64"; kind = hasNull ? FILL_INTEGRAL_WITH_NULL : FILL_COPY; break;
+        case HT_FLOAT:
+            dtype = "float32"; kind = FILL_FLOAT; break;
+        case HT_DOUBLE:
+            dtype = "float64"; kind = FILL_DOUBLE; break;
+        case HT_DATE:           unit = 86400000000000LL; break;
+        case HT_TIME:           unit = 1000000LL; break;
+        case HT_MINUTE:         unit = 60000000000LL; break;
+        case HT_SECOND:         unit = 1000000000LL; break;
+        case HT_DATETIME:       unit = 1000000000LL; break;
+        case HT_TIMESTAMP:      unit = 1000000LL; break;
+        case HT_DATEHOUR:       unit = 3600000000000LL; break;
+        case HT_NANOTIME:
+        case HT_NANOTIMESTAMP:  unit = 1; break;
+        default:
+            return false;
+        }
+        if (dtype == nullptr) {
+            if (!temporalToNs_) return false;
+            dtype = "datetime64[ns]";
+            kind = FILL_TEMPORAL;
+        }
+        size_t size = col->size();
+        py::array pyVec(py::dtype(dtype), {size}, {});
+        tasks_.push_back({col, pyVec.mutable_data(), kind, type.first, unit});
+        elements_ += size;
+        pyObject = std::move(pyVec);
+        return true;
+    }
+
+    void fill() {
+        if (tasks_.empty()) return;
+        py::gil_scoped_release release;
+        size_t workers = std::min<size_t>(tasks_.size(), std::max(1u, std::thread::hardware_concurrency()));
+        if (elements_ < PARALLEL_THRESHOLD || workers < 2) {
+            for (const auto &task : tasks_) fillOne(task);
+            return;
+        }
+        std::atomic<size_t> next(0);
+        auto work = [&]() {
+            for (size_t i = next++; i < tasks_.size(); i = next++) fillOne(tasks_[i]);
+        };
+        std::vector<dolphindb::ThreadSP> threads;
+        for (size_t i = 1; i < workers; ++i) {
+            threads.push_back(new dolphindb::Thread(new dolphindb::Executor(work)));
+            threads.back()->start();
+        }
+        work();
+        for (auto &thread : threads) thread->join();
+    }
+
+private:
+    enum FILL_KIND { FILL_COPY, FILL_INTEGRAL_WITH_NULL, FILL_FLOAT, FILL_DOUBLE, FILL_TEMPORAL };
+    struct Task {
+        ConstantSP col;
+        void *dst;
+        FILL_KIND kind;
+        HELPER_TYPE type;
+        long long unit;
+    };
+    // below this number of elements the threads cost more than they save
+    static const size_t PARALLEL_THRESHOLD = 1 << 20;
+
+    template <typename T>
+    static void fillIntegralWithNull(const VectorSP &col, double *p, const T* (Vector::*getConst)(INDEX, int, T*) const, T min_) {
+        VectorEnumNumeric<T>(col, getConst, [&](const T *pbuf, INDEX startIndex, INDEX size_) -> bool {
+            for (INDEX i = 0, index = startIndex; i < size_; ++i, ++index) {
+                if (UNLIKELY(pbuf[i] == min_)) {
+                    SET_NPNULL(p+index, 1);
+                }
+                else {
+                    p[index] = pbuf[i];
+                }
+            }
+            return true;
+        }, 0);
+    }
+
+    static void fillOne(const Task &task) {
+        const ConstantSP &col = task.col;
+        INDEX size = col->size();
+        switch (task.kind) {
+        case FILL_COPY:
+            switch (task.type) {
+            case HT_BOOL:   col->getBool(0, size, (char *)task.dst); break;
+            case HT_CHAR:   col->getChar(0, size, (char *)task.dst); break;
+            case HT_SHORT:  col->getShort(0, size, (short *)task.dst); break;
+            case HT_INT:    col->getInt(0, size, (int *)task.dst); break;
+            default:        col->getLong(0, size, (long long *)task.dst); break;
+            }
+            break;
+        case FILL_INTEGRAL_WITH_NULL: {
+            double *p = (double *)task.dst;
+            switch (task.type) {
+            case HT_CHAR:   fillIntegralWithNull<char>(col, p, &Vector::getCharConst, CHAR_MIN); break;
+            case HT_SHORT:  fillIntegralWithNull<short>(col, p, &Vector::getShortConst, SHRT_MIN); break;
+            case HT_INT:    fillIntegralWithNull<int>(col, p, &Vector::getIntConst, INT_MIN); break;
+            default:        fillIntegralWithNull<long long>(col, p, &Vector::getLongConst, LLONG_MIN); break;
+            }
+            break;
+        }
+        case FILL_FLOAT: {
+            float *p = (float *)task.dst;
+            col->getFloat(0, size, p);
+            if (UNLIKELY(col->getNullFlag())) {
+                for (INDEX i = 0; i < size; ++i) {
+                    if (UNLIKELY(p[i] == FLT_NMIN)) SET_NPNULL(p+i, 1);
+                }
+            }
+            break;
+        }
+        case FILL_DOUBLE: {
+            double *p = (double *)task.dst;
+            col->getDouble(0, size, p);
+            if (UNLIKELY(col->getNullFlag())) {
+                for (INDEX i = 0; i < size; ++i) {
+                    if (UNLIKELY(p[i] == DBL_NMIN)) SET_NPNULL(p+i, 1);
+                }
+            }
+            break;
+        }
+        case FILL_TEMPORAL: {
+            long long *p = (long long *)task.dst;
+            col->getLong(0, size, p);
+            if (task.unit == 1) break;
+            if (UNLIKELY(col->getNullFlag())) {
+                for (INDEX i = 0; i < size; ++i) {
+                    if (UNLIKELY(p[i] == INT64_MIN)) {
+                        SET_NPNULL(p+i, 1);
+                        continue;
+                    }
+                    p[i] *= task.unit;
+                }
+            }
+            else {
+                for (INDEX i = 0; i < size; ++i) p[i] *= task.unit;
+            }
+            break;
+        }
+        }
+    }
+
+    bool temporalToNs_;
+    size_t elements_;
+    std::vector<Task> tasks_;
+};
+
+
 py::object
 Converter::toPandas_Vector(const ConstantSP &data, const ToPythonOption &option) {
+    if (option.symbolAsCategory_ && createType(data).first == HT_SYMBOL) {
+        return PyObjs::cache_->pd_series_(Converter::toPandas_Categorical(data));
+    }
     py::object series = PyObjs::cache_->pd_series_(Converter::toNumpy_Vector(data, option));
     if (getCategory(createType(data)) == DATA_CATEGORY::TEMPORAL) {
         series = series.attr("astype")("datetime64[ns]");
@@ -3711,12 +3894,26 @@ py::object
 Converter::toPandas_Table(const ConstantSP &data, const ToPythonOption &option) {
     TableSP ddbTable = data;
     size_t cols = ddbTable->columns();
+    // plain numeric and temporal columns are filled in parallel without the GIL, the others are converted one by one
+    std::vector<py::object> columns(cols);
+    ColumnFiller filler(!option.table2List_);
+    for (size_t i = 0; i < cols; ++i) {
+        ConstantSP col = ddbTable->getColumn(i);
+        if (option.symbolAsCategory_ && !option.table2List_ && createType(col).first == HT_SYMBOL) continue;
+        filler.add(col, columns[i]);
+    }
+    filler.fill();
     if (!option.table2List_) {
         // convert to pandas.DataFrame
         py::object dataframe;
         auto dict = py::dict();
         for (size_t i = 0; i < cols; ++i) {
-            dict[ddbTable->getColumnName(i).data()] = Converter::toPandas_Vector(ddbTable->getColumn(i), option);
+            if (columns[i]) {
+                dict[ddbTable->getColumnName(i).data()] = PyObjs::cache_->pd_series_(columns[i]);
+            }
+            else {
+                dict[ddbTable->getColumnName(i).data()] = Converter::toPandas_Vector(ddbTable->getColumn(i), option);
+            }
         }
         dataframe = PyObjs::cache_->pandas_.attr("DataFrame")(dict);
         return dataframe;
@@ -3726,6 +3923,10 @@ Converter::toPandas_Table(const ConstantSP &data, const ToPythonOption &option)
         py::list pyList(cols);
         ConstantSP col;
         for (size_t i = 0; i < cols; ++i) {
+            if (columns[i]) {
+                pyList[i] = columns[i];
+                continue;
+            }
             col = ddbTable->getColumn(i);
             pyList[i] = toNumpy_Vector(col, option);
         }
@@ -3733,6 +3934,36 @@ Converter::toPandas_Table(const ConstantSP &data, const ToPythonOption &option)
     }
 }
 
+/**
+ * Build a pandas.Categorical from a SYMBOL vector: the codes are the symbol indices and
+ * the categories are the strings of the SymbolBase, so only one Python string is created
+ * per distinct symbol.
+ */
+py::object
+Converter::toPandas_Categorical(const ConstantSP &data) {
+    FastSymbolVector *pSymbolVector = (FastSymbolVector *)data.get();
+    SymbolBaseSP symbolBase = pSymbolVector->getSymbolBase();
+    int symbolBaseSize = symbolBase->size();
+    py::list categories(symbolBaseSize);
+    std::string symbolText;
+    for (int i = 0; i < symbolBaseSize; ++i) {
+        symbolText = symbolBase->getSymbol(i);
+        categories[i] = py::reinterpret_steal<py::object>(decodeUtf8Text(symbolText.data(), symbolText.size()));
+    }
+    size_t size = data->size();
+    py::array_t<int> codes(size);
+    int *pcodes = codes.mutable_data();
+    data->getInt(0, size, pcodes);
+    if (UNLIKELY(data->getNullFlag())) {
+        for (size_t i = 0; i < size; ++i) {
+            if (UNLIKELY(pcodes[i] == INT_MIN)) {
+                pcodes[i] = -1;
+            }
+        }
+    }
+    return PyObjs::cache_->pd_categorical_.attr("from_codes")(codes, categories);
+}
+
 void _toPython_Old_createPyVector(
     const ConstantSP        &obj,
     py::object              &pyObject,
@@ -3997,22 +4228,37 @@ _toPython_Old(ConstantSP obj, bool tableFlag, const ToPythonOption &option) {
         }
     } else if (form == DATA_FORM::DF_TABLE) {
         TableSP ddbTbl = obj;
+        size_t columnSize = ddbTbl->columns();
+        // plain numeric and temporal columns are filled in parallel without the GIL, the others are converted one by one
+        std::vector<py::object> columns(columnSize);
+        ColumnFiller filler(true);
+        for (size_t i = 0; i < columnSize; ++i) {
+            ConstantSP col = ddbTbl->getColumn(i);
+            if (option.symbolAsCategory_ && !option.table2List_ && createType(col).first == HT_SYMBOL) {
+                columns[i] = Converter::toPandas_Categorical(col);
+                continue;
+            }
+            filler.add(col, columns[i]);
+        }
+        filler.fill();
+        for (size_t i = 0; i < columnSize; ++i) {
+            if (!columns[i]) {
+                columns[i] = _toPython_Old(ddbTbl->getColumn(i), true, option);
+            }
+        }
         if(option.table2List_==false) {
-            size_t columnSize = ddbTbl->columns();
             using namespace py::literals;
             py::object dataframe;
             auto dict = py::dict();
             for(size_t i = 0; i < columnSize; ++i) {
-                dict[ddbTbl->getColumnName(i).data()] = _toPython_Old(ddbTbl->getColumn(i), true, option);
+                dict[ddbTbl->getColumnName(i).data()] = columns[i];
             }
             dataframe = PyObjs::cache_->pandas_.attr("DataFrame")(dict);
             pyObject=std::move(dataframe);
         }else{
-            size_t columnSize = ddbTbl->columns();
             py::list pyList(columnSize);
             for (size_t i = 0; i < columnSize; ++i) {
-                py::object temp = _toPython_Old(ddbTbl->getColumn(i),true,option);
-                pyList[i] = temp;
+                pyList[i] = columns[i];
             }
             pyObject=std::move(pyList);
         }
@@ -30,6 +30,8 @@
 #include <pybind11/detail/common.h>
 #include <pybind11/gil.h>
 #include <pybind11/pytypes.h>
+#include <structmember.h>
+#include <atomic>
 #include <string>
 #include <unordered_map>
 #include <vector>
@@ -142,7 +144,7 @@ public:
     py::object run(const std::string &script, int taskId, const py::args &args,
                    const py::handle &clearMemory = py::none(), const py::handle &pickleTableToList = py::none(),
                    const py::handle &priority = py::none(), const py::handle &parallelism = py::none(),
-                   const py::handle &disableDecimal = py::none()) {
+                   const py::handle &disableDecimal = py::none(), const py::handle &callback = py::none()) {
         bool clearMemory_ = false;
         if (!clearMemory.is_none()) {
             clearMemory_ = clearMemory.cast<bool>();
@@ -185,6 +187,10 @@ public:
                                         pickleTableToList_, disableDecimal_);
             CATCH_EXCEPTION("<Exception> in run: ")
         }
+        if (!callback.is_none()) {
+            // registered after submission: fires immediately if the task has already completed
+            dbConnectionPool_.setCallback(taskId, py::reinterpret_borrow<py::object>(callback));
+        }
         return py::none();
     }
     bool isFinished(int taskId) {
@@ -238,6 +244,7 @@ public:
     ~BlockReader(){
     }
     void skipAll() {
+        py::gil_scoped_release release;
         reader_->skipAll();
     }
     py::bool_ hasNext(){
@@ -246,7 +253,13 @@ public:
     py::object read(){
         py::object ret;
         TRY
-            ret = Converter::toPython_Old(reader_->read());
+            ddb::ConstantSP block;
+            {
+                // receive and deserialize the block without the GIL so that other threads can run meanwhile
+                py::gil_scoped_release release;
+                block = reader_->read();
+            }
+            ret = Converter::toPython_Old(block);
         CATCH_EXCEPTION("<Exception> in read: ")
         return ret;
     }
@@ -276,6 +289,34 @@ public:
         CATCH_EXCEPTION("<Exception> in append: ")
         return insertRows;
     }
+    std::vector<int> appendAsync(py::object table){
+        if (!CHECK_INS(table, pd_dataframe_))
+            throw std::runtime_error(std::string("table must be a DataFrame!"));
+        std::vector<int> tasks;
+        vector<ddb::Type> colTypes = partitionedTableAppender_.getColTypes();
+        vector<std::string> colNames = partitionedTableAppender_.getColNames();
+        ddb::TableChecker checker;
+        for(int i=0;i<colTypes.size();++i){
+            checker[colNames[i]] = colTypes[i];
+        }
+        TRY
+            auto data = Converter::toDolphinDB_Table_fromDataFrame(table, checker);
+            py::gil_scoped_release gil_release;
+            tasks = partitionedTableAppender_.appendAsync(data);
+        CATCH_EXCEPTION("<Exception> in append_async: ")
+        return tasks;
+    }
+    int getResult(const std::vector<int> &tasks){
+        int insertRows;
+        TRY
+            py::gil_scoped_release gil_release;
+            insertRows = partitionedTableAppender_.getResult(tasks);
+        CATCH_EXCEPTION("<Exception> in append_async: ")
+        return insertRows;
+    }
+    void setCallback(const std::vector<int> &tasks, const py::object &callback){
+        partitionedTableAppender_.setCallback(tasks, callback);
+    }
 private:
     ddb::PartitionedTableAppender partitionedTableAppender_;
 };
@@ -413,7 +454,8 @@ public:
 
     py::object run(const std::string &script, const py::args &args, const py::handle &clearMemory = py::none(),
                    const py::handle &pickleTableToList = py::none(), const py::handle &priority = py::none(),
-                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none()) {
+                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none(),
+                   const py::handle &symbolAsCategory = py::none()) {
         if (enableJobCancellation_) {
             ddb::LockGuard<ddb::Mutex> LockGuard(&PyDBConnection::mapMutex_);
             if (PyDBConnection::runningMap_.count(this) == 0) {
@@ -491,11 +533,16 @@ public:
             withTableSchema_ = withTableSchema.cast<bool>();
         }
 
+        bool symbolAsCategory_ = false;
+        if (!symbolAsCategory.is_none()) {
+            symbolAsCategory_ = symbolAsCategory.cast<bool>();
+        }
+
         py::object result;
         if (args.empty()) {
             // script mode
             TRY result = dbConnection_.runPy(script, priority_, parallelism_, 0, clearMemory_, pickleTableToList_,
-                                             disableDecimal_, withTableSchema_);
+                                             disableDecimal_, withTableSchema_, symbolAsCategory_);
             CATCH_EXCEPTION("<Exception> in run: ")
         } else {
             // function mode
@@ -504,7 +551,7 @@ public:
                 ddbArgs.push_back(Converter::toDolphinDB(it));
             }
             result = dbConnection_.runPy(script, ddbArgs, priority_, parallelism_, 0, clearMemory_, pickleTableToList_,
-                                         disableDecimal_, withTableSchema_);
+                                         disableDecimal_, withTableSchema_, symbolAsCategory_);
             CATCH_EXCEPTION("<Exception> in run: ")
         }
         return result;
@@ -512,7 +559,8 @@ public:
 
     py::object exec(const std::string &script, const py::handle &clearMemory = py::none(),
                    const py::handle &pickleTableToList = py::none(), const py::handle &priority = py::none(),
-                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none()) {
+                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none(),
+                   const py::handle &symbolAsCategory = py::none()) {
         if (enableJobCancellation_) {
             ddb::LockGuard<ddb::Mutex> LockGuard(&PyDBConnection::mapMutex_);
             if (PyDBConnection::runningMap_.count(this) == 0) {
@@ -590,17 +638,23 @@ public:
             withTableSchema_ = withTableSchema.cast<bool>();
         }
 
+        bool symbolAsCategory_ = false;
+        if (!symbolAsCategory.is_none()) {
+            symbolAsCategory_ = symbolAsCategory.cast<bool>();
+        }
+
         py::object result;
         // script mode
         TRY result = dbConnection_.runPy(script, priority_, parallelism_, 0, clearMemory_, pickleTableToList_,
-                                            disableDecimal_, withTableSchema_);
+                                            disableDecimal_, withTableSchema_, symbolAsCategory_);
         CATCH_EXCEPTION("<Exception> in exec: ")
         return result;
     }
 
     py::object call(const std::string &func, const py::args &args, const py::handle &clearMemory = py::none(),
                    const py::handle &pickleTableToList = py::none(), const py::handle &priority = py::none(),
-                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none()) {
+                   const py::handle &parallelism = py::none(), const py::handle &disableDecimal = py::none(), const py::handle &withTableSchema = py::none(),
+                   const py::handle &symbolAsCategory = py::none()) {
         if (enableJobCancellation_) {
             ddb::LockGuard<ddb::Mutex> LockGuard(&PyDBConnection::mapMutex_);
             if (PyDBConnection::runningMap_.count(this) == 0) {
@@ -678,6 +732,11 @@ public:
             withTableSchema_ = withTableSchema.cast<bool>();
         }
 
+        bool symbolAsCategory_ = false;
+        if (!symbolAsCategory.is_none()) {
+            symbolAsCategory_ = symbolAsCategory.cast<bool>();
+        }
+
         py::object result;
         // function mode
         TRY std::vector<ddb::ConstantSP> ddbArgs;
@@ -685,7 +744,7 @@ public:
             ddbArgs.push_back(Converter::toDolphinDB(it));
         }
         result = dbConnection_.runPy(func, ddbArgs, priority_, parallelism_, 0, clearMemory_, pickleTableToList_,
-                                        disableDecimal_, withTableSchema_);
+                                        disableDecimal_, withTableSchema_, symbolAsCategory_);
         CATCH_EXCEPTION("<Exception> in call: ")
         return result;
     }
@@ -746,6 +805,30 @@ public:
 
     ~PyDBConnection() {}
 
+    py::list runPipeline(const py::list &requests, int maxInFlight) {
+        // each request is a tuple (script, args, scriptType, clearMemory, pickleTableToList, priority, parallelism, disableDecimal)
+        std::vector<ddb::PipelineRequest> ddbRequests;
+        ddbRequests.reserve(requests.size());
+        TRY
+            for (const auto &item : requests) {
+                py::tuple request = py::reinterpret_borrow<py::tuple>(item);
+                ddb::PipelineRequest one;
+                one.script = request[0].cast<std::string>();
+                for (const auto &arg : py::reinterpret_borrow<py::tuple>(request[1])) {
+                    one.args.push_back(Converter::toDolphinDB(arg));
+                }
+                one.scriptType = request[2].cast<std::string>();
+                one.clearMemory = request[3].cast<bool>();
+                one.pickleTableToList = request[4].cast<bool>();
+                one.priority = request[5].cast<int>();
+                one.parallelism = request[6].cast<int>();
+                one.disableDecimal = request[7].cast<bool>();
+                ddbRequests.push_back(std::move(one));
+            }
+            return dbConnection_.runPipelinePy(ddbRequests, maxInFlight);
+        CATCH_EXCEPTION("<Exception> in pipeline: ")
+    }
+
     ddb::DBConnection &getConnection() { return dbConnection_; }
 
     std::shared_ptr<dolphindb::Logger> getMsgLogger() { return dbConnection_.getMsgLogger(); }
@@ -1050,6 +1133,52 @@ public:
             return errorinfo;
         CATCH_EXCEPTION("<Exception> in insert: ")
     }
+    py::dict insertBatch(py::object table){
+        if(writer_->isExit()){
+            throw std::runtime_error(std::string("<Exception> in insert_batch: thread is exiting."));
+        }
+        if (!CHECK_INS(table, pd_dataframe_))
+            throw std::runtime_error(std::string("table must be a DataFrame!"));
+        TRY
+            py::dict errorinfo;
+            std::vector<std::string> colNames;
+            try {
+                colNames = py::cast<std::vector<std::string>>(table.attr("columns"));
+            }
+            catch (...) {
+                throw std::runtime_error(std::string("DataFrame column names must be strings."));
+            }
+            int size = static_cast<int>(colNames.size());
+            if(size != writer_->getColSize()){
+                errorinfo["errorCode"] = ddb::ErrorCodeInfo::formatApiCode(ddb::ErrorCodeInfo::EC_InvalidParameter);
+                errorinfo["errorInfo"] = std::string("Column counts don't match ") + std::to_string(writer_->getColSize());
+                return errorinfo;
+            }
+            const ddb::DATA_TYPE *colTypes = writer_->getColType();
+            const int *colExtras = writer_->getColExtra();
+            ddb::TableChecker checker;
+            for(int i = 0; i < size; ++i){
+                checker[colNames[i]] = createType(colTypes[i], colExtras[i]);
+            }
+            ddb::TableSP data = Converter::toDolphinDB_Table_fromDataFrame(table, checker);
+            ddb::ErrorCodeInfo info;
+            bool inserted;
+            {
+                py::gil_scoped_release gil_release;
+                inserted = writer_->insertTable(data, info);
+            }
+            if(inserted == false){
+                if(writer_->isExit()){
+                    throw std::runtime_error(std::string("<Exception> in insert_batch: thread is exiting."));
+                }
+                errorinfo["errorCode"] = info.errorCode;
+                errorinfo["errorInfo"] = info.errorInfo;
+                return errorinfo;
+            }
+            errorinfo["errorCode"] = "";
+            return errorinfo;
+        CATCH_EXCEPTION("<Exception> in insert_batch: ")
+    }
     py::dict insertUnwrittenData(const py::list &records){
         if(writer_->isExit()){
             throw std::runtime_error(std::string("<Exception> in insert: thread is exiting."));
@@ -1148,16 +1277,48 @@ public:
             attrExtraParams.push_back(py::cast<int>(tmpList[2]));
         }
         scheme_ = ddb::EventSchema{name_, attrKeys, attrTypes, attrForms, attrExtraParams};
+        // locate the slot of each field, so that events can be filled without attribute lookups
+        for (auto &key : attrKeys) {
+            py::str pyKey(key);
+            PyUnicode_InternInPlace(&pyKey.ptr());
+            py::object descr = py::getattr(pyScheme, pyKey, py::none());
+            Py_ssize_t offset = -1;
+            if (Py_TYPE(descr.ptr()) == &PyMemberDescr_Type) {
+                PyMemberDef *member = ((PyMemberDescrObject *)descr.ptr())->d_member;
+                if (member->type == T_OBJECT_EX) {
+                    offset = member->offset;
+                }
+            }
+            fieldNames_.push_back(pyKey);
+            slotOffsets_.push_back(offset);
+        }
     }
     py::object createEvent(const std::vector<ddb::ConstantSP> &attrs) {
-        py::object event = pyScheme_();
+        // events are created with __new__ only, their __init__ would not set anything without arguments
+        PyTypeObject *type = (PyTypeObject *)pyScheme_.ptr();
+        py::object event = py::reinterpret_steal<py::object>(type->tp_new(type, emptyArgs_.ptr(), nullptr));
+        if (!event) {
+            throw py::error_already_set();
+        }
         int len = scheme_.fieldNames_.size();
         for (int i = 0; i < len; ++i) {
-            py::setattr(event, scheme_.fieldNames_[i].c_str(), Converter::toPython_Old(attrs[i]));
+            py::object value = Converter::toPython_Old(attrs[i]);
+            if (slotOffsets_[i] >= 0) {
+                PyObject **slot = (PyObject **)((char *)event.ptr() + slotOffsets_[i]);
+                PyObject *old = *slot;
+                *slot = value.release().ptr();
+                Py_XDECREF(old);
+            }
+            else {
+                py::setattr(event, fieldNames_[i], value);
+            }
         }
         return event;
     }
-    ddb::EventSchema scheme() {
+    const std::vector<py::str>& fieldNames() const {
+        return fieldNames_;
+    }
+    const ddb::EventSchema& scheme() const {
         return scheme_;
     }
     py::object pyScheme() {
@@ -1170,6 +1331,9 @@ private:
     std::string         name_;
     py::object          pyScheme_;
     ddb::EventSchema    scheme_;
+    std::vector<py::str>    fieldNames_;
+    std::vector<Py_ssize_t> slotOffsets_;
+    py::tuple               emptyArgs_;
 };
 
 
@@ -1200,16 +1364,36 @@ public:
     }
     void sendEvent(const py::object& event) {
         std::string eventType = py::cast<std::string>(event.attr("_event_name"));
-        if (schemeMap_.find(eventType) == schemeMap_.end()) {
+        std::vector<ddb::ConstantSP> attributes = toAttributes(event, eventType);
+        sender_->sendEvent(eventType, attributes);
+    }
+    void sendEvents(const py::list& events) {
+        std::vector<std::string> eventTypes;
+        std::vector<std::vector<ddb::ConstantSP>> attributes;
+        eventTypes.reserve(events.size());
+        attributes.reserve(events.size());
+        for (auto &event : events) {
+            eventTypes.push_back(py::cast<std::string>(event.attr("_event_name")));
+            attributes.push_back(toAttributes(py::reinterpret_borrow<py::object>(event), eventTypes.back()));
+        }
+        // the events are converted already, insert them without the GIL
+        py::gil_scoped_release release;
+        sender_->sendEvents(eventTypes, attributes);
+    }
+private:
+    std::vector<ddb::ConstantSP> toAttributes(const py::object& event, const std::string& eventType) {
+        auto iter = schemeMap_.find(eventType);
+        if (iter == schemeMap_.end()) {
             throw std::runtime_error("Unknown eventType " + eventType);
         }
-        ddb::EventSchema scheme = schemeMap_[eventType]->scheme();
+        const ddb::EventSchema& scheme = iter->second->scheme();
+        const std::vector<py::str>& fieldNames = iter->second->fieldNames();
         std::vector<ddb::ConstantSP> attributes;
         int len = scheme.fieldNames_.size();
         attributes.reserve(len);
 
         for (int i = 0; i < len; ++i) {
-            py::object obj = py::reinterpret_borrow<py::object>(event.attr(py::cast(scheme.fieldNames_[i])));
+            py::object obj = event.attr(fieldNames[i]);
             switch (scheme.fieldForms_[i])
             {
             case ddb::DATA_FORM::DF_SCALAR: {
@@ -1230,7 +1414,7 @@ public:
                 break;
             }
         }
-        sender_->sendEvent(eventType, attributes);
+        return attributes;
     }
 private:
     std::map<std::string, ddb::SmartPointer<PyEventScheme>> schemeMap_;
@@ -1303,6 +1487,56 @@ protected:
     inline bool hasTopic(const std::string &topic) {
         return topicThread_.find(topic) != topicThread_.end();
     }
+    // Registers the columns / where options of config as the client filter of the subscription.
+    void setClientFilterImpl(ddb::StreamingClient &client, const std::string &host, int port,
+                             const std::string &tableName, const std::string &actionName, const py::dict &config) {
+        if (config["columns"].is_none() && config["where"].is_none()) return;
+        std::vector<std::string> columns;
+        if (!config["columns"].is_none()) {
+            columns = py::cast<std::vector<std::string>>(config["columns"]);
+        }
+        std::vector<ddb::ClientFilter::Condition> conditions;
+        if (!config["where"].is_none()) {
+            for (auto item : config["where"]) {
+                py::tuple cond = py::cast<py::tuple>(item);
+                conditions.push_back({py::cast<std::string>(cond[0]), py::cast<std::string>(cond[1]),
+                                      Converter::toDolphinDB(cond[2])});
+            }
+        }
+        TRY
+        client.setClientFilter(host, port, tableName, actionName, new ddb::ClientFilter(columns, conditions));
+        CATCH_EXCEPTION("<Exception> in subscribe: ")
+    }
+    py::dict getStatsImpl(ddb::StreamingClient &client) {
+        std::vector<std::string> topics;
+        {
+            ddb::LockGuard<ddb::Mutex> lockGuard(&mutex_);
+            for (auto &it : topicThread_) { topics.emplace_back(it.first); }
+        }
+        py::dict stats;
+        for (auto &topic : topics) {
+            std::vector<std::string> args = _split(topic, '/');
+            ddb::StreamingStat stat;
+            if (!client.getStat(args[0], std::stoi(args[1]), args[2], args[3], stat)) continue;
+            py::dict item;
+            item["queue_depth"] = stat.queueDepth;
+            item["last_offset"] = stat.lastOffset;
+            item["messages"] = stat.messages;
+            item["bytes"] = stat.bytes;
+            item["messages_per_second"] = stat.messagesPerSecond;
+            item["bytes_per_second"] = stat.bytesPerSecond;
+            item["reconnects"] = stat.reconnects;
+            item["last_sent_time"] = stat.lastSentTime;
+            item["last_receive_time"] = stat.lastReceiveTime;
+            item["handler_calls"] = stat.handlerCalls;
+            item["handler_p50"] = stat.handlerP50;
+            item["handler_p90"] = stat.handlerP90;
+            item["handler_p99"] = stat.handlerP99;
+            item["handler_max"] = stat.handlerMax;
+            stats[py::str(topic)] = item;
+        }
+        return stats;
+    }
 protected:
     ddb::Mutex mutex_;
     std::unordered_map<std::string, std::vector<ddb::ThreadSP>> topicThread_;
@@ -1310,6 +1544,123 @@ protected:
 };
 
 
+/**
+ * Builds the batch handler shared by ThreadedClient and ThreadPooledClient.
+ * In columnar mode the subscription runs with msgAsTable, so each batch arrives merged into
+ * a single table and is handed over as {column name: numpy array} ("columns", "arrow") or as
+ * a DataFrame ("pandas") instead of per-row lists. With a StreamDeserializer the rows of a
+ * batch are grouped by symbol instead, and the handler receives {symbol: table}.
+ * If checkpoint is not None, it is called with the offset of the last row of each batch once
+ * the handler returns without raising.
+ */
+static ddb::MessageBatchHandler makeBatchHandler(const py::object &handler, bool msg_as_table,
+                                                 const ddb::StreamDeserializerSP &stream_deser,
+                                                 const std::string &msg_format, const py::object &checkpoint) {
+    const bool has_stream_deser = !stream_deser.isNull();
+    auto commit = [checkpoint](const ddb::Message &last) {
+        if (!checkpoint.is_none() && last.getOffset() >= 0) {
+            checkpoint(last.getOffset());
+        }
+    };
+    if (msg_format != "rows") {
+        const bool as_pandas = msg_format == "pandas";
+        auto convert = [as_pandas](const ddb::TableSP &table) -> py::object {
+            if (as_pandas) {
+                return Converter::toPython(table);
+            }
+            py::dict columns;
+            for (int i = 0; i < table->columns(); ++i) {
+                columns[py::str(table->getColumnName(i))] = Converter::toPython(table->getColumn(i));
+            }
+            return columns;
+        };
+        if (has_stream_deser) {
+            return [handler, stream_deser, convert, commit](const std::vector<ddb::Message> &msgs) {
+                std::vector<std::pair<std::string, ddb::TableSP>> tables;
+                ddb::ErrorCodeInfo errorInfo;
+                if (!stream_deser->groupBySymbol(msgs, tables, errorInfo)) {
+                    throw std::runtime_error(errorInfo.errorInfo);
+                }
+                // handle GIL
+                py::gil_scoped_acquire acquire;
+                py::dict groups;
+                for (auto &one : tables) {
+                    groups[py::str(one.first)] = convert(one.second);
+                }
+                handler(groups);
+                commit(msgs.back());
+            };
+        }
+        return [handler, convert, commit](const std::vector<ddb::Message> &msgs) {
+            // handle GIL
+            py::gil_scoped_acquire acquire;
+            if (!msgs[0]->isTable()) {
+                throw std::runtime_error("msg_format requires the column names of the subscribed table");
+            }
+            handler(convert(msgs[0]));
+            commit(msgs.back());
+        };
+    }
+    return [handler, msg_as_table, has_stream_deser, commit](const std::vector<ddb::Message> &msgs) {
+        // handle GIL
+        py::gil_scoped_acquire acquire;
+        size_t size = msgs.size();
+        py::list pyMsg(size);
+        if (has_stream_deser) {
+            for (size_t i = 0; i < size; ++i) {
+                py::list row = Converter::toPython_Old(msgs[i]);
+                row.append(msgs[i].getSymbol());
+                pyMsg[i] = row;
+            }
+        } else {
+            for (size_t i = 0; i < size; ++i) {
+                pyMsg[i] = Converter::toPython_Old(msgs[i]);
+            }
+        }
+        if (msg_as_table && !has_stream_deser) {
+            handler(pyMsg[0]);
+        } else {
+            handler(pyMsg);
+        }
+        commit(msgs.back());
+    };
+}
+
+
+// Signature of the C functions wrapped by dolphindb.streaming.NativeHandler.
+typedef void (*NativeBatchHandler)(const void **columns, const int *types, int columnCount, long long rows,
+                                   void *userData);
+
+/**
+ * Builds a batch handler calling a C function with the GIL released. The subscription runs
+ * with msgAsTable, so each batch is a single table, and the function receives the data array
+ * of each column with its DATA_TYPE. Columns without a contiguous fixed-width layout (STRING,
+ * SYMBOL, BLOB, array vectors) are passed as NULL.
+ */
+static ddb::MessageBatchHandler makeNativeHandler(const py::object &native_handler) {
+    auto addresses = py::cast<std::pair<uintptr_t, uintptr_t>>(native_handler);
+    auto func = reinterpret_cast<NativeBatchHandler>(addresses.first);
+    auto user_data = reinterpret_cast<void *>(addresses.second);
+    return [func, user_data](const std::vector<ddb::Message> &msgs) {
+        if (!msgs[0]->isTable()) {
+            throw std::runtime_error("NativeHandler requires the column names of the subscribed table");
+        }
+        ddb::TableSP table = msgs[0];
+        const int column_count = table->columns();
+        std::vector<const void *> columns(column_count);
+        std::vector<int> types(column_count);
+        for (int i = 0; i < column_count; ++i) {
+            ddb::VectorSP col = table->getColumn(i);
+            types[i] = col->getType();
+            bool contiguous = col->isFastMode() && col->getCategory() != ddb::LITERAL &&
+                              col->getType() < ddb::ARRAY_TYPE_BASE;
+            columns[i] = contiguous ? col->getDataArray() : nullptr;
+        }
+        func(columns.data(), types.data(), column_count, table->rows(), user_data);
+    };
+}
+
+
 class EXPORT_DECL PyThreadedClient : public PyStreamingClient {
 
 private:
@@ -1339,6 +1690,8 @@ public:
         const long long offset = py::cast<long long>(config["offset"]);
         const bool resub = py::cast<bool>(config["resub"]);
         const bool msg_as_table = py::cast<bool>(config["msg_as_table"]);
+        const std::string msg_format = py::cast<std::string>(config["msg_format"]);
+        const bool columnar = msg_format != "rows";
         const bool has_stream_deser = !config["stream_deserializer"].is_none();
         const std::vector<std::string> backup_sites = config["backup_sites"].is_none()
                                                           ? std::vector<std::string>()
@@ -1359,37 +1712,23 @@ public:
             ddb_filter = (ddb::VectorSP)ddb_str_filter;
         }
         if (hasTopic(topic)) { throw std::runtime_error("subscription " + topic + " already exists"); }
+        setClientFilterImpl(*client_, host, port, tableName, actionName, config);
+        // subscribe takes the filter, so this only removes it if the subscription failed before that
+        Defer dropClientFilter([&]() { client_->setClientFilter(host, port, tableName, actionName, nullptr); });
         py::object handler = config["handler"];
+        py::object checkpoint = config["checkpoint"];
+        py::object native_handler = config["native_handler"];
+        const bool native = !native_handler.is_none();
 
         if (batch_size > 0) {
-            ddb::MessageBatchHandler ddbHanlder = [handler, msg_as_table,
-                                                   has_stream_deser](const std::vector<ddb::Message> &msgs) {
-                // handle GIL
-                py::gil_scoped_acquire acquire;
-                size_t size = msgs.size();
-                py::list pyMsg(size);
-                if (has_stream_deser) {
-                    for (size_t i = 0; i < size; ++i) {
-                        py::list row = Converter::toPython_Old(msgs[i]);
-                        row.append(msgs[i].getSymbol());
-                        pyMsg[i] = row;
-                    }
-                } else {
-                    for (size_t i = 0; i < size; ++i) {
-                        pyMsg[i] = Converter::toPython_Old(msgs[i]);
-                    }
-                }
-                if (msg_as_table && !has_stream_deser) {
-                    handler(pyMsg[0]);
-                } else {
-                    handler(pyMsg);
-                }
-            };
+            ddb::MessageBatchHandler ddbHanlder = native
+                ? makeNativeHandler(native_handler)
+                : makeBatchHandler(handler, msg_as_table, stream_deser_ptr, msg_format, checkpoint);
             TRY
             std::vector<ddb::ThreadSP> threads;
             ddb::ThreadSP thread = client_->subscribe(
                 host, port, ddbHanlder, tableName, actionName, offset, resub, ddb_filter, false, batch_size, throttle,
-                msg_as_table, userName, passWord, stream_deser_ptr, backup_sites, resub_timeout, sub_once);
+                msg_as_table || native || (columnar && !has_stream_deser), userName, passWord, stream_deser_ptr, backup_sites, resub_timeout, sub_once);
             threads.push_back(thread);
             topicThread_[topic] = threads;
             CATCH_EXCEPTION("<Exception> in subscribe: ")
@@ -1397,7 +1736,10 @@ public:
             if (msg_as_table) {
                 throw py::value_error("msg_as_table must be False when batch_size is 0");
             }
-            ddb::MessageHandler ddbHanlder = [handler, has_stream_deser](const ddb::Message &msg) {
+            if (columnar) {
+                throw py::value_error("msg_format must be 'rows' when batch_size is 0");
+            }
+            ddb::MessageHandler ddbHanlder = [handler, has_stream_deser, checkpoint](const ddb::Message &msg) {
                 // handle GIL
                 py::gil_scoped_acquire acquire;
                 py::list row = Converter::toPython_Old(msg);
@@ -1405,6 +1747,9 @@ public:
                     row.append(msg.getSymbol());
                 }
                 handler(row);
+                if (!checkpoint.is_none() && msg.getOffset() >= 0) {
+                    checkpoint(msg.getOffset());
+                }
             };
             TRY
             std::vector<ddb::ThreadSP> threads;
@@ -1426,6 +1771,9 @@ public:
             this->client_->unsubscribe(host_, port_, tableName_, actionName_);
         });
     }
+    py::dict getStats() {
+        return getStatsImpl(*client_);
+    }
 }; // class PyThreadedClient
 
 
@@ -1455,10 +1803,13 @@ public:
         const std::string passWord = py::cast<std::string>(config["password"]);
         const std::string topic = concatTopic(host, port, tableName, actionName);
         const int batch_size = py::cast<int>(config["batch_size"]);
-        // const double throttle = py::cast<double>(config["throttle"]);
+        const double throttle = py::cast<double>(config["throttle"]);
+        const std::string key_column = py::cast<std::string>(config["key_column"]);
         const long long offset = py::cast<long long>(config["offset"]);
         const bool resub = py::cast<bool>(config["resub"]);
         const bool msg_as_table = py::cast<bool>(config["msg_as_table"]);
+        const std::string msg_format = py::cast<std::string>(config["msg_format"]);
+        const bool columnar = msg_format != "rows";
         const bool has_stream_deser = !config["stream_deserializer"].is_none();
         const std::vector<std::string> backup_sites = config["backup_sites"].is_none()
                                                           ? std::vector<std::string>()
@@ -1479,16 +1830,38 @@ public:
             ddb_filter = (ddb::VectorSP)ddb_str_filter;
         }
         if (hasTopic(topic)) { throw std::runtime_error("subscription " + topic + " already exists"); }
+        setClientFilterImpl(*client_, host, port, tableName, actionName, config);
+        // subscribe takes the filter, so this only removes it if the subscription failed before that
+        Defer dropClientFilter([&]() { client_->setClientFilter(host, port, tableName, actionName, nullptr); });
         py::object handler = config["handler"];
+        py::object checkpoint = config["checkpoint"];
+        py::object native_handler = config["native_handler"];
+        const bool native = !native_handler.is_none();
 
         if (batch_size > 0) {
-            throw std::runtime_error("Thread pool streaming doesn't support batch subscribe");
+            ddb::MessageBatchHandler ddbHanlder = native
+                ? makeNativeHandler(native_handler)
+                : makeBatchHandler(handler, msg_as_table, stream_deser_ptr, msg_format, checkpoint);
+            TRY
+            std::vector<ddb::ThreadSP> threads;
+            threads = client_->subscribe(
+                host, port, ddbHanlder, tableName, actionName, offset, resub, ddb_filter, false, batch_size, throttle,
+                msg_as_table || native || (columnar && !has_stream_deser), userName, passWord, stream_deser_ptr, backup_sites, resub_timeout, sub_once, key_column);
+            topicThread_[topic] = threads;
+            CATCH_EXCEPTION("<Exception> in subscribe: ")
+            return topic;
+        }
+        if (!key_column.empty()) {
+            throw py::value_error("key_column requires batch_size to be greater than 0");
         }
 
         if (msg_as_table) {
             throw py::value_error("msg_as_table must be False when batch_size is 0");
         }
-        ddb::MessageHandler ddbHanlder = [handler, has_stream_deser](const ddb::Message &msg) {
+        if (columnar) {
+            throw py::value_error("msg_format must be 'rows' when batch_size is 0");
+        }
+        ddb::MessageHandler ddbHanlder = [handler, has_stream_deser, checkpoint](const ddb::Message &msg) {
             // handle GIL
             py::gil_scoped_acquire acquire;
             py::list row = Converter::toPython_Old(msg);
@@ -1496,6 +1869,9 @@ public:
                 row.append(msg.getSymbol());
             }
             handler(row);
+            if (!checkpoint.is_none() && msg.getOffset() >= 0) {
+                checkpoint(msg.getOffset());
+            }
         };
         TRY
         std::vector<ddb::ThreadSP> threads;
@@ -1515,9 +1891,175 @@ public:
             this->client_->unsubscribe(host_, port_, tableName_, actionName_);
         });
     }
+    py::dict getStats() {
+        return getStatsImpl(*client_);
+    }
 }; // class PyThreadPooledClient
 
 
+/**
+ * Pull side of a PollingClient subscription. Messages stay in the bounded C++ queue until
+ * the consumer polls them, so a slow consumer blocks the receiving thread instead of piling
+ * up Python objects.
+ */
+class EXPORT_DECL PyMessageQueue {
+public:
+    PyMessageQueue(const ddb::MessageQueueSP &queue, bool msgAsTable, bool hasStreamDeser)
+        : queue_(queue), msgAsTable_(msgAsTable), hasStreamDeser_(hasStreamDeser), finished_(false) {}
+    /**
+     * Pops up to batchSize messages, waiting at most timeout milliseconds (-1: no limit) for the first one.
+     * Returns None if no message arrived in time or the subscription has ended.
+     */
+    py::object poll(int batchSize, int timeout) {
+        if (finished_) return py::none();
+        std::vector<ddb::Message> msgs;
+        bool ended = false;
+        {
+            py::gil_scoped_release release;
+            ddb::Message msg;
+            bool available = queue_->poll(msg, timeout);
+            while (available) {
+                if (msg.isNull()) {
+                    ended = true;
+                    break;
+                }
+                msgs.push_back(msg);
+                if ((int)msgs.size() >= batchSize) break;
+                available = queue_->poll(msg, 0);
+            }
+        }
+        if (ended) finished_ = true;
+        if (msgs.empty()) return py::none();
+        if (msgAsTable_) {
+            if (!msgs[0]->isTable()) {
+                throw std::runtime_error("<Exception> in poll: the column names of the subscribed table are unavailable");
+            }
+            ddb::mergeTable(msgs[0], std::vector<ddb::Message>(msgs.begin() + 1, msgs.end()));
+            return Converter::toPython_Old(msgs[0]);
+        }
+        py::list pyMsg(msgs.size());
+        for (size_t i = 0; i < msgs.size(); ++i) {
+            py::list row = Converter::toPython_Old(msgs[i]);
+            if (hasStreamDeser_) {
+                row.append(msgs[i].getSymbol());
+            }
+            pyMsg[i] = row;
+        }
+        return pyMsg;
+    }
+    bool finished() const { return finished_; }
+    size_t size() { return queue_->size(); }
+
+private:
+    ddb::MessageQueueSP queue_;
+    bool msgAsTable_;
+    bool hasStreamDeser_;
+    bool finished_;
+}; // class PyMessageQueue
+
+
+class EXPORT_DECL PyPollingClient : public PyStreamingClient {
+
+private:
+    ddb::SmartPointer<ddb::PollingClient> client_;
+    std::unordered_map<std::string, ddb::MessageQueueSP> queues_;
+
+public:
+    PyPollingClient(py::dict config) {
+        const int listeningPort = py::cast<int>(config["port"]);
+        client_ = new ddb::PollingClient(listeningPort);
+    }
+    ~PyPollingClient() override {
+        clearAllSubscribeImpl([this](std::string host, int port, std::string tableName, std::string actionName) {
+            this->unsubscribeQueue(host, port, tableName, actionName);
+        });
+    }
+    std::pair<std::string, PyMessageQueue> subscribe(const py::dict &config) {
+        ddb::LockGuard<ddb::Mutex> lockGuard(&mutex_);
+        const std::string host = py::cast<std::string>(config["host"]);
+        const int port = py::cast<int>(config["port"]);
+        const std::string tableName = py::cast<std::string>(config["table_name"]);
+        const std::string actionName = py::cast<std::string>(config["action_name"]);
+        const std::string userName = py::cast<std::string>(config["userid"]);
+        const std::string passWord = py::cast<std::string>(config["password"]);
+        const std::string topic = concatTopic(host, port, tableName, actionName);
+        const long long offset = py::cast<long long>(config["offset"]);
+        const bool resub = py::cast<bool>(config["resub"]);
+        const bool msg_as_table = py::cast<bool>(config["msg_as_table"]);
+        const bool has_stream_deser = !config["stream_deserializer"].is_none();
+        const std::vector<std::string> backup_sites = config["backup_sites"].is_none()
+                                                          ? std::vector<std::string>()
+                                                          : py::cast<std::vector<std::string>>(config["backup_sites"]);
+        const int resub_timeout = py::cast<int>(config["resubscribe_interval"]);
+        const bool sub_once = py::cast<bool>(config["sub_once"]);
+        ddb::SmartPointer<ddb::StreamDeserializer> stream_deser_ptr;
+        if (has_stream_deser) {
+            stream_deser_ptr = config["stream_deserializer"].cast<PyStreamDeserializer>().get();
+        }
+        ddb::VectorSP ddb_filter;
+        if (py::isinstance<py::array>(config["filter"])) {
+            py::array arr_filter = py::cast<py::array>(config["filter"]);
+            ddb_filter = arr_filter.size() ? Converter::toDolphinDB(arr_filter) : nullptr;
+        } else if (py::isinstance<py::str>(config["filter"])) {
+            std::string str_filter = py::str(config["filter"]);
+            ddb::ConstantSP ddb_str_filter = new ddb::String(str_filter);
+            ddb_filter = (ddb::VectorSP)ddb_str_filter;
+        }
+        if (hasTopic(topic)) { throw std::runtime_error("subscription " + topic + " already exists"); }
+        setClientFilterImpl(*client_, host, port, tableName, actionName, config);
+        // subscribe takes the filter, so this only removes it if the subscription failed before that
+        Defer dropClientFilter([&]() { client_->setClientFilter(host, port, tableName, actionName, nullptr); });
+        ddb::MessageQueueSP queue;
+        TRY
+        queue = client_->subscribe(host, port, tableName, actionName, offset, resub, ddb_filter, msg_as_table, false,
+                                   userName, passWord, stream_deser_ptr, backup_sites, resub_timeout, sub_once);
+        CATCH_EXCEPTION("<Exception> in subscribe: ")
+        topicThread_[topic] = std::vector<ddb::ThreadSP>();
+        queues_[topic] = queue;
+        return std::make_pair(topic, PyMessageQueue(queue, msg_as_table, has_stream_deser));
+    }
+    void unsubscribe(
+        const std::string &host,
+        const int &port,
+        const std::string &tableName,
+        const std::string &actionName) {
+        unsubscribeImpl(host, port, tableName, actionName, [this](std::string host_, int port_, std::string tableName_, std::string actionName_) {
+            this->unsubscribeQueue(host_, port_, tableName_, actionName_);
+        });
+    }
+    py::dict getStats() {
+        return getStatsImpl(*client_);
+    }
+
+private:
+    void unsubscribeQueue(const std::string &host, int port, const std::string &tableName, const std::string &actionName) {
+        const std::string topic = concatTopic(host, port, tableName, actionName);
+        ddb::MessageQueueSP queue = queues_[topic];
+        queues_.erase(topic);
+        // The end marker pushed by unsubscribe blocks while the queue is full, so the pending
+        // messages are discarded concurrently and the marker is pushed again afterwards.
+        std::atomic<bool> done(false);
+        ddb::ThreadSP drainer = new ddb::Thread(new ddb::Executor([queue, &done]() {
+            ddb::Message msg;
+            while (!done) {
+                queue->poll(msg, 100);
+            }
+        }));
+        drainer->start();
+        try {
+            client_->unsubscribe(host, port, tableName, actionName);
+        } catch (...) {
+            done = true;
+            drainer->join();
+            throw;
+        }
+        done = true;
+        drainer->join();
+        queue->push(ddb::Message());
+    }
+}; // class PyPollingClient
+
+
 class EXPORT_DECL PyEventClient : public PyStreamingClient {
 public:
     PyEventClient(
@@ -1546,19 +2088,32 @@ public:
         const long long &offset,
         const bool &resub,
         const std::string &userName,
-        const std::string &passWord) {
+        const std::string &passWord,
+        int batchSize,
+        double throttle,
+        bool asFrames) {
         ddb::LockGuard<ddb::Mutex> lockGuard(&mutex_);
         std::string topic = concatTopic(host, port, tableName, actionName);
         if (hasTopic(topic)) { throw std::runtime_error("subscription " + topic + " already exists"); }
-        ddb::EventMessageHandler ddbHanlder = [handler, this](const std::string &name, const std::vector<ddb::ConstantSP> &attributes) {
-            // handle GIL
-            py::gil_scoped_acquire acquire;
-            ddb::SmartPointer<PyEventScheme> pyScheme = this->schemeMap_[name];
-            handler(pyScheme->createEvent(attributes));
-        };
         TRY
         std::vector<ddb::ThreadSP> threads;
-        threads.push_back(client_->subscribe(host, port, ddbHanlder, tableName, actionName, offset, resub, userName, passWord));
+        if (batchSize > 0) {
+            ddb::EventMessageBatchHandler ddbHandler = [handler, asFrames, this](std::vector<std::string> &names, std::vector<std::vector<ddb::ConstantSP>> &attributes) {
+                // handle GIL
+                py::gil_scoped_acquire acquire;
+                handler(asFrames ? py::object(createFrames(names, attributes)) : py::object(createEvents(names, attributes)));
+            };
+            threads.push_back(client_->subscribe(host, port, ddbHandler, tableName, actionName, offset, resub, userName, passWord, batchSize, throttle));
+        }
+        else {
+            ddb::EventMessageHandler ddbHanlder = [handler, this](const std::string &name, const std::vector<ddb::ConstantSP> &attributes) {
+                // handle GIL
+                py::gil_scoped_acquire acquire;
+                ddb::SmartPointer<PyEventScheme> pyScheme = this->schemeMap_[name];
+                handler(pyScheme->createEvent(attributes));
+            };
+            threads.push_back(client_->subscribe(host, port, ddbHanlder, tableName, actionName, offset, resub, userName, passWord));
+        }
         topicThread_[topic] = threads;
         CATCH_EXCEPTION("<Exception> in subscribe: ")
     }
@@ -1571,7 +2126,54 @@ public:
             this->client_->unsubscribe(host_, port_, tableName_, actionName_);
         });
     }
+    py::dict getStats() {
+        return getStatsImpl(*client_);
+    }
 private:
+    py::list createEvents(const std::vector<std::string> &names, const std::vector<std::vector<ddb::ConstantSP>> &attributes) {
+        py::list events(names.size());
+        for (size_t i = 0; i < names.size(); ++i) {
+            events[i] = schemeMap_[names[i]]->createEvent(attributes[i]);
+        }
+        return events;
+    }
+    // build one DataFrame per event type column by column, instead of an Event object per row
+    py::dict createFrames(const std::vector<std::string> &names, const std::vector<std::vector<ddb::ConstantSP>> &attributes) {
+        std::map<std::string, std::vector<size_t>> rowsByName;
+        for (size_t i = 0; i < names.size(); ++i) {
+            rowsByName[names[i]].push_back(i);
+        }
+        py::dict frames;
+        for (auto &item : rowsByName) {
+            const std::vector<size_t> &rows = item.second;
+            const ddb::EventSchema &scheme = schemeMap_[item.first]->scheme();
+            std::vector<ddb::ConstantSP> columns;
+            for (size_t field = 0; field < scheme.fieldNames_.size(); ++field) {
+                const ddb::ConstantSP &first = attributes[rows[0]][field];
+                ddb::DATA_TYPE type = first->getType();
+                ddb::VectorSP column;
+                if (first->isScalar() && type != ddb::DT_ANY) {
+                    column = ddb::Util::createVector(type, 0, rows.size(), true, first->getExtraParamForType());
+                }
+                else if (first->isVector() && type < ddb::ARRAY_TYPE_BASE && ddb::Util::getCategory(type) != ddb::LITERAL) {
+                    column = ddb::Util::createArrayVector((ddb::DATA_TYPE)(type + ddb::ARRAY_TYPE_BASE), 0, rows.size(), true, first->getExtraParamForType());
+                }
+                else {
+                    column = ddb::Util::createVector(ddb::DT_ANY, 0, rows.size());
+                }
+                for (size_t row : rows) {
+                    if (!column->append(attributes[row][field])) {
+                        throw std::runtime_error("Failed to build the column " + scheme.fieldNames_[field] + " of event " + item.first + ".");
+                    }
+                }
+                columns.push_back(column);
+            }
+            ddb::TableSP table = ddb::Util::createTable(scheme.fieldNames_, columns);
+            frames[py::str(item.first)] = Converter::toPython_Old(table);
+        }
+        return frames;
+    }
+
     std::map<std::string, ddb::SmartPointer<PyEventScheme>> schemeMap_;
     ddb::SmartPointer<ddb::EventClient> client_;
 };
@@ -1663,7 +2265,8 @@ PYBIND11_MODULE(_dolphindbcpp, m) {
             py::arg("pickleTableToList") = py::none(),
             py::arg("priority") = py::none(),
             py::arg("parallelism") = py::none(),
-            py::arg("disableDecimal") = py::none()
+            py::arg("disableDecimal") = py::none(),
+            py::arg("callback") = py::none()
         )
         .def("isFinished",(bool(DBConnectionPoolImpl::*)(int)) & DBConnectionPoolImpl::isFinished)
         .def("getData",(py::object(DBConnectionPoolImpl::*)(int)) & DBConnectionPoolImpl::getData)
@@ -1678,19 +2281,20 @@ PYBIND11_MODULE(_dolphindbcpp, m) {
         .def("run", &PyDBConnection::run, py::arg("script"), py::kw_only(), py::arg("clearMemory") = py::none(),
              py::arg("pickleTableToList") = py::none(), py::arg("priority") = py::none(),
              py::arg("parallelism") = py::none(), py::arg("disableDecimal") = py::none(),
-             py::arg("withTableSchema") = py::none())
+             py::arg("withTableSchema") = py::none(), py::arg("symbolAsCategory") = py::none())
         .def("exec", &PyDBConnection::exec, py::arg("script"), py::kw_only(), py::arg("clearMemory") = py::none(),
              py::arg("pickleTableToList") = py::none(), py::arg("priority") = py::none(),
              py::arg("parallelism") = py::none(), py::arg("disableDecimal") = py::none(),
-             py::arg("withTableSchema") = py::none())
+             py::arg("withTableSchema") = py::none(), py::arg("symbolAsCategory") = py::none())
         .def("call", &PyDBConnection::call, py::arg("script"), py::kw_only(), py::arg("clearMemory") = py::none(),
              py::arg("pickleTableToList") = py::none(), py::arg("priority") = py::none(),
              py::arg("parallelism") = py::none(), py::arg("disableDecimal") = py::none(),
-             py::arg("withTableSchema") = py::none())
+             py::arg("withTableSchema") = py::none(), py::arg("symbolAsCategory") = py::none())
         .def("runBlock", &PyDBConnection::runBlock, py::arg("script"), py::kw_only(),
              py::arg("clearMemory") = py::none(), py::arg("fetchSize") = py::none(), py::arg("priority") = py::none(),
              py::arg("parallelism") = py::none())
         .def("upload", &PyDBConnection::upload)
+        .def("runPipeline", &PyDBConnection::runPipeline, py::arg("requests"), py::arg("maxInFlight"))
         // .def_static("disableJobCancellation", &SessionImpl::disableJobCancellation)
         .def_static("enableJobCancellation", &PyDBConnection::enableJobCancellation)
         .def_static("setTimeout", &PyDBConnection::setTimeout)
@@ -1713,8 +2317,13 @@ PYBIND11_MODULE(_dolphindbcpp, m) {
         .def("hasNext", (py::bool_(BlockReader::*)())&BlockReader::hasNext);
 
     py::class_<PartitionedTableAppender>(m, "partitionedTableAppender")
-        .def(py::init<const std::string &,const std::string &,const std::string &,DBConnectionPoolImpl&>())
-        .def("append", &PartitionedTableAppender::append);
+        // the schema is fetched on the pool, whose workers may need the GIL for append_async callbacks
+        .def(py::init<const std::string &,const std::string &,const std::string &,DBConnectionPoolImpl&>(),
+             py::call_guard<py::gil_scoped_release>())
+        .def("append", &PartitionedTableAppender::append)
+        .def("appendAsync", &PartitionedTableAppender::appendAsync)
+        .def("getResult", &PartitionedTableAppender::getResult)
+        .def("setCallback", &PartitionedTableAppender::setCallback);
 
     py::class_<AutoFitTableAppender>(m, "autoFitTableAppender")
         .def(py::init<const std::string &, const std::string&, PyDBConnection&>())
@@ -1740,6 +2349,7 @@ PYBIND11_MODULE(_dolphindbcpp, m) {
         .def("getStatus", &MultithreadedTableWriter::getStatus)
         .def("getUnwrittenData", &MultithreadedTableWriter::getUnwrittenData)
         .def("insert", &MultithreadedTableWriter::insert)
+        .def("insertBatch", &MultithreadedTableWriter::insertBatch)
         .def("insertUnwrittenData", &MultithreadedTableWriter::insertUnwrittenData)
         .def("waitForThreadCompletion", &MultithreadedTableWriter::waitForThreadCompletion);
 
@@ -1753,25 +2363,41 @@ PYBIND11_MODULE(_dolphindbcpp, m) {
 
     py::class_<PyEventSender>(m, "EventSender")
         .def(py::init<PyDBConnection&, const std::string&, const py::list&, const std::vector<std::string>&, const std::vector<std::string>&>())
-        .def("sendEvent", &PyEventSender::sendEvent);
+        .def("sendEvent", &PyEventSender::sendEvent)
+        .def("sendEvents", &PyEventSender::sendEvents);
 
     py::class_<PyEventClient>(m, "EventClient")
         .def(py::init<const py::list &, const std::vector<std::string> &, const std::vector<std::string> &>())
         .def("subscribe", &PyEventClient::subscribe)
         .def("unsubscribe", &PyEventClient::unsubscribe)
-        .def("getSubscriptionTopics", &PyEventClient::getSubscriptionTopics);
+        .def("getSubscriptionTopics", &PyEventClient::getSubscriptionTopics)
+        .def("getStats", &PyEventClient::getStats);
 
     py::class_<PyThreadedClient>(m, "ThreadedClient")
         .def(py::init<py::dict>())
         .def("subscribe", &PyThreadedClient::subscribe)
         .def("unsubscribe", &PyThreadedClient::unsubscribe)
-        .def("getSubscriptionTopics", &PyThreadedClient::getSubscriptionTopics);
+        .def("getSubscriptionTopics", &PyThreadedClient::getSubscriptionTopics)
+        .def("getStats", &PyThreadedClient::getStats);
 
     py::class_<PyThreadPooledClient>(m, "ThreadPooledClient")
         .def(py::init<py::dict>())
         .def("subscribe", &PyThreadPooledClient::subscribe)
         .def("unsubscribe", &PyThreadPooledClient::unsubscribe)
-        .def("getSubscriptionTopics", &PyThreadPooledClient::getSubscriptionTopics);
+        .def("getSubscriptionTopics", &PyThreadPooledClient::getSubscriptionTopics)
+        .def("getStats", &PyThreadPooledClient::getStats);
+
+    py::class_<PyMessageQueue>(m, "MessageQueue")
+        .def("poll", &PyMessageQueue::poll)
+        .def("size", &PyMessageQueue::size)
+        .def_property_readonly("finished", &PyMessageQueue::finished);
+
+    py::class_<PyPollingClient>(m, "PollingClient")
+        .def(py::init<py::dict>())
+        .def("subscribe", &PyPollingClient::subscribe)
+        .def("unsubscribe", &PyPollingClient::unsubscribe)
+        .def("getSubscriptionTopics", &PyPollingClient::getSubscriptionTopics)
+        .def("getStats", &PyPollingClient::getStats);
 
 #ifdef VERSION_INFO
     m.attr("__version__") = VERSION_INFO;
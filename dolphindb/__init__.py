@@ -8,12 +8,14 @@ from .appender import (
     TableUpserter,
     TableUpserter as tableUpsert,
 )
+from .async_session import AsyncSession
 from .connection_pool import (
     DBConnectionPool,
     SimpleDBConnectionPool,
     SimpleDBConnectionPoolConfig,
 )
 from .database import Database
+from .fanout import FanoutPublisher, FanoutReader
 from .config import (
     ConnectionSetting,
     ConnectionConfig,
@@ -21,21 +23,32 @@ from .config import (
 from .connection import (
     BlockReader,
     DBConnection,
+    Pipeline,
+    PreparedStatement,
 )
 from .session import (
     Session,
     Session as session,
 )
 from .streaming import (
+    AsyncMessageIterator,
+    CheckpointStore,
+    FileCheckpointStore,
+    MessageIterator,
+    NativeHandler,
+    PollingClient,
+    PollingSubscriptionConfig,
     StreamDeserializer,
     StreamDeserializer as streamDeserializer,
     StreamingClient,
     StreamingClientConfig,
     SubscriptionConfig,
+    SubscriptionStat,
     ThreadedClient,
     ThreadedStreamingClientConfig,
     ThreadPooledClient,
     ThreadPooledStreamingClientConfig,
+    ThreadPooledSubscriptionConfig,
 )
 from .table import (
     Counter,
@@ -83,12 +96,15 @@ name = "dolphindb"
 __all__ = [
     "Session", "session",
     "DBConnection",
+    "AsyncSession",
     "ConnectionSetting",
     "ConnectionConfig",
     "DBConnectionPool",
     "SimpleDBConnectionPool",
     "SimpleDBConnectionPoolConfig",
     "BlockReader",
+    "Pipeline",
+    "PreparedStatement",
     "PartitionedTableAppender",
     "AutoFitTableAppender", "TableAppender", "tableAppender",
     "AutoFitTableUpserter", "TableUpserter", "tableUpsert",
@@ -101,10 +117,21 @@ __all__ = [
     "StreamingClient",
     "StreamingClientConfig",
     "SubscriptionConfig",
+    "SubscriptionStat",
     "ThreadedClient",
     "ThreadedStreamingClientConfig",
     "ThreadPooledClient",
     "ThreadPooledStreamingClientConfig",
+    "ThreadPooledSubscriptionConfig",
+    "PollingClient",
+    "PollingSubscriptionConfig",
+    "MessageIterator",
+    "AsyncMessageIterator",
+    "NativeHandler",
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "FanoutPublisher",
+    "FanoutReader",
     "Table",
     "TableUpdate",
     "TableDelete",
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 from enum import Enum
 
 
@@ -43,3 +43,4 @@ def dump(obj: Any, file, *, types=None) -> None: ...
 def load(file) -> Any: ...
 def dumps(obj: Any, *, types=None) -> bytes: ...
 def loads(data: bytes) -> Any: ...
+def try_loads(data, offset: int = 0, *, table_to_list: bool = False) -> Optional[Tuple[Any, int]]: ...
@@ -1,3 +1,5 @@
+from concurrent.futures import Future
+
 from pandas import DataFrame
 
 from ._core import DolphinDBRuntime
@@ -244,3 +246,31 @@ class PartitionedTableAppender(object):
         if self.pool.is_shutdown():
             raise RuntimeError("DBConnectionPool has been shut down.")
         return self.appender.append(table)
+
+    def append_async(self, table: DataFrame) -> Future:
+        """Append data without waiting for the write to complete.
+
+        The data is converted and dispatched to the connection pool before this method
+        returns, so the caller can prepare the next batch while the current one is being written.
+
+        Args:
+            table : data to be written.
+
+        Returns:
+            concurrent.futures.Future object whose result is the number of rows written.
+        """
+        if self.pool.is_shutdown():
+            raise RuntimeError("DBConnectionPool has been shut down.")
+        appender = self.appender
+        tasks = appender.appendAsync(table)
+        future = Future()
+
+        def on_finished():
+            # called from a worker thread of the pool once all sub-tables are written or failed
+            try:
+                future.set_result(appender.getResult(tasks))
+            except Exception as ex:
+                future.set_exception(ex)
+
+        appender.setCallback(tasks, on_finished)
+        return future
@@ -0,0 +1,383 @@
+import asyncio
+from typing import overload
+
+from ._core import DolphinDBRuntime
+from ._hints import Any, Dict, Literal, Optional, Union
+from .config import ConnectionSetting, organize_config
+from .settings import PROTOCOL_DDB, ParserType
+
+ddbcpp = DolphinDBRuntime()._ddbcpp
+
+
+_READ_CHUNK = 1 << 18
+# a partially received object that stopped growing is decoded again once the socket has been
+# idle this long (in seconds). The interval doubles after each failed attempt, up to the maximum.
+_IDLE_INTERVAL = 0.001
+_MAX_IDLE_INTERVAL = 0.1
+
+
+def _check_priority_parallelism(priority, parallelism):
+    if priority is not None:
+        if not isinstance(priority, int) or priority > 9 or priority < 0:
+            raise RuntimeError("priority must be an integer from 0 to 9")
+    if parallelism is not None:
+        if not isinstance(parallelism, int) or parallelism <= 0:
+            raise RuntimeError("parallelism must be an integer greater than 0")
+
+
+class AsyncSession:
+    """AsyncSession is a DolphinDB connection driven by an asyncio event loop.
+
+    It speaks the same request/response protocol as DBConnection over a non-blocking
+    socket, so a single thread can keep many queries against many servers in flight.
+    Requests on one AsyncSession are executed one after another; open several sessions
+    to run queries concurrently.
+
+    Note:
+        Only PROTOCOL_DDB is supported. SSL, asynchronous (fire-and-forget) mode and
+        encrypted login are not supported, so the username and password are sent in
+        plaintext; only connect with credentials over a trusted network.
+
+    Args:
+        config (Union[ConnectionSetting, dict, None]): Configuration for the connection.
+    """
+    @overload
+    def __init__(
+        self,
+        *,
+        compress: bool = False,
+        parser: Literal["dolphindb", "python", "kdb"] = "dolphindb",
+        show_output: bool = True,
+        sql_std: Literal["dolphindb", "oracle", "mysql"] = "dolphindb",
+    ): ...
+
+    @overload
+    def __init__(self, /, config: Union[ConnectionSetting, dict] = None, **kwargs): ...
+
+    def __init__(self, /, config: Union[ConnectionSetting, dict] = None, **kwargs):
+        config = organize_config(ConnectionSetting, config, kwargs)
+        if config.enable_ssl:
+            raise RuntimeError("AsyncSession does not support SSL.")
+        if config.enable_async:
+            raise RuntimeError("AsyncSession does not support asynchronous mode.")
+        if config.protocol != PROTOCOL_DDB:
+            raise RuntimeError("AsyncSession only supports PROTOCOL_DDB.")
+        self._config = config
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._session_id = ""
+        self._host = ""
+        self._port = 0
+        self._is_closed = True
+
+    @property
+    def session_id(self) -> str:
+        return self._session_id
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def _request_flag(self, clear_memory: bool = False, disable_decimal: bool = False) -> int:
+        flag = 32
+        if clear_memory:
+            flag += 16
+        if self._config.compress:
+            flag += 64
+        if self._config.parser == ParserType.Python:
+            flag += 2048
+        elif self._config.parser == ParserType.Kdb:
+            flag += 4096
+        flag += self._config.sql_std.value << 19
+        if disable_decimal:
+            flag += 1 << 23
+        return flag
+
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        userid: str = None,
+        password: str = None,
+        *,
+        startup: str = None,
+        enable_encryption: bool = False,
+    ) -> bool:
+        """Connect to a DolphinDB server.
+
+        Args:
+            host : server address.
+            port : port name.
+            userid : username. Defaults to None.
+            password : password. Defaults to None.
+
+        Kwargs:
+            startup : the startup script to execute after the connection is established. Defaults to None.
+            enable_encryption : whether to encrypt the username and password. True is not supported
+                and raises an exception, as the login message is sent in plaintext. Defaults to False.
+
+        Returns:
+            True if the connection is successful, otherwise raise an exception.
+        """
+        if enable_encryption and userid:
+            raise RuntimeError("AsyncSession does not support encrypted login.")
+        await self.close()
+        self._lock = asyncio.Lock()
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._host = host
+        self._port = port
+        self._is_closed = False
+        body = "connect\n"
+        if userid:
+            body += f"login\n{userid}\n{password or ''}\nfalse"
+        body = body.encode()
+        header = f"API 0 {len(body)} / {self._request_flag()}_1_4_2\n".encode()
+        try:
+            async with self._lock:
+                self._writer.write(header + body)
+                await self._writer.drain()
+                headers = (await self._read_line()).split(" ")
+                if len(headers) != 3:
+                    raise RuntimeError("<Exception> in connect: Received invalid header")
+                if headers[2] == "0":
+                    raise RuntimeError("<Exception> in connect: AsyncSession does not support big-endian servers.")
+                line = await self._read_line()
+                if line != "OK":
+                    raise RuntimeError(f"<Exception> in connect: Server connection response: '{line}'")
+                if int(headers[1]) == 1 and not await self._read_object(False):
+                    raise RuntimeError("<Exception> in connect: Failed to authenticate the user")
+                self._session_id = headers[0]
+        except BaseException:
+            await self.close()
+            raise
+        if startup:
+            await self.exec(startup)
+        return True
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._is_closed:
+            return
+        self._is_closed = True
+        self._session_id = ""
+        writer, self._reader, self._writer = self._writer, None, None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _read_line(self) -> str:
+        line = await self._reader.readuntil(b"\n")
+        return line[:-1].decode()
+
+    async def _read_object(self, table_to_list: bool):
+        # The wire format carries no length prefix, so the buffered bytes are decoded again only
+        # when they have doubled since the last failed attempt, which keeps the total decoding
+        # work linear in the size of the object. An object that stops growing before doubling
+        # is decoded once the socket goes idle. Reads are only timed while the reader's buffer
+        # is drained and undecoded bytes are pending.
+        data = bytearray()
+        attempted = 0
+        idle_interval = _IDLE_INTERVAL
+        drained = False
+        while True:
+            if len(data) > attempted and len(data) >= 2 * attempted:
+                result = ddbcpp.try_loads(data, table_to_list=table_to_list)
+                if result is not None:
+                    return self._check_consumed(result, data)
+                attempted = len(data)
+            if drained and len(data) > attempted:
+                try:
+                    chunk = await asyncio.wait_for(self._reader.read(_READ_CHUNK), idle_interval)
+                except asyncio.TimeoutError:
+                    result = ddbcpp.try_loads(data, table_to_list=table_to_list)
+                    if result is not None:
+                        return self._check_consumed(result, data)
+                    attempted = len(data)
+                    idle_interval = min(idle_interval * 2, _MAX_IDLE_INTERVAL)
+                    continue
+            else:
+                chunk = await self._reader.read(_READ_CHUNK)
+            if not chunk:
+                raise ConnectionResetError("The connection has been closed by the server.")
+            # a short read means that the reader's buffer has been emptied
+            drained = len(chunk) < _READ_CHUNK
+            data += chunk
+
+    @staticmethod
+    def _check_consumed(result, data: bytearray):
+        obj, consumed = result
+        if consumed != len(data):
+            raise RuntimeError("Received unexpected data after the response object.")
+        return obj
+
+    async def _request(self, api: str, body: str, args, *, script: str, clear_memory: bool = False,
+                       table_to_list: bool = False, priority: int = 4, parallelism: int = 64,
+                       disable_decimal: bool = False):
+        if self._is_closed:
+            raise RuntimeError(
+                "Couldn't send script/function to the remote host because the connection has been closed"
+            )
+        payload = [ddbcpp.dumps(arg) for arg in args]
+        body = body.encode()
+        flag = self._request_flag(clear_memory, disable_decimal)
+        header = f"API2 {self._session_id} {len(body)} / {flag}_1_{priority}_{parallelism}\n".encode()
+        async with self._lock:
+            completed = False
+            try:
+                self._writer.write(header + body)
+                self._writer.writelines(payload)
+                await self._writer.drain()
+                line = await self._read_line()
+                while line == "MSG":
+                    msg = await self._reader.readuntil(b"\0")
+                    if self._config.show_output:
+                        print(msg[:-1].decode())
+                    line = await self._read_line()
+                headers = line.split(" ")
+                if len(headers) != 3:
+                    raise RuntimeError(f"<Exception> in {api}: Received invalid header: {line}")
+                self._session_id = headers[0]
+                line = await self._read_line()
+                if line != "OK":
+                    completed = True
+                    raise RuntimeError(f"<Exception> in {api}: Server Response: '{line}' script: {script}")
+                result = None
+                if int(headers[1]) != 0:
+                    result = await self._read_object(table_to_list)
+                completed = True
+                return result
+            except (asyncio.IncompleteReadError, ConnectionError, OSError) as ex:
+                raise RuntimeError(f"<Exception> in {api}: {ex}") from ex
+            finally:
+                if not completed:
+                    # the stream is out of sync after a failed or cancelled request
+                    await self.close()
+
+    async def exec(
+        self,
+        script: str,
+        *,
+        clear_memory: bool = False,
+        table_to_list: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+        disable_decimal: bool = False,
+    ) -> Any:
+        """Execute script.
+
+        Args:
+            script : DolphinDB script to be executed.
+
+        Kwargs:
+            clear_memory : whether to release variables after queries.
+                True means to release, otherwise False. Defaults to False.
+            table_to_list : whether to convert table to list or DataFrame.
+                True: to list, False: to DataFrame.  Defaults to False.
+            priority : a job priority system with 10 priority levels (0 to 9). Defaults to 4.
+            parallelism : the maximum number of threads to execute a job's tasks
+                simultaneously on a data node. Defaults to 64.
+            disable_decimal: whether to convert decimal to double in the result
+                table. True: convert to double, False: return as is. Defaults to False.
+
+        Returns:
+            execution result.
+        """
+        _check_priority_parallelism(priority, parallelism)
+        return await self._request(
+            "exec", "script\n" + script, (),
+            script=script,
+            clear_memory=clear_memory,
+            table_to_list=table_to_list,
+            priority=priority,
+            parallelism=parallelism,
+            disable_decimal=disable_decimal,
+        )
+
+    async def call(
+        self,
+        func: str,
+        *args,
+        clear_memory: bool = False,
+        table_to_list: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+        disable_decimal: bool = False,
+    ) -> Any:
+        """Execute function.
+
+        Args:
+            func : DolphinDB function name to be executed.
+            args : arguments to be passed to the function.
+
+        Kwargs:
+            clear_memory : whether to release variables after queries.
+                True means to release, otherwise False. Defaults to False.
+            table_to_list : whether to convert table to list or DataFrame.
+                True: to list, False: to DataFrame.  Defaults to False.
+            priority : a job priority system with 10 priority levels (0 to 9). Defaults to 4.
+            parallelism : the maximum number of threads to execute a job's tasks
+                simultaneously on a data node. Defaults to 64.
+            disable_decimal: whether to convert decimal to double in the result
+                table. True: convert to double, False: return as is. Defaults to False.
+
+        Returns:
+            execution result.
+        """
+        _check_priority_parallelism(priority, parallelism)
+        return await self._request(
+            "call", f"function\n{func}\n{len(args)}\n1", args,
+            script=func,
+            clear_memory=clear_memory,
+            table_to_list=table_to_list,
+            priority=priority,
+            parallelism=parallelism,
+            disable_decimal=disable_decimal,
+        )
+
+    async def run(self, script: str, *args, **kwargs) -> Any:
+        if args:
+            return await self.call(script, *args, **kwargs)
+        else:
+            return await self.exec(script, **kwargs)
+
+    async def upload(self, objs: Dict[str, Any]) -> Any:
+        """Upload Python objects to DolphinDB server.
+
+        Args:
+            objs : Python dictionary object. The keys of the dictionary are
+                the variable names in DolphinDB and the values are Python objects,
+                which can be numbers, strings, lists, DataFrame, etc.
+
+        Returns:
+            the server address of the uploaded object.
+        """
+        if not objs:
+            return -1
+        for name in objs.keys():
+            if not isinstance(name, str):
+                raise RuntimeError("non-string key in upload dictionary is not allowed")
+        names = ",".join(objs.keys())
+        addr = await self._request("upload", f"variable\n{names}\n{len(objs)}\n1", objs.values(), script=names)
+        return -1 if addr is None else addr
+
+
+__all__ = [
+    "AsyncSession",
+]
@@ -3,6 +3,9 @@ from .connection import DBConnection
 from .typing import _DATA_FORM
 from .streaming import StreamingClient
 
+import atexit
+import threading
+import weakref
 from typing import List, Optional, Callable, Union
 
 ddbcpp = DolphinDBRuntime()._ddbcpp
@@ -24,9 +27,40 @@ def _check_type(cls):
     return type_dict
 
 
+def _namespace_fields(namespace) -> Optional[tuple]:
+    if "__annotations__" in namespace:
+        return tuple(namespace["__annotations__"])
+    try:
+        # Python 3.14+ stores an annotate function in the class namespace instead (PEP 649)
+        import annotationlib
+    except ImportError:
+        return ()
+    annotate = annotationlib.get_annotate_from_class_namespace(namespace)
+    if annotate is None:
+        return ()
+    try:
+        return tuple(annotationlib.call_annotate_function(annotate, annotationlib.Format.FORWARDREF))
+    except Exception:
+        return None
+
+
 class _EventMeta(type):
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        # store the fields in slots rather than a per-instance __dict__, unless a field
+        # also has a class-level value, which slots can't coexist with. If the fields can't
+        # be determined, keep the __dict__.
+        fields = _namespace_fields(namespace)
+        if fields is not None and "__slots__" not in namespace and not any(k in namespace for k in fields):
+            inherited = set()
+            for base in bases:
+                for klass in base.__mro__:
+                    inherited.update(klass.__dict__.get("__slots__", ()))
+            namespace["__slots__"] = tuple(k for k in fields if k not in inherited)
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
     def __init__(cls, *args):
         cls._type_cache = _check_type(cls)
+        cls._field_names = tuple(cls._type_cache)
         if cls._is_base:
             cls._event_name = None
             cls._is_base = False
@@ -83,19 +117,24 @@ class Event(metaclass=_EventMeta):
     >>> TestEvent2._event_name
     Test
     ```
+
+    The attributes are stored in `__slots__`, so an event has no
+    `__dict__` and only the declared attributes can be set on it.
     """
+    __slots__ = ()
     _type_cache = dict()
+    _field_names = ()
     _event_name = None
     _is_base = True
 
     def __init__(self, *args, **kwargs) -> None:
-        i = 0
-        for k, v in self._type_cache.items():
-            if i < len(args):
-                setattr(self, k, args[i])
-            elif k in kwargs:
-                setattr(self, k, kwargs[k])
-            i += 1
+        fields = self._field_names
+        for k, v in zip(fields, args):
+            setattr(self, k, v)
+        if kwargs:
+            for k in fields[len(args):]:
+                if k in kwargs:
+                    setattr(self, k, kwargs[k])
 
     def __repr__(self) -> str:
         data_dict = dict()
@@ -133,6 +172,26 @@ class EventSender:
         common field from events. It can only be specified when the
         heterogeneous stream table contains common fields across
         different event types.
+
+        batchSize : an int indicating the number of events sendEvent
+        buffers before inserting them into the table at once. The
+        default value is 1, indicating each event is sent immediately.
+
+        throttle : a float indicating the maximum time (in seconds)
+        an event stays in the buffer when batchSize is greater than 1.
+        The buffered events are sent by a background thread once it
+        elapses. The default value is 1.0.
+
+    Note:
+        With batchSize greater than 1, the events are sent in a
+        background thread through ddbSession, so ddbSession must
+        not be used by other threads before the sender is closed.
+        Call close (or use the sender as a context manager) to send
+        the remaining buffered events. Senders that are garbage
+        collected or still open at interpreter exit are closed then,
+        but only if ddbSession is still connected. Events that fail
+        to be sent stay buffered and are sent again with the next
+        batch; use getUnsentEvents to take them out.
     """
     def __init__(
         self,
@@ -141,6 +200,8 @@ class EventSender:
         eventSchema: List[_EventMeta],
         eventTimeFields: Optional[Union[List[str], str]] = None,
         commonFields: Optional[List[str]] = None,
+        batchSize: int = 1,
+        throttle: float = 1.0,
     ) -> None:
         if not isinstance(ddbSession, DBConnection):
             raise TypeError("ddbSession must be a dolphindb DBConnection.")
@@ -171,24 +232,135 @@ class EventSender:
         for elm in commonFields:
             if not isinstance(elm, str):
                 raise TypeError("commonFields must be a str or a list of str.")
+        if not isinstance(batchSize, int) or batchSize < 1:
+            raise ValueError("batchSize must be a positive int.")
+        if throttle <= 0:
+            raise ValueError("throttle must be greater than 0.")
         self.sender = ddbcpp.EventSender(ddbSession.cpp, tableName, eventSchema, eventTimeFields, commonFields)
         self.sess = ddbSession
+        self._batch_size = batchSize
+        self._pending = []
+        self._lock = threading.Lock()
+        self._error = None
+        self._closed = threading.Event()
+        if batchSize > 1:
+            _open_senders.add(self)
+            threading.Thread(
+                target=_flush_periodically, args=(weakref.ref(self), self._closed, throttle), daemon=True
+            ).start()
 
     def __del__(self):
+        if hasattr(self, "_closed"):
+            try:
+                self.close()
+            except Exception:
+                pass
         self.sender = None
         self.sess = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _check(self):
+        if not self.sess:
+            raise RuntimeError("The connection to dolphindb has not been established.")
+        if self.sess.isClosed():
+            raise RuntimeError("Session has been closed.")
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Failed to send the buffered events: {error}")
+
+    def _flush(self):
+        if self._pending:
+            events, self._pending = self._pending, []
+            try:
+                self.sender.sendEvents(events)
+            except Exception:
+                # keep the events to send them again, as MultithreadedTableWriter keeps unwritten data
+                self._pending[:0] = events
+                raise
+
     def sendEvent(self, event: Event):
         """Send the events to the DolphinDB server.
 
+        If batchSize is greater than 1, the event is buffered and sent
+        with the other buffered events.
+
         Args:
             event : custom event instance.
         """
-        if not self.sess:
-            raise RuntimeError("The connection to dolphindb has not been established.")
-        if self.sess.isClosed():
-            raise RuntimeError("Session has been closed.")
-        self.sender.sendEvent(event)
+        self._check()
+        if self._batch_size == 1:
+            self.sender.sendEvent(event)
+            return
+        with self._lock:
+            self._pending.append(event)
+            if len(self._pending) >= self._batch_size:
+                self._flush()
+
+    def sendEvents(self, events: List[Event]):
+        """Send multiple events to the DolphinDB server with a single insert.
+
+        The buffered events are sent first.
+
+        Args:
+            events : a list of custom event instances.
+        """
+        self._check()
+        with self._lock:
+            self._pending.extend(events)
+            self._flush()
+
+    def flush(self):
+        """Send the buffered events to the DolphinDB server."""
+        self._check()
+        with self._lock:
+            self._flush()
+
+    def getUnsentEvents(self) -> List[Event]:
+        """Remove the buffered events, including those that failed to be sent, and return them."""
+        with self._lock:
+            events, self._pending = self._pending, []
+        return events
+
+    def close(self):
+        """Send the buffered events and stop the background thread."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        _open_senders.discard(self)
+        if self.sess and not self.sess.isClosed():
+            with self._lock:
+                self._flush()
+
+
+# senders with a background thread, which is a daemon, so they are closed at exit
+_open_senders = weakref.WeakSet()
+
+
+@atexit.register
+def _close_senders():
+    for sender in list(_open_senders):
+        try:
+            sender.close()
+        except Exception:
+            pass
+
+
+def _flush_periodically(ref, closed, throttle):
+    while not closed.wait(throttle):
+        sender = ref()
+        if sender is None:
+            return
+        with sender._lock:
+            try:
+                sender._flush()
+            except Exception as e:
+                sender._error = e
+        del sender
 
 
 class EventClient(StreamingClient):
@@ -259,6 +431,9 @@ class EventClient(StreamingClient):
         resub: bool = False,
         userName: str = None,
         password: str = None,
+        batchSize: int = 0,
+        throttle: float = 1.0,
+        asFrames: bool = False,
     ):
         """Subscribe events from the heterogeneous stream table.
 
@@ -272,7 +447,16 @@ class EventClient(StreamingClient):
             resub : True means to keep trying to subscribe to table after the subscription attempt fails. Defaults to False.
             userName : username. Defaults to None, indicating no login.
             password : password. Defaults to None, indicating no login.
+            batchSize : an int indicating the number of messages handled at once. If it is greater than 0, the handler
+                receives a list of events per batch. Defaults to 0, indicating the handler receives one event at a time.
+            throttle : a float indicating the maximum time (in seconds) to wait for a batch. Defaults to 1.0.
+            asFrames : True means the handler receives a dict of {eventType: DataFrame} per batch, built column by
+                column instead of creating an Event per row. It requires batchSize > 0. Defaults to False.
         """
+        if asFrames and batchSize <= 0:
+            raise ValueError("asFrames requires batchSize to be greater than 0.")
+        if throttle <= 0:
+            raise ValueError("throttle must be greater than 0.")
         if actionName is None:
             actionName = ""
         if userName is None:
@@ -289,6 +473,9 @@ class EventClient(StreamingClient):
             resub,
             userName,
             password,
+            batchSize,
+            throttle,
+            asFrames,
         )
 
     def getSubscriptionTopics(self):
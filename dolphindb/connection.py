@@ -1,11 +1,16 @@
-from threading import RLock
-from typing import overload
+import hashlib
+import re
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Event, RLock, Thread
+from typing import Iterator, overload
 
 from ._hints import (
-    Dict, List, Literal, Optional, Union, Any
+    Callable, Dict, List, Literal, Optional, Union, Any
 )
 from ._core import DolphinDBRuntime
 from .config import ConnectionConfig, ConnectionSetting, organize_config
+from .utils import _generate_tablename
 
 ddbcpp = DolphinDBRuntime()._ddbcpp
 
@@ -58,6 +63,7 @@ class DBConnection:
         self._mutex = RLock()    # busy check
         self._is_closed = False
         self._in_block_reading = False
+        self._prepared: Dict[str, str] = {}    # function name -> session in which it is defined
 
     def __del__(self):
         if hasattr(self, "cpp"):
@@ -228,6 +234,7 @@ class DBConnection:
         parallelism: int = 64,
         fetch_size: Optional[int] = None,
         disable_decimal: bool = False,
+        symbol_as_category: bool = False,
     ) -> Any:
         """Execute script.
 
@@ -250,6 +257,9 @@ class DBConnection:
             fetch_size : the size of a block.
             disable_decimal: whether to convert decimal to double in the result
                 table. True: convert to double, False: return as is. Defaults to False.
+            symbol_as_category: whether to convert SYMBOL columns of the result table
+                to pandas.Categorical. Requires protocol=PROTOCOL_DDB and
+                table_to_list=False, otherwise an error is raised. Defaults to False.
 
         Note:
             fetch_size cannot be less than 8192 Bytes.
@@ -288,6 +298,7 @@ class DBConnection:
             priority=priority,
             parallelism=parallelism,
             disableDecimal=disable_decimal,
+            symbolAsCategory=symbol_as_category,
         )
 
     def _exec_with_table_schema(
@@ -327,6 +338,7 @@ class DBConnection:
         priority: int = 4,
         parallelism: int = 64,
         disable_decimal: bool = False,
+        symbol_as_category: bool = False,
     ) -> Any:
         """Execute function.
 
@@ -349,6 +361,9 @@ class DBConnection:
                 local executors are available. Defaults to 64.
             disable_decimal: whether to convert decimal to double in the result
                 table. True: convert to double, False: return as is. Defaults to False.
+            symbol_as_category: whether to convert SYMBOL columns of the result table
+                to pandas.Categorical. Requires protocol=PROTOCOL_DDB and
+                table_to_list=False, otherwise an error is raised. Defaults to False.
 
         Note:
             fetch_size cannot be less than 8192 Bytes.
@@ -377,6 +392,7 @@ class DBConnection:
             priority=priority,
             parallelism=parallelism,
             disableDecimal=disable_decimal,
+            symbolAsCategory=symbol_as_category,
         )
 
     def _call_with_table_schema(
@@ -413,6 +429,175 @@ class DBConnection:
         else:
             return self.exec(script, **kwargs)
 
+    def iter_batches(
+        self,
+        script: str,
+        fetch_size: int,
+        *,
+        prefetch: int = 2,
+        as_arrow: bool = False,
+        clear_memory: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+    ) -> Iterator[Any]:
+        """Execute a query and iterate over its result in blocks.
+
+        The next blocks are received and decoded on a background thread while the
+        caller processes the current one, so at most prefetch blocks are held in memory.
+
+        Args:
+            script : DolphinDB script to be executed.
+            fetch_size : the size of a block.
+
+        Kwargs:
+            prefetch : the number of blocks decoded ahead of the caller. Defaults to 2.
+            as_arrow : whether to yield pyarrow.RecordBatch instead of DataFrame. Defaults to False.
+            clear_memory : whether to release variables after queries.
+                True means to release, otherwise False. Defaults to False.
+            priority : a job priority system with 10 priority levels (0 to 9). Defaults to 4.
+            parallelism : the maximum number of threads to execute a job's tasks
+                simultaneously on a data node. Defaults to 64.
+
+        Note:
+            fetch_size cannot be less than 8192 Bytes. The query is executed when the first
+            block is requested. From then on, no other command can be executed on the
+            connection until the iteration finishes or the iterator is closed.
+
+        Returns:
+            an iterator over the blocks of the result.
+        """
+        if not isinstance(prefetch, int) or prefetch <= 0:
+            raise ValueError("prefetch must be an integer greater than 0")
+        if as_arrow:
+            __import__("pyarrow")
+        # the query is sent on the first next(), so an iterator that is never used does not
+        # hold the connection
+        return _prefetch_blocks(lambda: self.exec(
+            script,
+            clear_memory=clear_memory,
+            priority=priority,
+            parallelism=parallelism,
+            fetch_size=fetch_size,
+        ), prefetch, as_arrow)
+
+    def pipeline(self, max_in_flight: int = 64) -> "Pipeline":
+        """Create a Pipeline that sends queued scripts and function calls back to back.
+
+        Args:
+            max_in_flight : the maximum number of requests sent before their responses
+                are read. Defaults to 64.
+
+        Returns:
+            a Pipeline object. Use it as a context manager or call flush() to send the queued requests.
+
+        Note:
+            Pipelining is meant for bursts of small requests. The requests are not retried
+            when high availability switches to another node.
+        """
+        if not isinstance(max_in_flight, int) or max_in_flight <= 0:
+            raise ValueError("max_in_flight must be an integer greater than 0")
+        return Pipeline(self, max_in_flight)
+
+    def call_many(
+        self,
+        func: str,
+        arg_tuples,
+        *,
+        parallel: bool = False,
+        table_to_list: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+        disable_decimal: bool = False,
+    ) -> List[Any]:
+        """Execute a function once for each argument tuple in a single round trip.
+
+        The i-th arguments of all tuples are uploaded together as one vector and the
+        function is applied element-wise on the server with loop (or ploop).
+
+        Args:
+            func : DolphinDB function name to be executed.
+            arg_tuples : an iterable of argument tuples. A value which is not a tuple
+                is passed as the only argument.
+
+        Kwargs:
+            parallel : whether to run the calls in parallel on the server with ploop.
+                Defaults to False.
+            table_to_list : whether to convert table to list or DataFrame.
+                True: to list, False: to DataFrame.  Defaults to False.
+            priority : a job priority system with 10 priority levels (0 to 9). Defaults to 4.
+            parallelism : the maximum number of threads to execute a job's tasks
+                simultaneously on a data node. Defaults to 64.
+            disable_decimal: whether to convert decimal to double in the result
+                table. True: convert to double, False: return as is. Defaults to False.
+
+        Returns:
+            a list with the result of each call, in the order of arg_tuples.
+        """
+        arg_tuples = [args if isinstance(args, tuple) else (args,) for args in arg_tuples]
+        if not arg_tuples:
+            return []
+        argc = len(arg_tuples[0])
+        if argc == 0 or any(len(args) != argc for args in arg_tuples):
+            raise ValueError("all argument tuples must have the same number of arguments, which must be greater than 0")
+        prefix = _generate_tablename("CALL_MANY")
+        names = [f"{prefix}_{i}" for i in range(argc)]
+        pipe = self.pipeline()
+        uploaded = pipe.upload(dict(zip(names, (list(column) for column in zip(*arg_tuples)))))
+        result = pipe.exec(
+            f"{'ploop' if parallel else 'loop'}({func}, {', '.join(names)})",
+            table_to_list=table_to_list,
+            priority=priority,
+            parallelism=parallelism,
+            disable_decimal=disable_decimal,
+        )
+        pipe.exec(f"undef(`{'`'.join(names)}, VAR)")
+        pipe.flush()
+        # a failed upload also fails the loop on undefined variables, so report its own error
+        uploaded.result()
+        return list(result.result())
+
+    def prepare(self, script: str) -> "PreparedStatement":
+        """Prepare a parameterized query which is parsed once per session.
+
+        The placeholders $1, $2, ... in script are replaced by the parameters of a
+        function defined on the server, so executing the statement only sends the
+        function name and the bound arguments.
+
+        Args:
+            script : a single DolphinDB expression with placeholders $1, $2, ... outside of
+                string literals.
+
+        Note:
+            The function body cannot access the local variables of the session, so the
+            script may only refer to shared tables, loadTable, and the placeholders.
+
+        Returns:
+            a PreparedStatement object. Call execute() with the arguments to run the query.
+        """
+        script = script.strip().rstrip(";")
+        params = [int(m.group(1)) for m in _PLACEHOLDER.finditer(script) if m.group(1)]
+        argc = max(params, default=0)
+        if any(i == 0 for i in params):
+            raise ValueError("placeholders must be numbered from $1")
+        name = "prepared_" + hashlib.sha1(script.encode()).hexdigest()[:16]
+        body = _PLACEHOLDER.sub(lambda m: f"prepared_arg{m.group(1)}" if m.group(1) else m.group(0), script)
+        args = ", ".join(f"prepared_arg{i}" for i in range(1, argc + 1))
+        statement = PreparedStatement(self, name, argc, f"def {name}({args}){{\nreturn {body}\n}}")
+        self._define_prepared(statement)
+        return statement
+
+    @_safe_check
+    def _define_prepared(self, statement: "PreparedStatement"):
+        # the definition only lives in the session, so it is sent again after reconnecting
+        session_id = self.session_id
+        if self._prepared.get(statement.name) != session_id:
+            self.cpp.exec(statement.definition)
+            self._prepared[statement.name] = session_id
+
+    @_safe_check
+    def _run_pipeline(self, requests, max_in_flight: int):
+        return self.cpp.runPipeline(requests, max_in_flight)
+
     def _run_with_table_schema(self, script, *args, **kwargs):
         if args:
             return self._call_with_table_schema(script, *args, **kwargs)
@@ -420,6 +605,184 @@ class DBConnection:
             return self._exec_with_table_schema(script, **kwargs)
 
 
+class Pipeline(object):
+    """Queue scripts and function calls on a DBConnection and send them without waiting for each response.
+
+    Each exec/call returns a concurrent.futures.Future. The queued requests are sent when
+    flush() is called or when the with block exits, and the responses are matched in order.
+    A server-side error only fails the future of the corresponding request.
+
+    Args:
+        connection : the DBConnection to send the requests through.
+        max_in_flight : the maximum number of requests sent before their responses are read.
+    """
+    def __init__(self, connection: DBConnection, max_in_flight: int = 64):
+        self.conn = connection
+        self.max_in_flight = max_in_flight
+        self._requests = []
+        self._futures: List[Future] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
+
+    def __len__(self):
+        return len(self._requests)
+
+    def _submit(self, request) -> Future:
+        priority, parallelism = request[5], request[6]
+        if not isinstance(priority, int) or priority > 9 or priority < 0:
+            raise RuntimeError("priority must be an integer from 0 to 9")
+        if not isinstance(parallelism, int) or parallelism <= 0:
+            raise RuntimeError("parallelism must be an integer greater than 0")
+        future = Future()
+        self._requests.append(request)
+        self._futures.append(future)
+        return future
+
+    def exec(
+        self,
+        script: str,
+        *,
+        clear_memory: bool = False,
+        table_to_list: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+        disable_decimal: bool = False,
+    ) -> Future:
+        """Queue a script.
+
+        Args:
+            script : DolphinDB script to be executed.
+
+        Kwargs:
+            the same as DBConnection.exec, except that fetch_size is not supported.
+
+        Returns:
+            a Future which receives the execution result after flush().
+        """
+        return self._submit((script, (), "script", clear_memory, table_to_list, priority, parallelism, disable_decimal))
+
+    def call(
+        self,
+        func: str,
+        *args,
+        clear_memory: bool = False,
+        table_to_list: bool = False,
+        priority: int = 4,
+        parallelism: int = 64,
+        disable_decimal: bool = False,
+    ) -> Future:
+        """Queue a function call.
+
+        Args:
+            func : DolphinDB function name to be executed.
+            args : arguments to be passed to the function.
+
+        Kwargs:
+            the same as DBConnection.call.
+
+        Returns:
+            a Future which receives the execution result after flush().
+        """
+        return self._submit((func, args, "function", clear_memory, table_to_list, priority, parallelism, disable_decimal))
+
+    def upload(self, objs: Dict[str, Any]) -> Future:
+        """Queue an upload of Python objects.
+
+        Args:
+            objs : Python dictionary object. The keys of the dictionary are
+                the variable names in DolphinDB and the values are Python objects.
+
+        Returns:
+            a Future which is resolved after flush().
+        """
+        if not objs:
+            future = Future()
+            future.set_result(-1)
+            return future
+        for name in objs.keys():
+            if not isinstance(name, str):
+                raise RuntimeError("non-string key in upload dictionary is not allowed")
+        names = ",".join(objs.keys())
+        return self._submit((names, tuple(objs.values()), "variable", False, False, 4, 64, False))
+
+    def flush(self) -> None:
+        """Send all queued requests and resolve their futures."""
+        if not self._requests:
+            return
+        pending = zip(self._requests, self._futures)
+        self._requests, self._futures = [], []
+        # requests whose futures have been cancelled are not sent
+        pending = [(request, future) for request, future in pending if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+        requests = [request for request, _ in pending]
+        futures = [future for _, future in pending]
+        try:
+            results = self.conn._run_pipeline(requests, self.max_in_flight)
+        except Exception as ex:
+            for future in futures:
+                future.set_exception(ex)
+            raise
+        for future, (ok, value) in zip(futures, results):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(RuntimeError("<Exception> in pipeline: " + value))
+
+    def cancel(self) -> None:
+        """Discard all queued requests which have not been sent."""
+        for future in self._futures:
+            future.cancel()
+        self._requests, self._futures = [], []
+
+
+# string literals are matched first so that the placeholders inside them are kept as text
+_PLACEHOLDER = re.compile(r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|\$(\d+)""", re.S)
+
+
+class PreparedStatement(object):
+    """A query prepared with DBConnection.prepare.
+
+    The query is defined as a function on the server the first time it is used in a
+    session, and each execution only sends the bound arguments.
+
+    Args:
+        connection : the DBConnection the statement belongs to.
+        name : name of the function defined on the server.
+        argc : number of placeholders in the query.
+        definition : script which defines the function.
+    """
+    def __init__(self, connection: DBConnection, name: str, argc: int, definition: str):
+        self.conn = connection
+        self.name = name
+        self.argc = argc
+        self.definition = definition
+
+    def execute(self, *args, **kwargs) -> Any:
+        """Execute the prepared query.
+
+        Args:
+            args : the values bound to $1, $2, ...
+
+        Kwargs:
+            the same keyword arguments as DBConnection.call.
+
+        Returns:
+            execution result.
+        """
+        if len(args) != self.argc:
+            raise ValueError(f"expected {self.argc} arguments, got {len(args)}")
+        self.conn._define_prepared(self)
+        return self.conn.call(self.name, *args, **kwargs)
+
+
 class BlockReader(object):
     """Read in blocks.
 
@@ -484,3 +847,60 @@ class BlockReader(object):
             self.conn = None
 
     skipAll = skip_all
+
+
+def _prefetch_blocks(start: Callable[[], BlockReader], prefetch: int, as_arrow: bool):
+    if as_arrow:
+        import pyarrow as pa
+    reader = start()
+    blocks = Queue(maxsize=prefetch)
+    stopped = Event()
+
+    def produce():
+        try:
+            while not stopped.is_set() and reader.has_next:
+                data = reader.read()
+                if as_arrow:
+                    data = pa.RecordBatch.from_pandas(data, preserve_index=False)
+                blocks.put((True, data))
+        except BaseException as ex:
+            blocks.put((False, ex))
+        else:
+            blocks.put((True, StopIteration))
+
+    producer = Thread(target=produce, daemon=True)
+    producer.start()
+    failed = False
+    try:
+        while True:
+            ok, data = blocks.get()
+            if not ok:
+                failed = True
+                raise data
+            if data is StopIteration:
+                break
+            yield data
+    finally:
+        stopped.set()
+        # unblock the producer if it is waiting for a free slot
+        while producer.is_alive():
+            try:
+                blocks.get(timeout=0.1)
+            except Empty:
+                pass
+        conn = reader.conn
+        if conn is not None:
+            if conn.is_closed:
+                conn._release_block()
+                reader.conn = None
+            elif not failed:
+                reader.skip_all()
+            else:
+                # drain the rest of the stream so that the next command does not read stale
+                # blocks, and close the connection if the stream itself is broken
+                try:
+                    reader.skip_all()
+                except Exception:
+                    conn.close()
+                    conn._release_block()
+                    reader.conn = None
@@ -27,6 +27,11 @@ from .config import ConnectionConfig, ConnectionSetting, organize_config
 ddbcpp = DolphinDBRuntime()._ddbcpp
 
 
+def _set_future_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
 class DBConnectionPool(object):
     """DBConnectionPool is the connection pool object where multiple threads can be created to execute scripts in parallel and improve task efficiency.
 
@@ -184,6 +189,13 @@ class DBConnectionPool(object):
         self.taskId = self.taskId + 1
         tid = self.taskId
         self.mutex.release()
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def on_finished():
+            # called from the worker thread of the pool once the task finishes or fails
+            loop.call_soon_threadsafe(_set_future_done, done)
+
         self.pool.run(
             script,
             tid,
@@ -193,13 +205,12 @@ class DBConnectionPool(object):
             priority=priority,
             parallelism=parallelism,
             disableDecimal=disableDecimal,
+            callback=on_finished,
         )
-        while True:
-            isFinished = self.pool.isFinished(tid)
-            if isFinished == 0:
-                await asyncio.sleep(0.01)
-            else:
-                return self.pool.getData(tid)
+        await done
+        # raises if the task came across an exception
+        self.pool.isFinished(tid)
+        return self.pool.getData(tid)
 
     def addTask(self, script: str, taskId: int, *args, **kwargs):
         """Add a task and specify the task ID to execute the script.
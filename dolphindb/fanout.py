@@ -0,0 +1,282 @@
+import mmap
+import os
+import pickle
+import struct
+import time
+import threading
+from collections import deque
+from multiprocessing import shared_memory
+
+from ._hints import Any, Optional
+
+
+_MAGIC = b"DDBFANO1"
+# header: magic, capacity, write_pos, records, reserve_pos, closed, then the position and
+# sequence number of the oldest record that is still intact
+_HEADER = struct.Struct("<8sQQQQQQQ")
+_HEADER_SIZE = 64
+_CAPACITY_OFFSET = 8
+_WRITE_POS_OFFSET = 16
+_RESERVE_POS_OFFSET = 32
+_CLOSED_OFFSET = 40
+_OLDEST_OFFSET = 48
+# record: payload length, sequence number, then the payload padded to 8 bytes
+_RECORD = struct.Struct("<QQ")
+_SKIP = (1 << 64) - 1
+_U64 = struct.Struct("<Q")
+# longest sleep (in seconds) of a reader waiting for a batch
+_MAX_WAIT = 0.01
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class _Segment:
+    """A shared memory segment mapped without registering it with the resource tracker."""
+    def __init__(self, name: str):
+        import _posixshmem
+        fd = _posixshmem.shm_open("/" + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self):
+        self.buf.release()
+        self._mmap.close()
+
+
+def _attach(name: str):
+    # readers must not unlink the segment when they exit, only the publisher owns it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name=name)
+    # before Python 3.13 attaching registers the segment with the resource tracker, which is
+    # shared with the publisher in forked processes, so unregistering afterwards would make
+    # the publisher's unlink fail in the tracker. Map the segment directly instead.
+    return _Segment(name)
+
+
+class FanoutPublisher:
+    """Publishes batches to the local processes attached with FanoutReader.
+
+    The batches are written to a ring buffer in shared memory, so a single process can own
+    a subscription and share the decoded batches with its sibling processes instead of each
+    of them subscribing and deserializing the stream. Use publish as the handler, preferably
+    with batch_size > 0 and msg_format="columns" so that each record is a dict of numpy arrays::
+
+        publisher = FanoutPublisher("ticks")
+        client.subscribe(host, port, publisher.publish, "ticks", batch_size=1000, msg_format="columns")
+
+    A reader that falls more than size bytes behind skips ahead to the oldest batch that has
+    not been overwritten and counts the overwritten batches in FanoutReader.dropped.
+
+    Args:
+        name : name of the shared memory segment, which readers attach to.
+        size : capacity of the ring buffer in bytes. Defaults to 64 MiB.
+    """
+    def __init__(self, name: str, size: int = 64 << 20):
+        if size < 1024:
+            raise ValueError("size must be at least 1024.")
+        size = _align(size)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_SIZE + size)
+        self._buf = self._shm.buf
+        self._capacity = size
+        self._pos = 0
+        self._records = 0
+        # position and sequence number of the records still intact in the ring buffer
+        self._intact = deque()
+        self._lock = threading.Lock()
+        _HEADER.pack_into(self._buf, 0, _MAGIC, size, 0, 0, 0, 0, 0, 1)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def closed(self) -> bool:
+        return self._buf is None
+
+    def publish(self, batch: Any) -> None:
+        """Write batch to the ring buffer. It can be any picklable object."""
+        payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+        size = _RECORD.size + _align(len(payload))
+        if size > self._capacity:
+            raise ValueError(f"A batch of {len(payload)} bytes does not fit in the ring buffer.")
+        with self._lock:
+            if self._buf is None:
+                raise RuntimeError("The publisher has been closed.")
+            buf = self._buf
+            pos = self._pos
+            offset = pos % self._capacity
+            if self._capacity - offset < size:
+                # records never wrap around, mark the rest of the buffer as skipped
+                if self._capacity - offset >= _RECORD.size:
+                    _RECORD.pack_into(buf, _HEADER_SIZE + offset, _SKIP, 0)
+                pos += self._capacity - offset
+                offset = 0
+            # publish the oldest record that survives this write before overwriting the others
+            intact = self._intact
+            while intact and intact[0][0] < pos + size - self._capacity:
+                intact.popleft()
+            intact.append((pos, self._records + 1))
+            struct.pack_into("<QQ", buf, _OLDEST_OFFSET, *intact[0])
+            # readers check the reservation to detect a record overwritten while they copy it
+            _U64.pack_into(buf, _RESERVE_POS_OFFSET, pos + size)
+            start = _HEADER_SIZE + offset + _RECORD.size
+            buf[start:start + len(payload)] = payload
+            self._records += 1
+            _RECORD.pack_into(buf, _HEADER_SIZE + offset, len(payload), self._records)
+            self._pos = pos + size
+            struct.pack_into("<QQ", buf, _WRITE_POS_OFFSET, self._pos, self._records)
+
+    def close(self) -> None:
+        """Stop publishing. Attached readers finish after consuming the remaining batches."""
+        with self._lock:
+            if self._buf is None:
+                return
+            _U64.pack_into(self._buf, _CLOSED_OFFSET, 1)
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class FanoutReader:
+    """Reads the batches of a FanoutPublisher from another process.
+
+    A reader starts with the next batch published after it attaches. Iterating blocks until a
+    batch arrives and stops once the publisher is closed and all batches have been read.
+
+    Args:
+        name : name of the shared memory segment of the publisher.
+    """
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, capacity, write_pos, records = _HEADER.unpack_from(self._buf, 0)[:4]
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory {name} is not a FanoutPublisher ring buffer.")
+        self._capacity = capacity
+        self._pos = write_pos
+        self._records = records
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of batches overwritten before this reader could read them."""
+        return self._dropped
+
+    @property
+    def finished(self) -> bool:
+        """Whether the publisher is closed and all batches have been read."""
+        buf = self._buf
+        return _U64.unpack_from(buf, _CLOSED_OFFSET)[0] == 1 and \
+            _U64.unpack_from(buf, _WRITE_POS_OFFSET)[0] == self._pos
+
+    def _resync(self):
+        # continue from the oldest record that has not been overwritten. The publisher may move
+        # it while it is read, so read it until two reads agree and its header matches.
+        buf = self._buf
+        while True:
+            oldest = struct.unpack_from("<QQ", buf, _OLDEST_OFFSET)
+            pos, records = oldest
+            length, seq = _RECORD.unpack_from(buf, _HEADER_SIZE + pos % self._capacity)
+            if seq == records and length != _SKIP and struct.unpack_from("<QQ", buf, _OLDEST_OFFSET) == oldest:
+                break
+        self._dropped += records - 1 - self._records
+        self._pos = pos
+        self._records = records - 1
+
+    def _read(self) -> Any:
+        buf = self._buf
+        while True:
+            write_pos = _U64.unpack_from(buf, _WRITE_POS_OFFSET)[0]
+            if write_pos == self._pos:
+                return None
+            if write_pos - self._pos > self._capacity:
+                self._resync()
+                continue
+            offset = self._pos % self._capacity
+            if self._capacity - offset < _RECORD.size:
+                self._pos += self._capacity - offset
+                continue
+            length, records = _RECORD.unpack_from(buf, _HEADER_SIZE + offset)
+            if length == _SKIP:
+                self._pos += self._capacity - offset
+                continue
+            start = _HEADER_SIZE + offset + _RECORD.size
+            payload = bytes(buf[start:start + length]) if records == self._records + 1 else None
+            reserve_pos = _U64.unpack_from(buf, _RESERVE_POS_OFFSET)[0]
+            if payload is None or reserve_pos - self._pos > self._capacity:
+                # the writer has lapped this reader
+                self._resync()
+                continue
+            self._pos += _RECORD.size + _align(length)
+            self._records = records
+            return pickle.loads(payload)
+
+    def poll(self, timeout: Optional[float] = None) -> Any:
+        """Get the next batch.
+
+        Args:
+            timeout : maximum time (in seconds) to wait for a batch. Defaults to None, which means to wait without limit.
+
+        Returns:
+            the batch, or None if no batch arrived within timeout or the publisher is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wait = 0.0001
+        while True:
+            batch = self._read()
+            if batch is not None:
+                return batch
+            if _U64.unpack_from(self._buf, _CLOSED_OFFSET)[0] == 1:
+                return self._read()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            time.sleep(wait)
+            wait = min(wait * 2, _MAX_WAIT)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        batch = self.poll()
+        if batch is None:
+            raise StopIteration
+        return batch
+
+    def close(self) -> None:
+        if self._buf is None:
+            return
+        self._buf.release()
+        self._buf = None
+        self._shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+__all__ = [
+    "FanoutPublisher",
+    "FanoutReader",
+]
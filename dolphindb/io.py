@@ -1,15 +1,286 @@
+import mmap as _mmap
+import os
+import struct
+import sys
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from . import settings as keys
 from ._core import DolphinDBRuntime
+from ._hints import Any, Dict, Optional, Tuple
 ddbcpp = DolphinDBRuntime()._ddbcpp
 
 dump = ddbcpp.dump
-load = ddbcpp.load
 dumps = ddbcpp.dumps
 loads = ddbcpp.loads
 
+# bytes read from the file at a time by iter_load
+_READ_SIZE = 1 << 20
+
+# flag, rows and columns of a serialized vector
+_VECTOR_HEADER = struct.Struct("<Hii")
+
+# types whose data can be viewed in place: stored dtype, null value, dtype of the view. Columns
+# containing the null value are converted instead, as load returns them with NaN or as objects.
+_TABLE_VIEW_TYPES = {
+    keys.DT_BOOL: (np.int8, np.iinfo(np.int8).min, np.bool_),
+    keys.DT_CHAR: (np.int8, np.iinfo(np.int8).min, None),
+    keys.DT_SHORT: (np.int16, np.iinfo(np.int16).min, None),
+    keys.DT_INT: (np.int32, np.iinfo(np.int32).min, None),
+    keys.DT_LONG: (np.int64, np.iinfo(np.int64).min, None),
+    keys.DT_FLOAT: (np.float32, np.finfo(np.float32).min, None),
+    keys.DT_DOUBLE: (np.float64, np.finfo(np.float64).min, None),
+    keys.DT_NANOTIMESTAMP: (np.int64, None, "datetime64[ns]"),
+}
+# load converts the temporal columns of tables to nanoseconds, but not vectors
+_VECTOR_VIEW_TYPES = dict(_TABLE_VIEW_TYPES)
+_VECTOR_VIEW_TYPES[keys.DT_TIMESTAMP] = (np.int64, None, "datetime64[ms]")
+
+
+def _view_vector(buf, pos: int, view_types: dict) -> Optional[Tuple[np.ndarray, int]]:
+    flag, rows, _ = _VECTOR_HEADER.unpack_from(buf, pos)
+    if flag >> 8 != keys.DF_VECTOR or flag & 0xff not in view_types:
+        return None
+    dtype, null, view = view_types[flag & 0xff]
+    start = pos + _VECTOR_HEADER.size
+    values = np.frombuffer(buf, dtype=dtype, count=rows, offset=start) if rows else np.empty(0, dtype=dtype)
+    if null is not None and (values == null).any():
+        return None
+    end = start + values.nbytes
+    if view is not None:
+        values = values.view(view)
+    return values, end
+
+
+def _try_loads(buf, pos: int = 0) -> Tuple[Any, int]:
+    res = ddbcpp.try_loads(buf, pos)
+    if res is None:
+        raise RuntimeError("Failed to deserialize data.")
+    return res
+
+
+def _load_table(buf, pos: int) -> Tuple[pd.DataFrame, int]:
+    _, rows, cols = _VECTOR_HEADER.unpack_from(buf, pos)
+    # skip the table name, then read the column names
+    pos = buf.find(b"\0", pos + _VECTOR_HEADER.size) + 1
+    names = []
+    for _ in range(cols):
+        end = buf.find(b"\0", pos)
+        names.append(buf[pos:end].decode())
+        pos = end + 1
+    columns = {}
+    for name in names:
+        res = _view_vector(buf, pos, _TABLE_VIEW_TYPES)
+        if res is None:
+            values, pos = _try_loads(buf, pos)
+            if isinstance(values, np.ndarray) and values.dtype.kind == "M" and values.dtype != np.dtype("datetime64[ns]"):
+                values = values.astype("datetime64[ns]")
+        else:
+            values, pos = res
+        columns[name] = values
+    return pd.DataFrame(columns, copy=False), pos
+
+
+def _load_object(buf, pos: int) -> Tuple[Any, int]:
+    if sys.byteorder != "little":
+        return _try_loads(buf, pos)
+    form = _VECTOR_HEADER.unpack_from(buf, pos)[0] >> 8
+    if form == keys.DF_TABLE:
+        return _load_table(buf, pos)
+    if form == keys.DF_VECTOR:
+        res = _view_vector(buf, pos, _VECTOR_VIEW_TYPES)
+        if res is not None:
+            return res
+    return _try_loads(buf, pos)
+
+
+def _load_mmap(file) -> Any:
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return _load_mmap(f)
+    # start at the current position, as load does, and seek to the end of the object so that
+    # the next object can be loaded
+    start = file.tell()
+    if os.fstat(file.fileno()).st_size <= start:
+        raise RuntimeError("Failed to deserialize data.")
+    # the offset of a mapping must be a multiple of the allocation granularity
+    offset = start - start % _mmap.ALLOCATIONGRANULARITY
+    # the views keep the mapping alive after the file is closed
+    buf = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ, offset=offset)
+    obj, end = _load_object(buf, start - offset)
+    file.seek(offset + end)
+    return obj
+
+
+def load(file, *, mmap: bool = False) -> Any:
+    """Deserialize an object from a file written by dump.
+
+    Args:
+        file : a binary file object, read from its current position. With mmap=True, it
+            can also be a path.
+        mmap : True means to memory-map the file. Numeric columns without nulls and
+            NANOTIMESTAMP columns are then returned as read-only numpy arrays that are
+            views into the file, without copying. The other columns are converted as
+            usual. Defaults to False.
+
+    Returns:
+        the deserialized object.
+    """
+    if mmap:
+        return _load_mmap(file)
+    return ddbcpp.load(file)
+
+
+class ChunkWriter:
+    """Appends DataFrame chunks to a file, one table in the DolphinDB wire format per chunk.
+
+    Use open_writer to create it and iter_load to read the chunks back. As on the server,
+    where each writeObject call appends one object, the file is a sequence of tables.
+
+    Args:
+        path : path of the file.
+        schema : a dict mapping column names to DolphinDB types, as the types argument of dumps.
+            Defaults to None, meaning that the types are inferred from each chunk.
+        append : True means to append to an existing file instead of truncating it. Defaults to False.
+    """
+    def __init__(self, path: str, schema: Optional[Dict[str, Any]] = None, append: bool = False):
+        self._file = open(path, "ab" if append else "wb")
+        self._schema = schema
+        self._columns = None
+        self._rows = 0
+
+    @property
+    def rows(self) -> int:
+        """Number of rows written by this writer."""
+        return self._rows
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append df to the file as one chunk.
+
+        Args:
+            df : a DataFrame with the same columns as the previous chunks.
+        """
+        if self._file.closed:
+            raise RuntimeError("The writer has been closed.")
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas.DataFrame.")
+        columns = list(df.columns)
+        if self._columns is None:
+            self._columns = columns
+        elif columns != self._columns:
+            raise ValueError(f"The columns {columns} do not match the columns {self._columns} of the previous chunks.")
+        self._file.write(dumps(df, types=self._schema))
+        self._rows += len(df)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def open_writer(path: str, schema: Optional[Dict[str, Any]] = None, *, append: bool = False) -> ChunkWriter:
+    """Open a file to write a table chunk by chunk, so that it can exceed the available memory.
+
+    Args:
+        path : path of the file.
+        schema : a dict mapping column names to DolphinDB types, as the types argument of dumps.
+            Defaults to None, meaning that the types are inferred from each chunk.
+        append : True means to append to an existing file instead of truncating it. Defaults to False.
+
+    Returns:
+        a ChunkWriter.
+
+    Examples:
+        >>> with ddb.io.open_writer("trades.bin", {"price": keys.DT_DOUBLE}) as writer:
+        ...     for df in chunks:
+        ...         writer.write(df)
+        >>> for df in ddb.io.iter_load("trades.bin", chunk_rows=100000):
+        ...     process(df)
+    """
+    return ChunkWriter(path, schema, append)
+
+
+def _iter_objects(path: str) -> Iterator[Any]:
+    with open(path, "rb") as f:
+        buffer = bytearray()
+        offset = 0
+        read_size = _READ_SIZE
+        while True:
+            res = ddbcpp.try_loads(buffer, offset) if offset < len(buffer) else None
+            if res is not None:
+                obj, offset = res
+                read_size = _READ_SIZE
+                yield obj
+                continue
+            data = f.read(read_size)
+            if not data:
+                if offset < len(buffer):
+                    raise RuntimeError(f"The file {path} ends with an incomplete object.")
+                return
+            # drop the consumed objects, then read more until the next object is complete
+            del buffer[:offset]
+            offset = 0
+            buffer += data
+            read_size = min(read_size * 2, 64 * _READ_SIZE)
+
+
+def iter_load(path: str, chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """Read the tables of a file written by open_writer (or by dump) one at a time.
+
+    Only the chunk being read and the DataFrame being yielded are kept in memory.
+
+    Args:
+        path : path of the file.
+        chunk_rows : number of rows of each DataFrame yielded. Defaults to None, meaning to
+            yield the chunks as they were written.
+
+    Returns:
+        an iterator of DataFrames.
+    """
+    if chunk_rows is not None and chunk_rows <= 0:
+        raise ValueError("chunk_rows must be greater than 0.")
+    pending = []
+    pending_rows = 0
+    for df in _iter_objects(path):
+        if not isinstance(df, pd.DataFrame):
+            raise RuntimeError(f"The file {path} contains a {type(df).__name__} instead of a table.")
+        if chunk_rows is None:
+            yield df
+            continue
+        pending.append(df)
+        pending_rows += len(df)
+        if pending_rows < chunk_rows:
+            continue
+        merged = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+        start = 0
+        while pending_rows - start >= chunk_rows:
+            yield merged.iloc[start:start + chunk_rows].reset_index(drop=True)
+            start += chunk_rows
+        pending = [merged.iloc[start:].reset_index(drop=True)] if start < pending_rows else []
+        pending_rows -= start
+    if pending_rows:
+        yield pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+
 
 __all__ = [
     "dump",
     "load",
     "dumps",
     "loads",
+    "ChunkWriter",
+    "open_writer",
+    "iter_load",
 ]
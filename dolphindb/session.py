@@ -24,7 +24,7 @@ from .connection import DBConnection
 from .streaming import (
     ThreadedStreamingClientConfig, ThreadedClient,
     ThreadPooledStreamingClientConfig, ThreadPooledClient,
-    StreamDeserializer, DEFAULT_ACTION_NAME,
+    StreamDeserializer, CheckpointStore, DEFAULT_ACTION_NAME,
 )
 from .global_config import enable_job_cancellation, tcp
 
@@ -206,6 +206,7 @@ class Session(DBConnection):
         parallelism: Optional[int] = None,
         fetchSize: Optional[int] = None,
         disableDecimal: Optional[bool] = None,
+        symbolAsCategory: Optional[bool] = None,
     ):
         """Execute script.
 
@@ -223,6 +224,7 @@ class Session(DBConnection):
             parallelism : parallelism determines the maximum number of threads to execute a job's tasks simultaneously on a data node; the system optimizes resource utilization by allocating all available threads to a job if there's only one job running and multiple local executors are available. Defaults to 64.
             fetchSize : the size of a block.
             disableDecimal: whether to convert decimal to double in the result table. True: convert to double, False: return as is. Defaults to False.
+            symbolAsCategory: whether to convert SYMBOL columns of the result table to pandas.Categorical. Requires PROTOCOL_DDB and pickleTableToList=False, otherwise an error is raised. Defaults to False.
 
         Note:
             fetchSize cannot be less than 8192 Bytes.
@@ -242,6 +244,7 @@ class Session(DBConnection):
                 priority=priority,
                 parallelism=parallelism,
                 disable_decimal=disableDecimal,
+                symbol_as_category=symbolAsCategory,
             )
         else:
             return self.exec(
@@ -252,6 +255,7 @@ class Session(DBConnection):
                 parallelism=parallelism,
                 fetch_size=fetchSize,
                 disable_decimal=disableDecimal,
+                symbol_as_category=symbolAsCategory,
             )
 
     def _run_with_table_schema(
@@ -350,7 +354,9 @@ class Session(DBConnection):
         msgAsTable: bool = False, batchSize: int = 0, throttle: float = 1.0,
         userName: str = "", password: str = "", streamDeserializer: Optional["StreamDeserializer"] = None,
         backupSites: List[str] = None, resubscribeInterval: int = 100, subOnce: bool = False,
-        *, resubTimeout: Optional[int] = None,
+        *, resubTimeout: Optional[int] = None, keyColumn: Optional[str] = None,
+        msgFormat: Literal["rows", "columns", "arrow", "pandas"] = "rows",
+        checkpoint: Optional["CheckpointStore"] = None, columns: Optional[List[str]] = None, where: Optional[str] = None,
     ) -> None:
         """Subscribe to stream tables in DolphinDB.
 
@@ -378,6 +384,18 @@ class Session(DBConnection):
             resubscribeInterval : a non-negative integer indicating the wait time (in milliseconds) between resubscription attempts when a disconnection is detected. Defaults to 100.
             subOnce : a boolean, indicating whether to attempt reconnecting to disconnected nodes after each node switch occurs. Defaults to False.
 
+        Kwargs:
+            keyColumn : only for streaming enabled with threadCount > 1 and batchSize > 0. Messages are sharded by the hash of this column,
+                so the messages with the same key are handled by the same thread in order. Defaults to None.
+            msgFormat : only for batchSize > 0 and msgAsTable = False. "columns" ingests each batch into handler as a dict of
+                numpy arrays keyed by column name, "arrow" as a pyarrow.RecordBatch, "pandas" as a DataFrame. With streamDeserializer,
+                each batch is grouped by symbol as {symbol: batch}. Defaults to "rows", a List of per-row lists.
+            checkpoint : a CheckpointStore, e.g. FileCheckpointStore, recording the offset of the last message handled successfully.
+                The subscription resumes after the recorded offset instead of offset. Not supported with threadCount > 1. Defaults to None.
+            columns : names of the columns to keep. Defaults to None, which keeps all columns.
+            where : a predicate such as "price > 10 and sym in ('A', 'B')", comparisons of columns with constants joined by "and".
+                Only the rows meeting it are ingested into handler. Defaults to None.
+
         Note:
             `resubTimeout` has been renamed to `resubscribeInterval`. Please update your code to use `resubscribeInterval` instead.
         """
@@ -386,6 +404,11 @@ class Session(DBConnection):
         self._check_streaming_enabled()
         if actionName is None:
             actionName = DEFAULT_ACTION_NAME
+        extra = {}
+        if keyColumn is not None:
+            if not isinstance(self.client, ThreadPooledClient):
+                raise ValueError("keyColumn requires streaming enabled with threadCount greater than 1.")
+            extra['key_column'] = keyColumn
         self.client.subscribe(config={
             'host': host,
             'port': port,
@@ -404,6 +427,11 @@ class Session(DBConnection):
             'backup_sites': backupSites,
             'resubscribe_interval': resubscribeInterval,
             'sub_once': subOnce,
+            'msg_format': msgFormat,
+            'checkpoint': checkpoint,
+            'columns': columns,
+            'where': where,
+            **extra,
         })
 
     def unsubscribe(self, host: str, port: int, tableName: str, actionName: str = None) -> None:
@@ -1,4 +1,14 @@
+import ast
+import asyncio
+import atexit
+import ctypes
+import json
+import os
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import final, overload
 
 import numpy as np
@@ -6,7 +16,7 @@ from pydantic import Field, model_validator
 from pydantic.dataclasses import dataclass
 
 from ._core import DolphinDBRuntime
-from ._hints import Any, Callable, Dict, List, Optional, Union
+from ._hints import Any, Callable, Dict, List, Literal, Optional, Union
 from .config import AnnotatedTemplate, NDArrayAnnotated, organize_config, CustomBaseModel
 from .settings import DDB_EPSILON
 from .connection import DBConnection
@@ -74,6 +84,207 @@ class SubscribeInfo:
         return self
 
 
+@dataclass
+class SubscriptionStat:
+    """Metrics of a subscription, returned by StreamingClient.stats.
+
+    Times are epoch milliseconds, handler times are milliseconds over the most recent calls.
+    """
+    queue_depth: int
+    last_offset: int
+    messages: int
+    bytes: int
+    messages_per_second: int
+    bytes_per_second: int
+    reconnects: int
+    last_sent_time: int
+    last_receive_time: int
+    handler_calls: int
+    handler_p50: float
+    handler_p90: float
+    handler_p99: float
+    handler_max: float
+
+    @property
+    def lag(self) -> Optional[int]:
+        """Milliseconds between the server sending the last message and this client receiving it."""
+        if self.last_sent_time < 0:
+            return None
+        return self.last_receive_time - self.last_sent_time
+
+
+class NativeHandler:
+    """A C function handling subscription batches without entering Python.
+
+    It is called on the handler thread with the GIL released, once per batch, with the
+    signature::
+
+        void handler(const void **columns, const int *types, int column_count,
+                     long long rows, void *user_data)
+
+    columns[i] points to the data array of column i, whose DolphinDB type (see
+    dolphindb.settings) is types[i]. STRING, SYMBOL, BLOB and array vector columns are
+    passed as NULL. The arrays are only valid during the call.
+
+    Args:
+        func : the function, as a numba cfunc, a ctypes function pointer or an address.
+        user_data : passed to every call, as a numpy array (its data pointer) or an address. Defaults to 0.
+    """
+    def __init__(self, func, user_data: Union[np.ndarray, int] = 0):
+        if hasattr(func, "address"):
+            address = func.address
+        elif isinstance(func, ctypes._CFuncPtr):
+            address = ctypes.cast(func, ctypes.c_void_p).value
+        elif isinstance(func, int):
+            address = func
+        else:
+            raise TypeError("func should be a numba cfunc, a ctypes function pointer or an address.")
+        if not address:
+            raise ValueError("func should not be a null pointer.")
+        if isinstance(user_data, np.ndarray):
+            user_data_address = user_data.ctypes.data
+        elif isinstance(user_data, int):
+            user_data_address = user_data
+        else:
+            raise TypeError("user_data should be a numpy array or an address.")
+        # the client keeps the handler, and so func and user_data, alive until unsubscribe
+        self._func = func
+        self._user_data = user_data
+        self.address = address
+        self.user_data_address = user_data_address
+
+
+class NativeHandlerAnnotated(AnnotatedTemplate[NativeHandler], NativeHandler):
+    base = NativeHandler
+
+
+class CheckpointStore(ABC):
+    """Persists the offset of the last message handled by a subscription.
+
+    A subscription with a checkpoint store resumes from the offset after the recorded one,
+    instead of its configured offset. Subclass it to keep the offsets elsewhere, e.g. in the
+    same transaction as the data written by the handler.
+    """
+    @abstractmethod
+    def load(self, topic: str) -> Optional[int]:
+        """Get the offset recorded for topic, or None if there is none."""
+
+    @abstractmethod
+    def save(self, topic: str, offset: int) -> None:
+        """Record offset as handled for topic. Called from the handler thread after each successful handler call."""
+
+    def flush(self) -> None:
+        """Persist the offsets that are still pending. Called on unsubscribe."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """CheckpointStore keeping the offsets of all its topics in a JSON file.
+
+    Args:
+        path : path of the file, created if it does not exist.
+        interval : the minimum number of seconds between two writes. The offsets saved in between
+            are written by the next save after the interval, by flush, or at interpreter exit, so a
+            crash re-delivers at most interval seconds of messages. 0 writes on every save.
+    """
+    def __init__(self, path: str, interval: float = 1.0):
+        self._path = path
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, int] = {}
+        self._dirty = False
+        self._last_write = 0.0
+        if os.path.exists(path):
+            with open(path) as f:
+                self._offsets = json.load(f)
+        _file_checkpoint_stores.add(self)
+
+    def __del__(self):
+        # a store that is no longer used leaves _file_checkpoint_stores, so write what is pending now
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def load(self, topic: str) -> Optional[int]:
+        with self._lock:
+            return self._offsets.get(topic)
+
+    def save(self, topic: str, offset: int) -> None:
+        with self._lock:
+            self._offsets[topic] = offset
+            self._dirty = True
+            if time.monotonic() - self._last_write >= self._interval:
+                self._write()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def _write(self):
+        # write to a temporary file first so that a crash never leaves a truncated checkpoint
+        tmp = self._path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._offsets, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path)
+        self._dirty = False
+        self._last_write = time.monotonic()
+
+
+# held weakly so that atexit does not keep every store alive until exit
+_file_checkpoint_stores = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_file_checkpoint_stores():
+    for store in list(_file_checkpoint_stores):
+        store.flush()
+
+
+_WHERE_OPS = {
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+    ast.In: "in", ast.NotIn: "not in",
+}
+
+
+def _parse_where(where: str) -> List[tuple]:
+    # "price > 10 and sym in ('A', 'B')" -> [("price", ">", 10), ("sym", "in", ["A", "B"])]
+    try:
+        expr = ast.parse(where.strip(), mode="eval").body
+    except SyntaxError:
+        raise ValueError(f"Invalid where expression: {where}")
+    nodes = expr.values if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.And) else [expr]
+    conditions = []
+    for node in nodes:
+        if not (isinstance(node, ast.Compare) and len(node.ops) == 1 and isinstance(node.left, ast.Name)
+                and type(node.ops[0]) in _WHERE_OPS):
+            raise ValueError(f"where should compare columns with constants, joined by 'and': {where}")
+        try:
+            value = ast.literal_eval(node.comparators[0])
+        except ValueError:
+            raise ValueError(f"where should compare columns with constants, joined by 'and': {where}")
+        op = _WHERE_OPS[type(node.ops[0])]
+        if op in ("in", "not in"):
+            if not isinstance(value, (list, tuple, set)):
+                raise ValueError(f"The value of '{op}' should be a list, tuple or set: {where}")
+            value = list(value)
+        conditions.append((node.left.id, op, value))
+    return conditions
+
+
+def _check_client_filter(config):
+    if config.columns is None and config.where is None:
+        return
+    if config.stream_deserializer is not None:
+        raise ValueError("columns and where are not supported with stream_deserializer.")
+    if config.columns is not None and not config.columns:
+        raise ValueError("columns should not be empty.")
+    if config.where is not None:
+        _parse_where(config.where)
+
+
 class StreamingClientConfig(CustomBaseModel):
     # callback: Optional[Callable[[SubscribeState, SubscribeInfo], None]] = None
     pass
@@ -83,10 +294,14 @@ class StreamDeserializerAnnotated(AnnotatedTemplate[StreamDeserializer], StreamD
     base = StreamDeserializer
 
 
+class CheckpointStoreAnnotated(AnnotatedTemplate[CheckpointStore], CheckpointStore):
+    base = CheckpointStore
+
+
 class SubscriptionConfig(CustomBaseModel):
     host: str
     port: int
-    handler: Callable[[Any], None]
+    handler: Union[NativeHandlerAnnotated, Callable[[Any], None]]
     table_name: str
     action_name: str = DEFAULT_ACTION_NAME
     offset: int = -1
@@ -101,6 +316,10 @@ class SubscriptionConfig(CustomBaseModel):
     backup_sites: Optional[List[str]] = Field(default_factory=list)
     resubscribe_interval: int = 100
     sub_once: bool = False
+    msg_format: Literal["rows", "columns", "arrow", "pandas"] = "rows"
+    checkpoint: Optional[CheckpointStoreAnnotated] = None
+    columns: Optional[List[str]] = None
+    where: Optional[str] = None
 
     @model_validator(mode="after")
     def throttle_check(self):
@@ -120,6 +339,73 @@ class SubscriptionConfig(CustomBaseModel):
             self.backup_sites = []
         return self
 
+    @model_validator(mode="after")
+    def msg_format_check(self):
+        if self.msg_format == "rows":
+            return self
+        if self.batch_size <= 0:
+            raise ValueError("msg_format must be 'rows' when batch_size is 0.")
+        if self.msg_as_table:
+            raise ValueError("msg_as_table must be False when msg_format is not 'rows'.")
+        if self.msg_format == "arrow":
+            __import__("pyarrow")
+        return self
+
+    @model_validator(mode="after")
+    def client_filter_check(self):
+        _check_client_filter(self)
+        return self
+
+    @model_validator(mode="after")
+    def native_handler_check(self):
+        if not isinstance(self.handler, NativeHandler):
+            return self
+        if self.batch_size <= 0:
+            raise ValueError("NativeHandler requires batch_size to be greater than 0.")
+        if self.msg_format != "rows" or self.stream_deserializer is not None or self.checkpoint is not None:
+            raise ValueError("NativeHandler does not support msg_format, stream_deserializer or checkpoint.")
+        return self
+
+
+def _format_handler(config: SubscriptionConfig) -> Optional[Callable]:
+    # columnar batches arrive as {column name: numpy array}, "arrow" wraps them into a RecordBatch;
+    # with a StreamDeserializer they are grouped as {symbol: batch}
+    handler = config.handler
+    if isinstance(handler, NativeHandler):
+        return None
+    if config.msg_format != "arrow":
+        return handler
+    import pyarrow as pa
+
+    if config.stream_deserializer is not None:
+        def grouped_arrow_handler(groups):
+            handler({symbol: pa.RecordBatch.from_pydict(columns) for symbol, columns in groups.items()})
+        return grouped_arrow_handler
+
+    def arrow_handler(columns):
+        handler(pa.RecordBatch.from_pydict(columns))
+    return arrow_handler
+
+
+def _subscription_dict(config: SubscriptionConfig, checkpoints: Dict[str, CheckpointStore]) -> dict:
+    d = config.model_dump()
+    d['stream_deserializer'] = config.stream_deserializer.cpp \
+        if config.stream_deserializer else None
+    d['handler'] = _format_handler(config)
+    d['native_handler'] = (config.handler.address, config.handler.user_data_address) \
+        if isinstance(config.handler, NativeHandler) else None
+    d['where'] = _parse_where(config.where) if config.where is not None else None
+    d['checkpoint'] = None
+    if config.checkpoint is not None:
+        store = config.checkpoint
+        topic = str(SubscribeInfo(config.host, config.port, config.table_name, config.action_name))
+        offset = store.load(topic)
+        if offset is not None:
+            d['offset'] = offset + 1
+        d['checkpoint'] = lambda offset: store.save(topic, offset)
+        checkpoints[topic] = store
+    return d
+
 
 class StreamingClient(ABC):
     _cpp: Any
@@ -165,6 +451,15 @@ class StreamingClient(ABC):
     def topic_strs(self) -> List[str]:
         return self._cpp.getSubscriptionTopics()
 
+    def stats(self) -> Dict[str, SubscriptionStat]:
+        """Get the metrics of each subscription, keyed by topic string.
+
+        Note:
+            The lag compares the server clock with the local clock, so it includes any clock skew between them.
+        """
+        stats = self._cpp.getStats()
+        return {topic: SubscriptionStat(**stat) for topic, stat in stats.items()}
+
 
 class ThreadedStreamingClientConfig(StreamingClientConfig):
     port: int = Field(0, ge=0)
@@ -174,13 +469,16 @@ class ThreadedClient(StreamingClient):
     def __init__(self, config: ThreadedStreamingClientConfig = None, **kwargs):
         config = organize_config(ThreadedStreamingClientConfig, config, kwargs)
         self._cpp = ddbcpp.ThreadedClient(config.model_dump())
+        self._checkpoints: Dict[str, CheckpointStore] = {}
+        self._native_handlers: Dict[str, NativeHandler] = {}
+        self._async_iterators: Dict[str, AsyncMessageIterator] = {}
 
     @overload
     def subscribe(
         self,
         host: str,
         port: int,
-        handler: Callable,
+        handler: Union[Callable, NativeHandler],
         table_name: str,
         action_name: str = DEFAULT_ACTION_NAME,
         *,
@@ -196,6 +494,10 @@ class ThreadedClient(StreamingClient):
         backup_sites: Optional[List[str]] = Field(default_factory=list),
         resubscribe_interval: int = 100,
         sub_once: bool = False,
+        msg_format: Literal["rows", "columns", "arrow", "pandas"] = "rows",
+        checkpoint: Optional[CheckpointStoreAnnotated] = None,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
     ) -> SubscribeInfo: ...
 
     @overload
@@ -217,6 +519,25 @@ class ThreadedClient(StreamingClient):
         config: SubscriptionConfig = None,
         **kwargs,
     ) -> SubscribeInfo:
+        """Subscribe to a stream table.
+
+        With batch_size > 0, msg_format="columns" delivers each batch as a dict of numpy arrays
+        keyed by column name, msg_format="arrow" as a pyarrow.RecordBatch and msg_format="pandas"
+        as a DataFrame. The batch is merged into one table before conversion, so no per-row
+        Python objects are created. With a stream_deserializer, the rows of each batch are
+        grouped by symbol and the handler receives {symbol: batch}.
+
+        With a checkpoint store, the offset of the last message of each successful handler call
+        is saved to it, and the subscription resumes after the saved offset.
+
+        A NativeHandler (batch_size > 0) is called with the column buffers of each batch
+        without acquiring the GIL.
+
+        columns keeps only the listed columns, and where only the rows meeting a conjunction of
+        comparisons between a column and a constant, e.g. "price > 10 and sym in ('A', 'B')".
+        Both are applied by the receiving thread, before the messages are queued, so the
+        discarded columns and rows never reach Python.
+        """
         if host is not None:
             kwargs['host'] = host
         if port is not None:
@@ -228,31 +549,62 @@ class ThreadedClient(StreamingClient):
         if action_name is not None:
             kwargs['action_name'] = action_name
         config = organize_config(SubscriptionConfig, config, kwargs)
-        d = config.model_dump()
-        d['stream_deserializer'] = (
-            config.stream_deserializer.cpp
-            if config.stream_deserializer
-            else None
-        )
+        d = _subscription_dict(config, self._checkpoints)
         topic_str = self._cpp.subscribe(d)
+        if isinstance(config.handler, NativeHandler):
+            self._native_handlers[topic_str] = config.handler
         return SubscribeInfo.parse(topic_str)
 
+    async def subscribe_async(
+        self,
+        host: str,
+        port: int,
+        table_name: str,
+        action_name: str = DEFAULT_ACTION_NAME,
+        **kwargs,
+    ) -> "AsyncMessageIterator":
+        """Subscribe to a stream table from an asyncio event loop.
+
+        Takes the same keyword arguments as subscribe, except handler and checkpoint.
+
+        Returns:
+            an AsyncMessageIterator yielding the messages received since the previous iteration.
+        """
+        return await _subscribe_async(self, host, port, table_name, action_name, kwargs)
+
+    def _unsubscribe_internal(self, info: SubscribeInfo):
+        super()._unsubscribe_internal(info)
+        # the handler threads have been joined, so the native handler can no longer be called
+        self._native_handlers.pop(str(info), None)
+        store = self._checkpoints.pop(str(info), None)
+        if store is not None:
+            store.flush()
+        _finish_async_iterator(self, info)
+
 
 class ThreadPooledStreamingClientConfig(ThreadedStreamingClientConfig):
     thread_count: int = Field(1)
 
 
+class ThreadPooledSubscriptionConfig(SubscriptionConfig):
+    key_column: str = ""
+
+
 class ThreadPooledClient(StreamingClient):
     def __init__(self, config: ThreadPooledStreamingClientConfig = None, **kwargs):
         config = organize_config(ThreadPooledStreamingClientConfig, config, kwargs)
         self._cpp = ddbcpp.ThreadPooledClient(config.model_dump())
+        self._thread_count = config.thread_count
+        self._checkpoints: Dict[str, CheckpointStore] = {}
+        self._native_handlers: Dict[str, NativeHandler] = {}
+        self._async_iterators: Dict[str, AsyncMessageIterator] = {}
 
     @overload
     def subscribe(
         self,
         host: str,
         port: int,
-        handler: Callable,
+        handler: Union[Callable, NativeHandler],
         table_name: str,
         action_name: str = DEFAULT_ACTION_NAME,
         *,
@@ -268,13 +620,18 @@ class ThreadPooledClient(StreamingClient):
         backup_sites: Optional[List[str]] = Field(default_factory=list),
         resubscribe_interval: int = 100,
         sub_once: bool = False,
+        msg_format: Literal["rows", "columns", "arrow", "pandas"] = "rows",
+        checkpoint: Optional[CheckpointStoreAnnotated] = None,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        key_column: str = "",
     ) -> SubscribeInfo: ...
 
     @overload
     def subscribe(
         self,
         *,
-        config: SubscriptionConfig = None,
+        config: ThreadPooledSubscriptionConfig = None,
         **kwargs,
     ) -> SubscribeInfo: ...
 
@@ -286,9 +643,24 @@ class ThreadPooledClient(StreamingClient):
         table_name: str = None,
         action_name: str = None,
         *,
-        config: SubscriptionConfig = None,
+        config: ThreadPooledSubscriptionConfig = None,
         **kwargs,
     ) -> SubscribeInfo:
+        """Subscribe to a stream table.
+
+        With batch_size > 0 the handler receives batches (a DataFrame if msg_as_table is True)
+        and the batches are handled by all threads of the pool. If key_column is specified,
+        messages are sharded by the hash of that column, so the messages with the same key are
+        handled by the same thread in the order they arrive. Rows decoded by a StreamDeserializer
+        are sharded by their source table instead.
+
+        msg_format="columns" delivers each batch as a dict of numpy arrays keyed by column
+        name, msg_format="arrow" as a pyarrow.RecordBatch and msg_format="pandas" as a DataFrame.
+        With a stream_deserializer, each batch is grouped as {symbol: batch}.
+
+        A checkpoint store requires thread_count to be 1, see ThreadedClient.subscribe.
+        NativeHandler, columns and where are supported as in ThreadedClient.subscribe.
+        """
         if host is not None:
             kwargs['host'] = host
         if port is not None:
@@ -299,9 +671,307 @@ class ThreadPooledClient(StreamingClient):
             kwargs['table_name'] = table_name
         if action_name is not None:
             kwargs['action_name'] = action_name
-        config = organize_config(SubscriptionConfig, config, kwargs)
+        config = organize_config(ThreadPooledSubscriptionConfig, config, kwargs)
+        if config.checkpoint is not None and self._thread_count > 1:
+            raise ValueError("checkpoint requires thread_count to be 1, as batches are handled out of order.")
+        d = _subscription_dict(config, self._checkpoints)
+        topic_str = self._cpp.subscribe(d)
+        if isinstance(config.handler, NativeHandler):
+            self._native_handlers[topic_str] = config.handler
+        return SubscribeInfo.parse(topic_str)
+
+    async def subscribe_async(
+        self,
+        host: str,
+        port: int,
+        table_name: str,
+        action_name: str = DEFAULT_ACTION_NAME,
+        **kwargs,
+    ) -> "AsyncMessageIterator":
+        """Subscribe to a stream table from an asyncio event loop.
+
+        Takes the same keyword arguments as subscribe, except handler and checkpoint.
+
+        Returns:
+            an AsyncMessageIterator yielding the messages received since the previous iteration.
+        """
+        return await _subscribe_async(self, host, port, table_name, action_name, kwargs)
+
+    def _unsubscribe_internal(self, info: SubscribeInfo):
+        super()._unsubscribe_internal(info)
+        # the handler threads have been joined, so the native handler can no longer be called
+        self._native_handlers.pop(str(info), None)
+        store = self._checkpoints.pop(str(info), None)
+        if store is not None:
+            store.flush()
+        _finish_async_iterator(self, info)
+
+
+class PollingSubscriptionConfig(CustomBaseModel):
+    host: str
+    port: int
+    table_name: str
+    action_name: str = DEFAULT_ACTION_NAME
+    offset: int = -1
+    resub: bool = False
+    filter: Union[str, NDArrayAnnotated, None] = None
+    msg_as_table: bool = False
+    batch_size: int = Field(1024, gt=0)
+    userid: str = ""
+    password: str = ""
+    stream_deserializer: Optional[StreamDeserializerAnnotated] = None
+    backup_sites: Optional[List[str]] = Field(default_factory=list)
+    resubscribe_interval: int = 100
+    sub_once: bool = False
+    columns: Optional[List[str]] = None
+    where: Optional[str] = None
+
+    @model_validator(mode="after")
+    def filter_check(self):
+        if self.filter is None:
+            self.filter = np.array([], dtype='int64')
+        return self
+
+    @model_validator(mode="after")
+    def backup_sites_check(self):
+        if self.backup_sites is None:
+            self.backup_sites = []
+        return self
+
+    @model_validator(mode="after")
+    def client_filter_check(self):
+        _check_client_filter(self)
+        return self
+
+
+# interval (in milliseconds) at which a blocked iteration returns to Python to handle signals
+_POLL_INTERVAL = 100
+
+
+class MessageIterator:
+    """Iterator over the messages of a PollingClient subscription.
+
+    Each item is a batch of at most batch_size messages: a list of rows, or a DataFrame if
+    msg_as_table is True. Waiting for messages releases the GIL. Messages are buffered in a
+    bounded queue, so a consumer that falls behind slows down the publisher instead of
+    growing memory. The iteration stops after the subscription is cancelled.
+    """
+    def __init__(self, info: SubscribeInfo, queue, batch_size: int):
+        self._info = info
+        self._queue = queue
+        self._batch_size = batch_size
+
+    @property
+    def info(self) -> SubscribeInfo:
+        return self._info
+
+    @property
+    def finished(self) -> bool:
+        """Whether the subscription has been cancelled and all messages have been consumed."""
+        return self._queue.finished
+
+    def qsize(self) -> int:
+        """Number of messages waiting in the queue."""
+        return self._queue.size()
+
+    def poll(self, timeout: Optional[float] = None) -> Any:
+        """Get the next batch of messages.
+
+        Args:
+            timeout : maximum time (in seconds) to wait for a message. Defaults to None, which means to wait without limit.
+
+        Returns:
+            a batch of messages, or None if no message arrived within timeout or the subscription has ended.
+        """
+        timeout_ms = -1 if timeout is None else max(0, int(timeout * 1000))
+        return self._queue.poll(self._batch_size, timeout_ms)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            batch = self._queue.poll(self._batch_size, _POLL_INTERVAL)
+            if batch is not None:
+                return batch
+            if self._queue.finished:
+                raise StopIteration
+
+
+class AsyncMessageIterator:
+    """Async iterator over the messages of a subscription, returned by subscribe_async.
+
+    The handler thread appends each message to a deque and wakes the event loop only if no
+    wakeup is already pending, so while the loop is busy the messages coalesce and the next
+    iteration returns all of them at once. Each item is a list: of rows if msg_format is
+    "rows" and msg_as_table is False, otherwise of the batches the handler would receive.
+    The iteration stops after the subscription is cancelled.
+    """
+    def __init__(self, client: StreamingClient, loop: asyncio.AbstractEventLoop, flatten: bool):
+        self._client = client
+        self._loop = loop
+        self._flatten = flatten
+        self._info: Optional[SubscribeInfo] = None
+        self._pending = deque()
+        self._scheduled = False
+        self._waiter: Optional[asyncio.Future] = None
+        self._finished = False
+
+    @property
+    def info(self) -> SubscribeInfo:
+        return self._info
+
+    @property
+    def finished(self) -> bool:
+        """Whether the subscription has been cancelled and all messages have been consumed."""
+        return self._finished and not self._pending
+
+    def _push(self, msg):
+        # runs on the handler thread; deque.append is atomic, so only the wakeup crosses threads
+        self._pending.append(msg)
+        if not self._scheduled:
+            self._scheduled = True
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+    def _wakeup(self):
+        self._scheduled = False
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _finish(self):
+        self._finished = True
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup)
+        except RuntimeError:
+            # the event loop is already closed
+            pass
+
+    def _drain(self) -> list:
+        items = []
+        pending = self._pending
+        while pending:
+            msg = pending.popleft()
+            if self._flatten:
+                items.extend(msg)
+            else:
+                items.append(msg)
+        return items
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> list:
+        while not self._pending:
+            if self._finished:
+                raise StopAsyncIteration
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._drain()
+
+    async def aclose(self) -> None:
+        """Cancel the subscription."""
+        if not self._finished:
+            await self._loop.run_in_executor(None, self._client.unsubscribe, self._info)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+async def _subscribe_async(client: StreamingClient, host: str, port: int, table_name: str, action_name: str,
+                           kwargs: dict) -> AsyncMessageIterator:
+    if kwargs.get("checkpoint") is not None:
+        # the handler only queues the messages, so an offset would be saved before they are consumed
+        raise ValueError("subscribe_async does not support checkpoint.")
+    loop = asyncio.get_running_loop()
+    flatten = (kwargs.get("batch_size", 0) > 0 and kwargs.get("msg_format", "rows") == "rows"
+               and not kwargs.get("msg_as_table", False))
+    iterator = AsyncMessageIterator(client, loop, flatten)
+    # connecting to the publisher blocks, keep it off the event loop
+    iterator._info = await loop.run_in_executor(
+        None, lambda: client.subscribe(host, port, iterator._push, table_name, action_name, **kwargs)
+    )
+    client._async_iterators[str(iterator._info)] = iterator
+    return iterator
+
+
+def _finish_async_iterator(client: StreamingClient, info: SubscribeInfo):
+    iterator = client._async_iterators.pop(str(info), None)
+    if iterator is not None:
+        iterator._finish()
+
+
+class PollingClient(StreamingClient):
+    """Streaming client whose subscriptions are consumed by iterating instead of by callbacks."""
+    def __init__(self, config: ThreadedStreamingClientConfig = None, **kwargs):
+        config = organize_config(ThreadedStreamingClientConfig, config, kwargs)
+        self._cpp = ddbcpp.PollingClient(config.model_dump())
+
+    @overload
+    def subscribe(
+        self,
+        host: str,
+        port: int,
+        table_name: str,
+        action_name: str = DEFAULT_ACTION_NAME,
+        *,
+        offset: int = -1,
+        resub: bool = False,
+        filter: Union[str, NDArrayAnnotated, None] = None,
+        msg_as_table: bool = False,
+        batch_size: int = 1024,
+        userid: str = "",
+        password: str = "",
+        stream_deserializer: Optional[StreamDeserializerAnnotated] = None,
+        backup_sites: Optional[List[str]] = Field(default_factory=list),
+        resubscribe_interval: int = 100,
+        sub_once: bool = False,
+        columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+    ) -> MessageIterator: ...
+
+    @overload
+    def subscribe(
+        self,
+        *,
+        config: PollingSubscriptionConfig = None,
+        **kwargs,
+    ) -> MessageIterator: ...
+
+    def subscribe(
+        self,
+        host: str = None,
+        port: int = None,
+        table_name: str = None,
+        action_name: str = None,
+        *,
+        config: PollingSubscriptionConfig = None,
+        **kwargs,
+    ) -> MessageIterator:
+        """Subscribe to a stream table.
+
+        columns and where filter the messages before they are queued, see ThreadedClient.subscribe.
+
+        Returns:
+            a MessageIterator yielding batches of at most batch_size messages.
+        """
+        if host is not None:
+            kwargs['host'] = host
+        if port is not None:
+            kwargs['port'] = port
+        if table_name is not None:
+            kwargs['table_name'] = table_name
+        if action_name is not None:
+            kwargs['action_name'] = action_name
+        config = organize_config(PollingSubscriptionConfig, config, kwargs)
         d = config.model_dump()
         d['stream_deserializer'] = config.stream_deserializer.cpp \
             if config.stream_deserializer else None
-        topic_str = self._cpp.subscribe(d)
-        return SubscribeInfo.parse(topic_str)
+        d['where'] = _parse_where(config.where) if config.where is not None else None
+        topic_str, queue = self._cpp.subscribe(d)
+        return MessageIterator(SubscribeInfo.parse(topic_str), queue, config.batch_size)
@@ -1246,15 +1246,18 @@ class Table(object):
             # print(query)
             return self.__session.run(query)
 
-    def toDF(self) -> DataFrame:
+    def toDF(self, symbolAsCategory: bool = False) -> DataFrame:
         """Execute SQL statement and return a DataFrame object.
 
+        Args:
+            symbolAsCategory : whether to convert SYMBOL columns to pandas.Categorical. Defaults to False.
+
         Returns:
             data queried by SQL in DataFrame form.
         """
         self._init_schema()
         query = self.showSQL()
-        df = self.__session.run(query)  # type: DataFrame
+        df = self.__session.run(query, symbolAsCategory=symbolAsCategory)  # type: DataFrame
         return df
 
     def toList(self) -> list:
@@ -1,7 +1,7 @@
 from pandas import DataFrame
 
 from ._core import DolphinDBRuntime
-from ._hints import Any, List, Tuple
+from ._hints import Any, Dict, List, Tuple, Union
 from .utils import deprecated
 
 ddbcpp = DolphinDBRuntime()._ddbcpp
@@ -374,6 +374,29 @@ class MultithreadedTableWriter(object):
         errorCodeInfo.__dict__.update(self.writer.insert(*args))
         return errorCodeInfo
 
+    def insertBatch(self, data: Union[DataFrame, Dict[str, Any]]) -> ErrorCodeInfo:
+        """Insert a batch of rows at once.
+
+        The columns are converted as a whole instead of row by row, and the rows are
+        routed to the writing threads by the partitioning column, so inserting a large
+        DataFrame is much cheaper than calling insert for each row.
+
+        Note:
+            Columns are matched with the target table by position. The order in which
+            the batch is written relative to rows passed to insert is not guaranteed.
+
+        Args:
+            data : a DataFrame, or a dict of column name to array-like column data.
+
+        Returns:
+            a ErrorCodeInfo object.
+        """
+        if isinstance(data, dict):
+            data = DataFrame(data)
+        errorCodeInfo = ErrorCodeInfo()
+        errorCodeInfo.__dict__.update(self.writer.insertBatch(data))
+        return errorCodeInfo
+
     def insertUnwrittenData(self, unwrittenData) -> ErrorCodeInfo:
         """Insert unwritten data.
 
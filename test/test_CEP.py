@@ -7748,6 +7748,85 @@ class TestEventSender(object):
             EventSender(self.__class__.conn, "absent", [EventSchema])
 
 
+    def test_EventSender_sendEvents(self):
+        class EventTest(Event):
+            s_int: Scalar[keys.DT_INT]
+            v_double: Vector[keys.DT_DOUBLE]
+            eventTime: Scalar[keys.DT_TIMESTAMP]
+
+        func_name = inspect.currentframe().f_code.co_name
+        for suffix in ("single", "bulk", "batched"):
+            self.__class__.conn.run(
+                f"share streamTable(array(TIMESTAMP, 0) as eventTime, array(SYMBOL, 0) as eventType, "
+                f"array(BLOB, 0) as blobs, array(INT, 0) as s_int, array(DOUBLE[], 0) as v_double) "
+                f"as {func_name}_{suffix}")
+        events = [EventTest(i, [i, None, i * 0.5], np.datetime64(f"2024-03-25T12:30:05.{i:03}", "ms"))
+                  for i in range(10)]
+        kwargs = dict(eventTimeFields="eventTime", commonFields=["s_int", "v_double"])
+        sender = EventSender(self.__class__.conn, f"{func_name}_single", [EventTest], **kwargs)
+        for event in events:
+            sender.sendEvent(event)
+        sender = EventSender(self.__class__.conn, f"{func_name}_bulk", [EventTest], **kwargs)
+        sender.sendEvents(events)
+        sender = EventSender(self.__class__.conn, f"{func_name}_batched", [EventTest], batchSize=4, throttle=0.1,
+                             **kwargs)
+        for event in events:
+            sender.sendEvent(event)
+        assert self.__class__.conn.run(f"size({func_name}_batched)") >= 8
+        sleep(1)
+        sender.close()
+        assert self.__class__.conn.run(f"eqObj({func_name}_single.values(), {func_name}_bulk.values())")
+        assert self.__class__.conn.run(f"eqObj({func_name}_single.values(), {func_name}_batched.values())")
+
+        # the event time is converted to the type of the time column, as tableInsert does
+        class EventNano(Event):
+            s_int: Scalar[keys.DT_INT]
+            eventTime: Scalar[keys.DT_NANOTIMESTAMP]
+
+        for suffix in ("nano_single", "nano_bulk"):
+            self.__class__.conn.run(
+                f"share streamTable(array(TIMESTAMP, 0) as eventTime, array(SYMBOL, 0) as eventType, "
+                f"array(BLOB, 0) as blobs) as {func_name}_{suffix}")
+        events = [EventNano(i, np.datetime64(f"2024-03-25T12:30:05.{i:03}000000", "ns")) for i in range(10)]
+        sender = EventSender(self.__class__.conn, f"{func_name}_nano_single", [EventNano], eventTimeFields="eventTime")
+        for event in events:
+            sender.sendEvent(event)
+        sender = EventSender(self.__class__.conn, f"{func_name}_nano_bulk", [EventNano], eventTimeFields="eventTime")
+        sender.sendEvents(events)
+        assert self.__class__.conn.run(f"eqObj({func_name}_nano_single.values(), {func_name}_nano_bulk.values())")
+        assert self.__class__.conn.run(f"exec eventTime from {func_name}_nano_bulk")[9] == \
+            np.datetime64("2024-03-25T12:30:05.009", "ns")
+
+    def test_EventSender_keeps_failed_events(self):
+        class EventTest(Event):
+            s_int: Scalar[keys.DT_INT]
+
+        func_name = inspect.currentframe().f_code.co_name
+        self.__class__.conn.run(f"share streamTable(array(SYMBOL, 0) as eventType, array(BLOB, 0) as blobs) "
+                                f"as {func_name}_table")
+        events = [EventTest(i) for i in range(5)]
+        with EventSender(self.__class__.conn, f"{func_name}_table", [EventTest], batchSize=100,
+                         throttle=60) as sender:
+            self.__class__.conn.run(f"undef(`{func_name}_table, SHARED)")
+            with pytest.raises(RuntimeError):
+                sender.sendEvents(events)
+            # the events are kept to be sent again
+            assert [event.s_int for event in sender.getUnsentEvents()] == list(range(5))
+            assert sender.getUnsentEvents() == []
+            self.__class__.conn.run(f"share streamTable(array(SYMBOL, 0) as eventType, array(BLOB, 0) as blobs) "
+                                    f"as {func_name}_table")
+            sender.sendEvent(events[0])
+        # leaving the with block sends the buffered event
+        assert self.__class__.conn.run(f"size({func_name}_table)") == 1
+
+    def test_EventSender_batchSize_error(self):
+        class EventTest(Event):
+            s_bool: Scalar[keys.DT_BOOL]
+
+        with pytest.raises(ValueError, match="batchSize must be a positive int"):
+            EventSender(self.__class__.conn, "input", [EventTest], batchSize=0)
+
+
 class TestEventClient(object):
     conn: ddb.Session = ddb.Session(HOST, PORT, USER, PASSWD, enablePickle=False)
 
@@ -7980,6 +8059,48 @@ class TestEventClient(object):
         client.unsubscribe(HOST, PORT, f"{func_name}_input")
 
 
+    def test_EventClient_subscribe_asFrames(self):
+        class EventA(Event):
+            s_int: Scalar[keys.DT_INT]
+            v_double: Vector[keys.DT_DOUBLE]
+
+        class EventB(Event):
+            s_string: Scalar[keys.DT_STRING]
+
+        func_name = inspect.currentframe().f_code.co_name
+        self.__class__.conn.run(f"""
+            share streamTable(array(STRING, 0) as eventType, array(BLOB, 0) as blobs) as {func_name}_input
+        """)
+        sender = EventSender(self.__class__.conn, f"{func_name}_input", [EventA, EventB])
+        sender.sendEvents([EventA(i, [i, i * 0.5]) if i % 2 == 0 else EventB(str(i)) for i in range(10)])
+        batches = []
+        events = []
+        client = EventClient([EventA, EventB])
+        client.subscribe(HOST, PORT, batches.append, f"{func_name}_input", "frames", offset=0, userName=USER,
+                         password=PASSWD, batchSize=100, throttle=0.1, asFrames=True)
+        client.subscribe(HOST, PORT, events.extend, f"{func_name}_input", "events", offset=0, userName=USER,
+                         password=PASSWD, batchSize=100, throttle=0.1)
+        sleep(1)
+        client.unsubscribe(HOST, PORT, f"{func_name}_input", "frames")
+        client.unsubscribe(HOST, PORT, f"{func_name}_input", "events")
+        frames = {}
+        for batch in batches:
+            for name, df in batch.items():
+                frames[name] = pd.concat([frames[name], df], ignore_index=True) if name in frames else df
+        assert list(frames["EventA"]["s_int"]) == [0, 2, 4, 6, 8]
+        assert all(equalPlus(v, np.array([i, i * 0.5])) for v, i in zip(frames["EventA"]["v_double"], range(0, 10, 2)))
+        assert list(frames["EventB"]["s_string"]) == ["1", "3", "5", "7", "9"]
+        assert [type(e).__name__ for e in events] == ["EventA", "EventB"] * 5
+
+    def test_EventClient_subscribe_asFrames_without_batchSize(self):
+        class EventTest(Event):
+            s_bool: Scalar[keys.DT_BOOL]
+
+        client = EventClient([EventTest])
+        with pytest.raises(ValueError, match="asFrames requires batchSize to be greater than 0"):
+            client.subscribe(HOST, PORT, print, "input", asFrames=True)
+
+
 class TestEvent(object):
     conn: ddb.Session = ddb.Session(HOST, PORT, USER, PASSWD, enablePickle=False)
 
@@ -8030,3 +8151,18 @@ class TestEvent(object):
         with pytest.raises(ValueError, match="Must specify exparam for DECIMAL"):
             class Decimal128MissPrecision(Event):
                 v_decimal128: Vector[keys.DT_DECIMAL128]
+
+    def test_Event_slots(self):
+        class EventSlots(Event):
+            s_int: Scalar[keys.DT_INT]
+            v_double: Vector[keys.DT_DOUBLE]
+
+        event = EventSlots(1, v_double=[1.0, 2.0])
+        assert EventSlots.__slots__ == ("s_int", "v_double")
+        assert not hasattr(event, "__dict__")
+        assert event.s_int == 1
+        assert event.v_double == [1.0, 2.0]
+        with pytest.raises(AttributeError):
+            event.absent = 1
+        with pytest.raises(AttributeError):
+            EventSlots(1).v_double
@@ -1113,3 +1113,21 @@ class TestDBConnectionPool:
                 tryReconnectNums=1,
                 usePublicName=usePublicName
             )
+
+    def test_DBConnectionPool_run_many_small_tasks(self):
+        pool = ddb.DBConnectionPool(HOST, PORT, 4, USER, PASSWD)
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        tasks = [loop.create_task(pool.run(f"{i}+1")) for i in range(1000)]
+        loop.run_until_complete(asyncio.wait(tasks))
+        assert [task.result() for task in tasks] == [i + 1 for i in range(1000)]
+        pool.shutDown()
+        loop.close()
+
+    def test_DBConnectionPool_run_error_after_completion(self):
+        pool = ddb.DBConnectionPool(HOST, PORT, 2, USER, PASSWD)
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        with pytest.raises(RuntimeError, match="come across exception"):
+            loop.run_until_complete(pool.run("undefined_func_xxx()"))
+        assert loop.run_until_complete(pool.run("1+1")) == 2
+        pool.shutDown()
+        loop.close()
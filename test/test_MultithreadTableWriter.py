@@ -2141,6 +2141,43 @@ class TestMultithreadTableWriter:
         assert_frame_equal(re, ex)
         self.conn.dropDatabase(db_name)
 
+    def test_multithreadTableWriterTest_insertBatch_DFS_HASH(self):
+        func_name = inspect.currentframe().f_code.co_name
+        db_name = f"dfs://{func_name}"
+        self.conn.run(f"""
+            if(existsDatabase("{db_name}")){{
+                dropDatabase("{db_name}")
+            }}
+            datetest=table(1000:0,`date`id`sym,[DATE,LONG,SYMBOL])
+            db=database("{db_name}",HASH, [LONG,10])
+            pt=db.createPartitionedTable(datetest,'{func_name}','id')
+        """)
+        writer = ddb.MultithreadedTableWriter(HOST, PORT, USER, PASSWD, db_name, func_name, False, False, [], 100,
+                                              0.1, 4, "id")
+        n = 100000
+        df = pd.DataFrame({
+            "date": np.array(["2016-01-12", "2016-02-12"] * (n // 2), dtype="datetime64[D]"),
+            "id": np.arange(n, dtype=np.int64),
+            "sym": ["a", "b", "c", "d"] * (n // 4),
+        })
+        res = writer.insertBatch(df)
+        assert not res.hasError()
+        res = writer.insertBatch({"d": df["date"].values[:10], "i": np.arange(n, n + 10), "s": ["e"] * 10})
+        assert not res.hasError()
+        res = writer.insertBatch(df[["date", "id"]])
+        assert res.hasError()
+        assert res.errorCode == "A2"
+        writer.waitForThreadCompletion()
+        status = writer.getStatus()
+        assert not status.hasError()
+        assert status.sentRows == n + 10
+        re = self.conn.run(f"select * from loadTable('{db_name}','{func_name}') order by id")
+        ex = pd.concat([df, pd.DataFrame({"date": df["date"].values[:10], "id": np.arange(n, n + 10), "sym": ["e"] * 10})],
+                       ignore_index=True)
+        ex["date"] = ex["date"].astype("datetime64[ns]")
+        assert_frame_equal(re, ex, check_dtype=False)
+        self.conn.dropDatabase(db_name)
+
     def test_multithreadTableWriterTest_DFS_VALUE(self):
         func_name = inspect.currentframe().f_code.co_name
         db_name = f"dfs://{func_name}"
@@ -0,0 +1,58 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas._testing import assert_frame_equal
+
+from dolphindb import AsyncSession
+from setup.settings import HOST, PORT, USER, PASSWD
+
+
+class TestAsyncSession(object):
+
+    def test_AsyncSession_protocol_error(self):
+        with pytest.raises(RuntimeError, match="AsyncSession only supports PROTOCOL_DDB."):
+            AsyncSession(protocol="pickle")
+        with pytest.raises(RuntimeError, match="AsyncSession does not support SSL."):
+            AsyncSession(enable_ssl=True)
+
+    def test_AsyncSession_encrypted_login(self):
+        async def main():
+            async with AsyncSession() as conn:
+                with pytest.raises(RuntimeError, match="AsyncSession does not support encrypted login."):
+                    await conn.connect(HOST, PORT, USER, PASSWD, enable_encryption=True)
+                assert conn.is_closed
+        asyncio.run(main())
+
+    def test_AsyncSession_exec_call_upload(self):
+        async def main():
+            async with AsyncSession() as conn:
+                await conn.connect(HOST, PORT, USER, PASSWD)
+                assert await conn.exec("1+1") == 2
+                assert await conn.call("add", 1, 2) == 3
+                df = pd.DataFrame({"a": np.arange(100000, dtype=np.int64), "b": np.arange(100000, dtype=np.float64)})
+                await conn.upload({"t": df})
+                assert_frame_equal(await conn.exec("select * from t"), df)
+                assert await conn.exec("rows(t)") == 100000
+        asyncio.run(main())
+
+    def test_AsyncSession_many_sessions(self):
+        async def query(i):
+            async with AsyncSession() as conn:
+                await conn.connect(HOST, PORT, USER, PASSWD)
+                return await conn.exec(f"sleep(100);{i}")
+
+        async def main():
+            return await asyncio.gather(*[query(i) for i in range(50)])
+        assert asyncio.run(main()) == list(range(50))
+
+    def test_AsyncSession_server_error(self):
+        async def main():
+            async with AsyncSession() as conn:
+                await conn.connect(HOST, PORT, USER, PASSWD)
+                with pytest.raises(RuntimeError, match="Server Response"):
+                    await conn.exec("undefined_func_xxx()")
+                assert not conn.is_closed
+                assert await conn.exec("1") == 1
+        asyncio.run(main())
@@ -1,6 +1,8 @@
+import pandas as pd
 import pytest
 from threading import Thread
 from dolphindb import DBConnection, ConnectionSetting, ConnectionConfig
+from pandas._testing import assert_frame_equal
 from setup.settings import HOST, PORT, USER, PASSWD
 
 
@@ -182,3 +184,129 @@ class TestDBConnection(object):
         else:
             blockReader.skip_all()
         assert total == 10000 * 10
+
+    def test_DBConnection_pipeline(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        with conn.pipeline(max_in_flight=8) as p:
+            futures = [p.exec(f"{i}+1") for i in range(100)]
+            error = p.exec("undefined_func_xxx()")
+            called = p.call("add", 1, 2)
+        assert [f.result() for f in futures] == [i + 1 for i in range(100)]
+        with pytest.raises(RuntimeError, match="<Exception> in pipeline"):
+            error.result()
+        assert called.result() == 3
+        assert conn.exec("1+1") == 2
+
+    def test_DBConnection_pipeline_cancel(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        p = conn.pipeline()
+        future = p.exec("x = 1")
+        future.cancel()
+        p.flush()
+        assert future.cancelled()
+        with pytest.raises(ValueError):
+            conn.pipeline(max_in_flight=0)
+
+    def test_DBConnection_call_many(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        args = [(i, i * 2) for i in range(1000)]
+        assert conn.call_many("add", args) == [i * 3 for i in range(1000)]
+        assert conn.call_many("add", args, parallel=True) == [i * 3 for i in range(1000)]
+        assert conn.call_many("string", [1, 2]) == ["1", "2"]
+        assert conn.call_many("add", []) == []
+        assert conn.exec("exec count(*) from objs() where name like 'CALL_MANY%'") == 0
+        with pytest.raises(ValueError):
+            conn.call_many("add", [(1, 2), (1,)])
+
+    def test_DBConnection_call_many_upload_error(self, monkeypatch):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        # the upload, the loop and the undef are sent together
+        monkeypatch.setattr(conn, "_run_pipeline", lambda requests, max_in_flight: [
+            (False, "upload failed"), (False, "Cannot recognize the token CALL_MANY_0"), (True, None)])
+        with pytest.raises(RuntimeError, match="upload failed"):
+            conn.call_many("add", [(1, 2)])
+
+    def test_DBConnection_prepare(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.exec("share table(take(`a`b`c, 30) as sym, 1..30 as val) as prepared_t")
+        try:
+            stmt = conn.prepare("select * from prepared_t where sym=$1 and val>$2;")
+            assert stmt.argc == 2
+            assert_frame_equal(stmt.execute("a", 10), conn.exec("select * from prepared_t where sym=`a and val>10"))
+            assert conn.prepare("select * from prepared_t where sym=$1 and val>$2").name == stmt.name
+            assert conn.prepare("exec count(*) from prepared_t").execute() == 30
+            conn.close()
+            conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+            assert len(stmt.execute("b", 20)) == 3
+            with pytest.raises(ValueError):
+                stmt.execute("a")
+            with pytest.raises(ValueError):
+                conn.prepare("select * from prepared_t where val>$0")
+        finally:
+            conn.exec("undef(`prepared_t, SHARED)")
+
+    def test_DBConnection_prepare_string_literal(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        # $N inside a string literal is text, not a placeholder
+        stmt = conn.prepare('$1 + "$2" + \'$3\' + "\\"$4"')
+        assert stmt.argc == 1
+        assert stmt.execute("a") == 'a$2$3"$4'
+
+    @pytest.mark.parametrize('prefetch', [1, 2, 8])
+    def test_DBConnection_iter_batches(self, prefetch):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.exec("t = table(1..100000 as id, rand(100.0, 100000) as val)")
+        batches = list(conn.iter_batches("select * from t", fetch_size=10000, prefetch=prefetch))
+        assert len(batches) == 10
+        assert_frame_equal(pd.concat(batches, ignore_index=True), conn.exec("select * from t"))
+        with pytest.raises(ValueError):
+            conn.iter_batches("select * from t", fetch_size=10000, prefetch=0)
+
+    def test_DBConnection_iter_batches_close_early(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        batches = conn.iter_batches("table(1..100000 as id)", fetch_size=10000)
+        assert len(next(batches)) == 10000
+        batches.close()
+        assert conn.exec("1+1") == 2
+
+    def test_DBConnection_iter_batches_not_iterated(self):
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        batches = conn.iter_batches("table(1..100000 as id)", fetch_size=10000)
+        assert conn.exec("1+1") == 2
+        assert sum(len(batch) for batch in batches) == 100000
+        assert conn.exec("1+1") == 2
+
+    def test_DBConnection_iter_batches_producer_error(self, monkeypatch):
+        from dolphindb.connection import BlockReader
+        read = BlockReader.read
+
+        def failing_read(self):
+            # the block is read, then its conversion fails
+            read(self)
+            raise ValueError("conversion failed")
+
+        monkeypatch.setattr(BlockReader, "read", failing_read)
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        batches = conn.iter_batches("table(1..100000 as id)", fetch_size=10000)
+        with pytest.raises(ValueError, match="conversion failed"):
+            next(batches)
+        monkeypatch.undo()
+        assert conn.exec("1+1") == 2
+
+    def test_DBConnection_iter_batches_as_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        conn = DBConnection()
+        conn.connect(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        batches = list(conn.iter_batches("table(1..100000 as id)", fetch_size=10000, as_arrow=True))
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 100000
@@ -1,4 +1,5 @@
 import dolphindb as ddb
+import pandas as pd
 import pytest
 from numpy.testing import assert_almost_equal, assert_array_almost_equal, assert_array_equal, assert_equal
 from pandas._testing import assert_frame_equal
@@ -168,3 +169,40 @@ class TestDownload:
                         p.loc[index, i] = j.astype("datetime64[ns]")
             assert_frame_equal(conn.run(s), p)
         conn.close()
+
+    @pytest.mark.parametrize('compress', [True, False], ids=["EnCompress", "UnCompress"])
+    def test_download_Table_symbolAsCategory(self, compress):
+        conn = ddb.session(HOST, PORT, USER, PASSWD, enablePickle=False, compress=compress)
+        conn.run("t = table(symbol(take(`A`B`C, 10000)) as sym, take(symbol(['a', '']), 10000) as sym2, "
+                 "take(`x`y, 10000) as str, 1..10000 as val)")
+        res = conn.run("t", symbolAsCategory=True)
+        assert isinstance(res["sym"].dtype, pd.CategoricalDtype)
+        assert isinstance(res["sym2"].dtype, pd.CategoricalDtype)
+        assert res["str"].dtype == object
+        assert_frame_equal(res.astype({"sym": object, "sym2": object}), conn.run("t"))
+        assert_frame_equal(conn.table(data="t").toDF(symbolAsCategory=True), res)
+        with pytest.raises(RuntimeError, match="symbolAsCategory requires PROTOCOL_DDB"):
+            conn.run("t", symbolAsCategory=True, pickleTableToList=True)
+        conn.close()
+
+    def test_download_Table_symbolAsCategory_pickle(self):
+        conn = ddb.session(HOST, PORT, USER, PASSWD, enablePickle=True)
+        with pytest.raises(RuntimeError, match="symbolAsCategory requires PROTOCOL_DDB"):
+            conn.run("table(symbol(`A`B) as sym)", symbolAsCategory=True)
+        conn.close()
+
+    @pytest.mark.parametrize('pickleTableToList', [True, False], ids=["EnList", "UnList"])
+    def test_download_Table_wide(self, pickleTableToList):
+        conn = ddb.session(HOST, PORT, USER, PASSWD, enablePickle=False)
+        conn.run("""
+            n = 100000
+            cols = [take(1..10 join NULL, n), rand(100.0, n), 2020.01.01 + 0..(n-1), take(`a`b, n)]
+            t = table(cols[0] as c0)
+            for (i in 1:400) { t[`c + string(i)] = cols[i % 4] }
+        """)
+        res = conn.run("t", pickleTableToList=pickleTableToList)
+        for i in range(0, 400, 97):
+            expect = conn.run(f"exec c{i} from t")
+            col = res[i] if pickleTableToList else res[f"c{i}"]
+            assert_array_equal(col, expect)
+        conn.close()
@@ -85,6 +85,68 @@ class TestPartitionedTableAppender:
         num = appender.append(data)
         assert num == self.conn.run(f'exec count(*) from loadTable("{db_name}", "pt")')
 
+    @pytest.mark.parametrize('_compress', ["COMPRESS_OPEN", "COMPRESS_CLOSE"])
+    def test_PartitionedTableAppender_append_async(self, _compress):
+        func_name = inspect.currentframe().f_code.co_name
+        db_name = f"dfs://{func_name}" + self.SEP + _compress
+        pool = self.pool_list[_compress]
+        self.conn.run(f'''
+            dbPath = "{db_name}"
+            if(existsDatabase(dbPath))
+                dropDatabase(dbPath)
+            t = table(100:100,`sym`id`qty`price,[SYMBOL,INT,INT,DOUBLE])
+            db=database(dbPath,RANGE,[1,10001,20001,30001,40001,50001,60001])
+            pt = db.createPartitionedTable(t, `pt, `id)
+        ''')
+        appender = ddb.PartitionedTableAppender(db_name, "pt", "id", pool)
+        futures = []
+        for i in range(10):
+            id = np.arange(1, 60001, 60, dtype=np.int32) + i
+            data = pd.DataFrame({'sym': ['a'] * 1000, 'id': id, 'qty': id, 'price': id * 0.1})
+            futures.append(appender.append_async(data))
+        assert [f.result(timeout=60) for f in futures] == [1000] * 10
+        assert self.conn.run(f'exec count(*) from loadTable("{db_name}", "pt")') == 10000
+        empty = pd.DataFrame({'sym': np.array([], dtype=object), 'id': np.array([], dtype=np.int32),
+                              'qty': np.array([], dtype=np.int32), 'price': np.array([], dtype=np.float64)})
+        assert appender.append_async(empty).result(timeout=60) == 0
+        assert appender.append(pd.DataFrame({'sym': ['a'], 'id': np.array([1], dtype=np.int32), 'qty': [1], 'price': [0.1]})) == 1
+        # append_async returns while the only connection of the pool is busy on the server
+        single_pool = ddb.DBConnectionPool(HOST, PORT, 1, USER, PASSWD)
+        try:
+            single_appender = ddb.PartitionedTableAppender(db_name, "pt", "id", single_pool)
+            single_pool.addTask("sleep(3000)", 1)
+            future = single_appender.append_async(pd.DataFrame({'sym': ['a'], 'id': np.array([1], dtype=np.int32),
+                                                                'qty': [1], 'price': [0.1]}))
+            assert not future.done()
+            assert future.result(timeout=60) == 1
+            assert single_pool.isFinished(1)
+        finally:
+            single_pool.shutDown()
+
+    def test_PartitionedTableAppender_create_with_pending_callback(self):
+        func_name = inspect.currentframe().f_code.co_name
+        db_name = f"dfs://{func_name}"
+        self.conn.run(f'''
+            dbPath = "{db_name}"
+            if(existsDatabase(dbPath))
+                dropDatabase(dbPath)
+            t = table(100:100,`sym`id`qty`price,[SYMBOL,INT,INT,DOUBLE])
+            db=database(dbPath,RANGE,[1,10001,20001,30001,40001,50001,60001])
+            pt = db.createPartitionedTable(t, `pt, `id)
+        ''')
+        single_pool = ddb.DBConnectionPool(HOST, PORT, 1, USER, PASSWD)
+        try:
+            appender = ddb.PartitionedTableAppender(db_name, "pt", "id", single_pool)
+            single_pool.addTask("sleep(1000)", 1)
+            future = appender.append_async(pd.DataFrame({'sym': ['a'], 'id': np.array([1], dtype=np.int32),
+                                                         'qty': [1], 'price': [0.1]}))
+            # the only worker runs the callback of append_async, with the GIL, before the schema task
+            # of the new appender, so creating the appender must not hold the GIL while it waits
+            ddb.PartitionedTableAppender(db_name, "pt", "id", single_pool)
+            assert future.result(timeout=60) == 1
+        finally:
+            single_pool.shutDown()
+
     @pytest.mark.parametrize('_compress', ["COMPRESS_OPEN", "COMPRESS_CLOSE"])
     def test_PartitionedTableAppender_range_int(self, _compress):
         func_name = inspect.currentframe().f_code.co_name
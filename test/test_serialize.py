@@ -2,9 +2,11 @@ import inspect
 from importlib.util import find_spec
 
 import dolphindb as ddb
+import dolphindb.settings as keys
 import numpy as np
+import pandas as pd
 import pytest
-from dolphindb.io import dumps, loads, dump, load
+from dolphindb.io import dumps, loads, dump, load, open_writer, iter_load
 
 from basic_testing.prepare import DataUtils, PANDAS_VERSION
 from basic_testing.utils import equalPlus
@@ -1304,6 +1306,87 @@ class TestSerialize(object):
         """)
         assert equalPlus(deserialize_server, data['expect'])
 
+    def test_serialize_open_writer_iter_load(self):
+        func_name = inspect.currentframe().f_code.co_name
+        path = WORK_DIR + f"{func_name}.bin"
+        chunks = [pd.DataFrame({"id": np.arange(i * 1000, (i + 1) * 1000, dtype=np.int64),
+                                "price": np.arange(1000, dtype=np.float64), "sym": ["a", "b"] * 500})
+                  for i in range(5)]
+        with open_writer(path, {"price": keys.DT_FLOAT, "sym": keys.DT_SYMBOL}) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        assert writer.rows == 5000
+        dfs = list(iter_load(path))
+        assert len(dfs) == 5
+        assert equalPlus(dfs[0], load(open(path, "rb")))
+        dfs = list(iter_load(path, chunk_rows=1500))
+        assert [len(df) for df in dfs] == [1500, 1500, 1500, 500]
+        assert list(pd.concat(dfs)["id"]) == list(range(5000))
+        # the file is a sequence of objects, as written by writeObject on the server
+        with open(path, "rb") as f:
+            char_vector = np.frombuffer(f.read(), dtype=np.int8)
+        self.__class__.conn.upload({f"{func_name}_char_vector": char_vector})
+        assert self.__class__.conn.run(f"""
+            f=file("{REMOTE_WORK_DIR}{func_name}.bin","w+")
+            f.writeBytes({func_name}_char_vector)
+            f.seek(0,HEAD)
+            t1=f.readObject()
+            t2=f.readObject()
+            f.close();
+            rows(t1)+rows(t2)
+        """) == 2000
+
+    def test_serialize_open_writer_columns_mismatch(self):
+        func_name = inspect.currentframe().f_code.co_name
+        with open_writer(WORK_DIR + f"{func_name}.bin") as writer:
+            writer.write(pd.DataFrame({"a": [1]}))
+            with pytest.raises(ValueError, match="do not match the columns"):
+                writer.write(pd.DataFrame({"b": [1]}))
+
+    def test_serialize_load_mmap(self):
+        func_name = inspect.currentframe().f_code.co_name
+        path = WORK_DIR + f"{func_name}.bin"
+        df = pd.DataFrame({
+            "i": np.arange(1000, dtype=np.int32),
+            "d": np.arange(1000, dtype=np.float64),
+            "n": [1.0, np.nan] * 500,
+            "nts": pd.date_range("2024-01-01", periods=1000, freq="ns"),
+            "s": ["a", "b"] * 500,
+        })
+        with open(path, "wb") as f:
+            dump(df, f, types={"nts": keys.DT_NANOTIMESTAMP})
+        with open(path, "rb") as f:
+            expect = load(f)
+        res = load(path, mmap=True)
+        assert equalPlus(res, expect)
+        for col in ["i", "d", "nts"]:
+            assert not res[col].to_numpy().flags.writeable
+        with open(path, "wb") as f:
+            dump(np.arange(1000, dtype=np.int64), f)
+        with open(path, "rb") as f:
+            res = load(f, mmap=True)
+        assert list(res) == list(range(1000))
+        assert not res.flags.writeable
+
+    def test_serialize_load_mmap_position(self):
+        func_name = inspect.currentframe().f_code.co_name
+        path = WORK_DIR + f"{func_name}.bin"
+        df = pd.DataFrame({"i": np.arange(100000, dtype=np.int32), "s": ["a", "b"] * 50000})
+        with open(path, "wb") as f:
+            f.write(b"header")
+            dump(df, f)
+            dump(df, f)
+            dump(np.arange(10, dtype=np.int64), f)
+        with open(path, "rb") as f:
+            f.read(6)
+            # each load starts at the position of the file and leaves it after the object
+            assert equalPlus(load(f, mmap=True), df)
+            assert equalPlus(load(f, mmap=True), df)
+            assert list(load(f, mmap=True)) == list(range(10))
+            assert f.read() == b""
+            with pytest.raises(RuntimeError):
+                load(f, mmap=True)
+
     if PANDAS_VERSION >= (2, 0, 0) and find_spec("pyarrow") is not None:
 
         @pytest.mark.parametrize('data,ids', zip(DataUtils.getTableArrow('upload').values(),
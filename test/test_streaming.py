@@ -1,5 +1,10 @@
+import asyncio
+import ctypes
+import gc
 import inspect
+import multiprocessing
 import random
+import weakref
 from decimal import Decimal
 from threading import Lock
 from time import sleep
@@ -9,7 +14,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from dolphindb import SubscriptionConfig, ThreadedStreamingClientConfig, ThreadPooledStreamingClientConfig, \
-    ThreadedClient, ThreadPooledClient
+    ThreadedClient, ThreadPooledClient, PollingClient
 from dolphindb.streaming import SubscribeInfo
 
 from basic_testing.utils import equalPlus
@@ -154,6 +159,215 @@ class TestThreadedClient(object):
             ThreadedClient().subscribe(host=HOST, port=PORT, handler=print, table_name=f"{func_name}_stream_table",
                                        throttle=-1, userid=USER, password=PASSWD)
 
+    def test_threaded_client_stats(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id) as {func_name}_stream_table")
+        received = []
+        client = ThreadedClient()
+        topic = client.subscribe(host=HOST, port=PORT, handler=received.extend, table_name=f"{func_name}_stream_table",
+                                 offset=0, batch_size=100, throttle=0.1, userid=USER, password=PASSWD)
+        for _ in range(100):
+            if len(received) == 1000:
+                break
+            sleep(0.1)
+        stats = client.stats()
+        assert list(stats.keys()) == [str(topic)]
+        stat = stats[str(topic)]
+        assert stat.messages == 1000
+        assert stat.last_offset >= 0
+        assert stat.bytes > 0
+        assert stat.queue_depth == 0
+        assert stat.reconnects == 0
+        assert stat.handler_calls > 0
+        assert 0 <= stat.handler_p50 <= stat.handler_p99 <= stat.handler_max
+        assert stat.lag is not None
+        client.unsubscribe(subscribe_info=topic)
+        assert client.stats() == {}
+
+    def test_threaded_client_checkpoint(self, tmp_path):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id) as {func_name}_stream_table")
+        store = ddb.FileCheckpointStore(str(tmp_path / "checkpoint.json"), interval=0)
+        received = []
+        client = ThreadedClient()
+        topic = client.subscribe(host=HOST, port=PORT, handler=received.extend, table_name=f"{func_name}_stream_table",
+                                 offset=0, batch_size=100, throttle=0.1, userid=USER, password=PASSWD, checkpoint=store)
+        for _ in range(100):
+            if len(received) == 1000:
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert store.load(str(topic)) == 999
+        conn.run(f"insert into {func_name}_stream_table values(1001..1500)")
+        received = []
+        topic = client.subscribe(host=HOST, port=PORT, handler=received.extend, table_name=f"{func_name}_stream_table",
+                                 offset=0, batch_size=100, throttle=0.1, userid=USER, password=PASSWD,
+                                 checkpoint=ddb.FileCheckpointStore(str(tmp_path / "checkpoint.json")))
+        for _ in range(100):
+            if len(received) == 500:
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert [row[0] for row in received] == list(range(1001, 1501))
+
+    def test_file_checkpoint_store_released(self, tmp_path):
+        path = str(tmp_path / "checkpoint.json")
+        store = ddb.FileCheckpointStore(path, interval=60)
+        store.save("topic", 1)
+        store.save("topic", 2)
+        ref = weakref.ref(store)
+        del store
+        gc.collect()
+        assert ref() is None
+        # the pending offset is written when the store is collected
+        assert ddb.FileCheckpointStore(path).load("topic") == 2
+
+    def test_threaded_client_subscribe_async(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id) as {func_name}_stream_table")
+        client = ThreadedClient()
+
+        async def main():
+            received = []
+            async with await client.subscribe_async(HOST, PORT, f"{func_name}_stream_table", offset=0, batch_size=100,
+                                                    throttle=0.1, userid=USER, password=PASSWD) as messages:
+                assert str(messages.info) in client.topic_strs
+                async for rows in messages:
+                    received.extend(rows)
+                    if len(received) == 1000:
+                        break
+            assert messages.finished
+            return received
+
+        received = asyncio.run(main())
+        assert [row[0] for row in received] == list(range(1, 1001))
+        assert client.topic_strs == []
+
+    def test_threaded_client_subscribe_async_checkpoint(self, tmp_path):
+        store = ddb.FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+        client = ThreadedClient()
+        with pytest.raises(ValueError, match="subscribe_async does not support checkpoint"):
+            asyncio.run(client.subscribe_async(HOST, PORT, "t", batch_size=10, checkpoint=store))
+        assert client.topic_strs == []
+
+    def test_threaded_client_native_handler(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id, take(`a`b, 1000) as sym) as {func_name}_stream_table")
+        total = np.zeros(2, dtype=np.int64)
+
+        @ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int), ctypes.c_int,
+                          ctypes.c_longlong, ctypes.c_void_p)
+        def handler(columns, types, column_count, rows, user_data):
+            assert column_count == 2
+            assert types[0] == ddb.settings.DT_INT
+            assert columns[1] is None
+            ids = np.ctypeslib.as_array(ctypes.cast(columns[0], ctypes.POINTER(ctypes.c_int32)), shape=(rows,))
+            out = np.ctypeslib.as_array(ctypes.cast(user_data, ctypes.POINTER(ctypes.c_int64)), shape=(2,))
+            out[0] += ids.sum()
+            out[1] += rows
+
+        client = ThreadedClient()
+        topic = client.subscribe(host=HOST, port=PORT, handler=ddb.NativeHandler(handler, total),
+                                 table_name=f"{func_name}_stream_table", offset=0, batch_size=100, throttle=0.1,
+                                 userid=USER, password=PASSWD)
+        for _ in range(100):
+            if total[1] == 1000:
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert total.tolist() == [500500, 1000]
+
+    def test_threaded_client_native_handler_temporary(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(100:0, [`id], [INT]) as {func_name}_stream_table")
+
+        def make_handler():
+            def handler(columns, types, column_count, rows, user_data):
+                ctypes.cast(user_data, ctypes.POINTER(ctypes.c_int64))[0] += rows
+            func_type = ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+                                         ctypes.c_int, ctypes.c_longlong, ctypes.c_void_p)
+            # the caller keeps no reference to the function pointer or the user data
+            return ddb.NativeHandler(func_type(handler), np.zeros(1, dtype=np.int64))
+
+        client = ThreadedClient()
+        topic = client.subscribe(host=HOST, port=PORT, handler=make_handler(), table_name=f"{func_name}_stream_table",
+                                 offset=0, batch_size=100, throttle=0.1, userid=USER, password=PASSWD)
+        gc.collect()
+        conn.run(f"tableInsert({func_name}_stream_table, 1..1000)")
+        user_data = client._native_handlers[str(topic)]._user_data
+        for _ in range(100):
+            if user_data[0] == 1000:
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert user_data[0] == 1000
+        assert client._native_handlers == {}
+
+    @pytest.mark.parametrize("batch_size", [0, 100])
+    def test_threaded_client_columns_where(self, batch_size):
+        func_name = inspect.currentframe().f_code.co_name + f"_{batch_size}"
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id, take(`a`b`c, 1000) as sym, double(1..1000) as price) "
+                 f"as {func_name}_stream_table")
+        received = []
+        client = ThreadedClient()
+        topic = client.subscribe(host=HOST, port=PORT, handler=received.append if batch_size == 0 else received.extend,
+                                 table_name=f"{func_name}_stream_table", offset=0, batch_size=batch_size,
+                                 throttle=0.1, userid=USER, password=PASSWD, columns=["price", "id"],
+                                 where="sym in ('a', 'b') and price > 500")
+        expected = [[float(i), i] for i in range(501, 1001) if i % 3 != 0]
+        for _ in range(100):
+            if len(received) == len(expected):
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert [list(row) for row in received] == expected
+
+    def test_threaded_client_columns_where_error(self):
+        with pytest.raises(ValueError, match="where should compare columns with constants"):
+            ThreadedClient().subscribe(host=HOST, port=PORT, handler=print, table_name="t", where="a > b")
+        with pytest.raises(RuntimeError, match=r"Column \[not_exist\] doesn't exist"):
+            conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+            conn.run("share streamTable(1..10 as id) as test_threaded_client_columns_where_error_stream_table")
+            ThreadedClient().subscribe(host=HOST, port=PORT, handler=print,
+                                       table_name="test_threaded_client_columns_where_error_stream_table",
+                                       userid=USER, password=PASSWD, columns=["not_exist"])
+        # resubscribing can't fix a name that doesn't exist, so it isn't retried
+        with pytest.raises(RuntimeError, match=r"Column \[not_exist\] doesn't exist"):
+            ThreadedClient().subscribe(host=HOST, port=PORT, handler=print,
+                                       table_name="test_threaded_client_columns_where_error_stream_table",
+                                       userid=USER, password=PASSWD, columns=["not_exist"], resub=True)
+
+    def test_threaded_client_columns_failed_subscribe(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..10 as id, double(1..10) as price) as {func_name}_stream_table")
+        client = ThreadedClient()
+        with pytest.raises(ValueError, match="msg_as_table must be False"):
+            client.subscribe(host=HOST, port=PORT, handler=print, table_name=f"{func_name}_stream_table",
+                             userid=USER, password=PASSWD, columns=["id"], msg_as_table=True)
+        # the filter of the failed subscription doesn't apply to the next one
+        received = []
+        topic = client.subscribe(host=HOST, port=PORT, handler=received.append, table_name=f"{func_name}_stream_table",
+                                 offset=0, userid=USER, password=PASSWD)
+        for _ in range(100):
+            if len(received) == 10:
+                break
+            sleep(0.1)
+        client.unsubscribe(subscribe_info=topic)
+        assert received == [[i, float(i)] for i in range(1, 11)]
+
+    def test_thread_pooled_client_checkpoint_error(self, tmp_path):
+        store = ddb.FileCheckpointStore(str(tmp_path / "checkpoint.json"))
+        with pytest.raises(ValueError, match="checkpoint requires thread_count to be 1"):
+            ThreadPooledClient(thread_count=2).subscribe(host=HOST, port=PORT, handler=print, table_name="t",
+                                                         batch_size=10, checkpoint=store)
+
     @pytest.mark.parametrize("port", [0, -1])
     def test_threaded_client_offset_zero(self, port):
         if port == -1:
@@ -2194,6 +2408,103 @@ class TestThreadPooledClient(object):
         client.unsubscribe(subscribe_info=topic)
         assert equalPlus(df.sort_values("time", ascending=True).sort_values("sym", ascending=True).reset_index(drop=True), conn.run(f"select * from {func_name}.orca_table.output").sort_values("time", ascending=True).sort_values("sym", ascending=True).reset_index(drop=True))
 
+class TestPollingClient(object):
+
+    def test_polling_client_iterate(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id, take(`a`b`c, 1000) as sym) as {func_name}_stream_table")
+        client = PollingClient()
+        it = client.subscribe(host=HOST, port=PORT, table_name=f"{func_name}_stream_table", offset=0, batch_size=100,
+                              userid=USER, password=PASSWD)
+        assert str(it.info) == f"{HOST}/{PORT}/{func_name}_stream_table/"
+        rows = []
+        for batch in it:
+            assert len(batch) <= 100
+            rows.extend(batch)
+            if len(rows) == 1000:
+                break
+        assert [row[0] for row in rows] == list(range(1, 1001))
+        assert it.poll(timeout=0.1) is None
+        client.unsubscribe(subscribe_info=it.info)
+        assert list(it) == []
+        assert it.finished
+
+    def test_polling_client_msg_as_table(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id, take(`a`b`c, 1000) as sym) as {func_name}_stream_table")
+        client = PollingClient()
+        it = client.subscribe(host=HOST, port=PORT, table_name=f"{func_name}_stream_table", offset=0,
+                              msg_as_table=True, userid=USER, password=PASSWD)
+        frames = []
+        while sum(len(df) for df in frames) < 1000:
+            df = it.poll(timeout=10)
+            assert df is not None
+            frames.append(df)
+        assert equalPlus(pd.concat(frames, ignore_index=True), conn.run(f"select * from {func_name}_stream_table"))
+        client.unsubscribe(subscribe_info=it.info)
+
+    def test_polling_client_unsubscribe_full_queue(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..200000 as id) as {func_name}_stream_table")
+        client = PollingClient()
+        it = client.subscribe(host=HOST, port=PORT, table_name=f"{func_name}_stream_table", offset=0, userid=USER,
+                              password=PASSWD)
+        sleep(3)
+        client.unsubscribe(subscribe_info=it.info)
+        assert client.topics == []
+        for _ in it:
+            pass
+        assert it.finished
+
+
+class TestFanout(object):
+
+    @staticmethod
+    def _reader(name, queue):
+        with ddb.FanoutReader(name) as reader:
+            queue.put("ready")
+            ids = [int(i) for batch in reader for i in batch["id"]]
+            queue.put((ids, reader.dropped))
+
+    def test_fanout_threaded_client(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn = ddb.Session(host=HOST, port=PORT, userid=USER, password=PASSWD)
+        conn.run(f"share streamTable(1..1000 as id, double(1..1000) as price) as {func_name}_stream_table")
+        queue = multiprocessing.Queue()
+        with ddb.FanoutPublisher(func_name, size=1 << 20) as publisher:
+            readers = [multiprocessing.Process(target=self._reader, args=(func_name, queue)) for _ in range(2)]
+            for reader in readers:
+                reader.start()
+            for _ in readers:
+                assert queue.get(timeout=30) == "ready"
+            client = ThreadedClient()
+            topic = client.subscribe(host=HOST, port=PORT, handler=publisher.publish,
+                                     table_name=f"{func_name}_stream_table", offset=0, batch_size=100, throttle=0.1,
+                                     userid=USER, password=PASSWD, msg_format="columns")
+            sleep(3)
+            client.unsubscribe(subscribe_info=topic)
+        for reader in readers:
+            ids, dropped = queue.get(timeout=30)
+            reader.join()
+            assert ids == list(range(1, 1001))
+            assert dropped == 0
+
+    def test_fanout_reader_lapped(self):
+        func_name = inspect.currentframe().f_code.co_name
+        with ddb.FanoutPublisher(func_name, size=4096) as publisher, ddb.FanoutReader(func_name) as reader:
+            for i in range(1000):
+                publisher.publish(i)
+            publisher.close()
+            ids = list(reader)
+        # the reader skips only the batches that have been overwritten
+        assert ids == list(range(1000 - len(ids), 1000))
+        assert len(ids) > 100
+        assert reader.dropped == 1000 - len(ids)
+
+
 class TestHaStreaming(object):
 
     @pytest.mark.CLUSTER
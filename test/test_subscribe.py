@@ -3,6 +3,7 @@ import random
 import re
 import subprocess
 import sys
+import threading
 from itertools import chain
 from time import sleep
 
@@ -136,13 +137,16 @@ class TestSubscribe:
         conn.enableStreaming(0, 2)
         with pytest.raises(RuntimeError, match='streaming is already enabled'):
             conn.enableStreaming()
-        with pytest.raises(RuntimeError, match="Thread pool streaming doesn't support batch subscribe"):
-            conn.subscribe(HOST, PORT, self.handler, "trades1", None, 0, False, batchSize=2, userName=USER,
+        with pytest.raises(ValueError, match="key_column requires batch_size to be greater than 0"):
+            conn.subscribe(HOST, PORT, self.handler, "trades1", None, 0, False, keyColumn="sym", userName=USER,
                            password=PASSWD)
         conn = ddb.Session(HOST, PORT, USER, PASSWD)
         conn.enableStreaming()
         with pytest.raises(RuntimeError, match='streaming is already enabled'):
             conn.enableStreaming()
+        with pytest.raises(ValueError, match="keyColumn requires streaming enabled with threadCount greater than 1"):
+            conn.subscribe(HOST, PORT, self.handler, "trades1", None, 0, False, batchSize=2, keyColumn="sym",
+                           userName=USER, password=PASSWD)
 
     def test_subscribe_error_host_int(self):
         conn1 = ddb.session()
@@ -321,6 +325,47 @@ class TestSubscribe:
                             "action", 0, False, np.array(["000905"]), False, -1, -1, userName=USER, password=PASSWD)
         conn1.close()
 
+    def test_subscribe_thread_pooled_batch_key_column(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn1 = ddb.session()
+        conn1.connect(HOST, PORT, USER, PASSWD)
+        listenPort = getListenPort()
+        conn1.enableStreaming(listenPort, 4)
+        script = f"""
+            subscribers = select * from getStreamingStat().pubTables where tableName=`{func_name};
+            for(subscriber in subscribers){{
+                ip_port = subscriber.subscriber.split(":");
+                stopPublishTable(ip_port[0],int(ip_port[1]),subscriber.tableName,subscriber.actions);
+            }}
+            try{{dropStreamTable(`{func_name})}}catch(ex){{}}
+            share streamTable(10000:0,`time`sym`price, [TIMESTAMP,SYMBOL,DOUBLE]) as {func_name}
+            insert into {func_name} values(take(now(), 1000), take(`A`B`C`D`E, 1000), rand(1000,1000)/10.0)
+        """
+        conn1.run(script)
+        frames = []
+        syms = {}
+        counter = CountBatchDownLatch(1000)
+
+        def handler(msgs):
+            # with msgAsTable, the batch handler receives the merged DataFrame
+            df = msgs
+            frames.append(df)
+            for sym in df["sym"].unique():
+                syms.setdefault(sym, set()).add(threading.get_ident())
+            counter.countDown(len(df))
+
+        conn1.subscribe(HOST, PORT, handler, func_name, "action", 0, False, msgAsTable=True, batchSize=100,
+                        throttle=0.1, keyColumn="sym", userName=USER, password=PASSWD)
+        assert counter.wait_s(20)
+        result = pd.concat(frames).sort_values("time", kind="stable")
+        expected = conn1.run(f"select * from {func_name}")
+        assert len(result) == len(expected)
+        assert set(result["sym"]) == set(expected["sym"])
+        for threads in syms.values():
+            assert len(threads) == 1
+        conn1.unsubscribe(HOST, PORT, func_name, "action")
+        conn1.close()
+
     def test_subscribe_offset_zero(self):
         func_name = inspect.currentframe().f_code.co_name
         conn1 = ddb.session()
@@ -664,6 +709,41 @@ class TestSubscribe:
         assert_frame_equal(self.df, conn1.run(f"select * from {func_name}"))
         conn1.unsubscribe(HOST, PORT, func_name, "action")
 
+    def test_subscribe_msg_format_columns(self):
+        func_name = inspect.currentframe().f_code.co_name
+        conn1 = ddb.session()
+        conn1.connect(HOST, PORT, USER, PASSWD)
+        listenPort = getListenPort()
+        conn1.enableStreaming(listenPort)
+        script = f"""
+            subscribers = select * from getStreamingStat().pubTables where tableName=`{func_name};
+            for(subscriber in subscribers){{
+                ip_port = subscriber.subscriber.split(":");
+                stopPublishTable(ip_port[0],int(ip_port[1]),subscriber.tableName,subscriber.actions);
+            }}
+            try{{dropStreamTable(`{func_name})}}catch(ex){{}}
+            share streamTable(10000:0,`symbolv`doublev, [SYMBOL, DOUBLE]) as {func_name}
+            insert into {func_name} values(take(`A`B`C`D`E`F`G, 1000), rand(100.0, 1000))
+        """
+        conn1.run(script)
+        batches = []
+        counter = CountBatchDownLatch(1000)
+
+        def handler(columns):
+            batches.append(columns)
+            counter.countDown(len(columns["doublev"]))
+
+        conn1.subscribe(HOST, PORT, handler, func_name, "action", 0, False, batchSize=100, throttle=0.1,
+                        userName=USER, password=PASSWD, msgFormat="columns")
+        assert counter.wait_s(20)
+        conn1.unsubscribe(HOST, PORT, func_name, "action")
+        assert all(isinstance(col, np.ndarray) for batch in batches for col in batch.values())
+        df = pd.DataFrame({name: np.concatenate([batch[name] for batch in batches]) for name in ("symbolv", "doublev")})
+        assert_frame_equal(df, conn1.run(f"select * from {func_name}"))
+        with pytest.raises(ValidationError, match="msg_format must be 'rows' when batch_size is 0"):
+            conn1.subscribe(HOST, PORT, handler, func_name, "action", 0, False, msgFormat="columns")
+        conn1.close()
+
     def test_subscribe_batchSize_lt_zero(self):
         func_name = inspect.currentframe().f_code.co_name
         conn1 = ddb.session()
@@ -216,3 +216,42 @@ class TestSubscribeStreamDeserializer(object):
         for index, i in enumerate(df1["dataType"]):
             assert equalPlus(df1["dataType"][index][0], df_expect["dataType"][index])
             assert equalPlus(df2["dataType"][index][0], df_expect["dataType"][index])
+
+    def test_streamDeserializer_msg_format_pandas(self):
+        func_name = inspect.currentframe().f_code.co_name
+        script = f"""
+            subscribers = select * from getStreamingStat().pubTables where tableName=`{func_name};
+            for(subscriber in subscribers){{
+                ip_port = subscriber.subscriber.split(":");
+                stopPublishTable(ip_port[0],int(ip_port[1]),subscriber.tableName,subscriber.actions);
+            }}
+            try{{dropStreamTable(`{func_name})}}catch(ex){{}}
+            share streamTable(1000:0,`time`sym`blob`price,[TIMESTAMP,SYMBOL,BLOB,DOUBLE]) as `{func_name};
+            timestampv=2024.01.10T12:00:00.000+1..100;
+            share table(timestampv as `timestampv,double(1..100) as price) as `{func_name}_1;
+            share table(timestampv as `timestampv,double(101..200) as price) as `{func_name}_2;
+            d=dict(`msg1`msg2,[{func_name}_1,{func_name}_2]);
+            replay(inputTables=d, outputTables=`{func_name}, dateColumn=`timestampv, timeColumn=`timestampv);
+        """
+        self.conn.run(script)
+        sd = ddb.streamDeserializer({
+            "msg1": ("", f"{func_name}_1"),
+            "msg2": ("", f"{func_name}_2"),
+        })
+        received = {"msg1": [], "msg2": []}
+
+        def handler(groups):
+            for symbol, df in groups.items():
+                assert isinstance(df, pd.DataFrame)
+                received[symbol].append(df)
+
+        self.conn.subscribe(host=HOST, port=PORT, handler=handler, tableName=func_name, actionName="action",
+                            offset=0, batchSize=1000, throttle=0.1, streamDeserializer=sd, msgFormat="pandas",
+                            userName=USER, password=PASSWD)
+        sleep(1)
+        self.conn.unsubscribe(HOST, PORT, func_name, "action")
+        df1 = pd.concat(received["msg1"], ignore_index=True)
+        df2 = pd.concat(received["msg2"], ignore_index=True)
+        assert list(df1.columns) == ['timestampv', 'price']
+        assert equalPlus(df1, self.conn.run(f'{func_name}_1'))
+        assert equalPlus(df2, self.conn.run(f'{func_name}_2'))